@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the per-image OCR overhead with and without batched tesseract calls.
+
+Renders small synthetic text crops and recognizes them once with one engine
+call per image and once with OCREngine.image_to_data_batch, then prints the
+time per image of both.
+
+Usage:
+    python benchmarks/ocr_batch_overhead.py --images 64 --engine pytesseract
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from PIL import Image, ImageDraw, ImageFont
+
+# Allow running the script from the project root or the benchmarks directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ocr_engine import create_engine
+
+SAMPLE_LINES = [
+    "If 3x + 7 = 22, what is the value of x?",
+    "The author's tone in the passage is best described as",
+    "Which choice provides the best evidence for the answer?",
+    "A circle has a radius of 5. What is its area?",
+    "The function f is defined by f(x) = 2x squared minus 3.",
+    "Which of the following is closest in meaning to 'candid'?",
+]
+
+
+def render_crops(count: int) -> list[Image.Image]:
+    """Render small grayscale text crops like cropped questions or screenshots."""
+    font = ImageFont.load_default()
+    crops = []
+    for index in range(count):
+        image = Image.new('L', (640, 64), 255)
+        draw = ImageDraw.Draw(image)
+        draw.text((10, 24), SAMPLE_LINES[index % len(SAMPLE_LINES)], fill=0, font=font)
+        crops.append(image.resize((1280, 128)))
+    return crops
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--images', type=int, default=64, help='Number of crops to recognize')
+    parser.add_argument('--engine', default='pytesseract', help='OCR engine name (pytesseract or tesserocr)')
+    parser.add_argument('--config', default='--psm 7', help='Tesseract configuration string')
+    args = parser.parse_args()
+
+    engine = create_engine(args.engine)
+    crops = render_crops(args.images)
+
+    # Warm up so file system caches and lazily created handles do not skew the first run
+    engine.image_to_data(crops[0], config=args.config)
+
+    start = time.perf_counter()
+    single_words = sum(len(engine.image_to_data(crop, config=args.config)['text']) for crop in crops)
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_words = sum(len(data['text']) for data in engine.image_to_data_batch(crops, config=args.config))
+    batch_time = time.perf_counter() - start
+
+    print(f"Engine: {engine.name}, {args.images} images, config '{args.config}'")
+    print(f"One call per image: {single_time / args.images * 1000:8.1f} ms per image ({single_words} rows)")
+    print(f"Batched call:       {batch_time / args.images * 1000:8.1f} ms per image ({batch_words} rows)")
+    print(f"Speedup:            {single_time / batch_time:8.2f}x")
+    engine.close()
+
+
+if __name__ == '__main__':
+    main()
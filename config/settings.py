@@ -52,7 +52,66 @@ class Settings:
             ],
             "ocr": {
                 "provider": "tesseract",
-                "confidence_threshold": 60
+                "engine": "pytesseract",
+                "confidence_threshold": 60,
+                "search_mode": "adaptive",
+                "early_exit_score": 80,
+                "workers": 1,
+                "cpu_cores": 0,
+                "threads": 1,
+                "target_text_height": 28,
+                "layout_analysis": False,
+                "auto_rotate": True,
+                "variants": ["grayscale", "blurred", "adaptive_threshold", "morph_close"],
+                "pdf_dpi": 300,
+                "cache": {
+                    "enabled": True,
+                    "max_mb": 256
+                },
+                "telemetry": {
+                    "enabled": True,
+                    "min_samples": 20,
+                    "max_rows": 50000
+                },
+                "models": {
+                    "fast_tessdata_dir": None,
+                    "best_tessdata_dir": None,
+                    "escalation_score": 70
+                },
+                "batch": {
+                    "enabled": True,
+                    "max_pixels": 1000000,
+                    "size": 16
+                },
+                "yield_predictor": {
+                    "enabled": False,
+                    "skip_below": 0.05,
+                    "aggressive_below": 0.3,
+                    "min_samples": 50,
+                    "usable_score": 50
+                }
+            },
+            "ai": {
+                "max_concurrency": 8,
+                "stream": True,
+                "cache": {
+                    "enabled": True,
+                    "ttl_days": 30,
+                    "max_mb": 64
+                },
+                "batch": {
+                    "enabled": True,
+                    "max_prompt_tokens": 3000,
+                    "max_items": 8,
+                    "max_item_tokens": 500,
+                    "max_response_tokens": 8000
+                }
+            },
+            "http": {
+                "pool_connections": 4,
+                "pool_maxsize": 10,
+                "pool_block": True,
+                "max_retries": 2
             },
             "vector_db": {
                 "enabled": False,
@@ -70,6 +129,16 @@ class Settings:
         """Get OCR settings."""
         return self._config.get('ocr', {})
 
+    @property
+    def ai_settings(self) -> dict[str, Any]:
+        """Get AI request settings."""
+        return self._config.get('ai', {})
+
+    @property
+    def http_settings(self) -> dict[str, Any]:
+        """Get HTTP connection pool settings."""
+        return self._config.get('http', {})
+
     @property
     def vector_db_settings(self) -> dict[str, Any]:
         """Get vector database settings."""
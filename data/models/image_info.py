@@ -23,3 +23,4 @@ class ImageOrientationInfo:
     needs_rotation: bool
     recommended_rotation: float
     method: Optional[str] = None
+    skew: float = 0.0
@@ -5,6 +5,7 @@ Data models for the SAT/ACT Notes Organizer.
 from dataclasses import dataclass, field
 from typing import Optional
 from datetime import datetime
+from data.models.image_info import ImageQualityInfo, ImageOrientationInfo
 
 
 @dataclass
@@ -14,6 +15,12 @@ class ImageInfo:
     original_name: str
     path: str
     upload_time: datetime = field(default_factory=datetime.now)
+    page_number: Optional[int] = None  # 1-based page of source_document, for pages of multi-page documents
+    source_document: Optional[str] = None
+    # Upload-time analysis of the image content, reused by the processing pipeline
+    content_hash: Optional[str] = None
+    quality_info: Optional[ImageQualityInfo] = None
+    orientation_info: Optional[ImageOrientationInfo] = None
 
 
 @dataclass
@@ -24,6 +31,10 @@ class OCRResult:
     quality_grade: str
     confidence: float
     processing_time: float
+    rotation_applied: float = 0.0  # Clockwise degrees the page was rotated before OCR
+    word_data_path: Optional[str] = None  # Word-level sidecar (.words.npz) saved next to the image
+    model_tier: Optional[str] = None  # Traineddata tier of the text: 'fast', 'best', 'mixed' or 'default'
+    escalated: bool = False  # Whether the image or any region was re-read with the accurate models
 
 
 @dataclass
@@ -3,7 +3,7 @@ AI service for the SAT/ACT Notes Organizer.
 """
 
 import logging
-from typing import Any
+from typing import Any, Callable, Optional
 
 from src.ai_processor import AIProcessor
 from data.models.note import ClassificationResult
@@ -28,19 +28,53 @@ class AIService:
         """
         return self.processor.test_connection()
 
-    def process_text(self, text: str, image_name: str) -> ClassificationResult:
+    def process_text(self, text: str, image_name: str, use_cache: bool = True) -> ClassificationResult:
         """
         Process text with AI to generate classification and notes.
 
         Args:
             text: Text to process
             image_name: Name of the source image
+            use_cache: Whether to reuse a cached response for the same text; a
+                fresh response replaces it either way
 
         Returns:
             ClassificationResult object
         """
-        result = self.processor.process_text(text, image_name)
+        result = self.processor.process_text(text, image_name, use_cache)
+        return self._to_classification_result(result, image_name)
 
+    def process_texts(self, items: list[tuple[str, str]],
+                      progress_callback: Optional[Callable[[int, ClassificationResult], None]] = None,
+                      use_cache: bool = True,
+                      stream_callback: Optional[Callable[[int, dict[str, Any]], None]] = None) -> list[ClassificationResult]:
+        """
+        Process many texts with AI concurrently.
+
+        Args:
+            items: (text, image_name) pairs to process
+            progress_callback: Optional callable receiving (index, result) as
+                each item finishes
+            use_cache: Whether to reuse cached responses for the same texts;
+                fresh responses replace them either way
+            stream_callback: Optional callable receiving (index, progress) with
+                the fields of a streamed response as they arrive (see
+                AIProcessor.process_text_stream)
+
+        Returns:
+            List of ClassificationResult objects, in input order
+        """
+        def on_result(index: int, result: dict[str, Any]) -> None:
+            if progress_callback:
+                progress_callback(index, self._to_classification_result(result, items[index][1]))
+
+        results = self.processor.process_texts(items, progress_callback=on_result, use_cache=use_cache,
+                                               stream_callback=stream_callback)
+        return [self._to_classification_result(result, image_name)
+                for result, (_, image_name) in zip(results, items)]
+
+    def _to_classification_result(self, result: dict[str, Any], image_name: str) -> ClassificationResult:
+        """Convert an AIProcessor result dictionary to a ClassificationResult."""
         return ClassificationResult(
             subject=str(result.get('subject', 'general')),
             content_type=str(result.get('content_type', 'notes')),
@@ -51,6 +85,22 @@ class AIService:
             source_image=str(result.get('source_image', image_name))
         )
 
+    def cache_stats(self) -> dict[str, Any]:
+        """
+        Get hit/miss statistics of the AI response cache.
+
+        Returns:
+            Cache statistics, or an empty dictionary when caching is disabled
+        """
+        cache = getattr(self.processor, 'cache', None)
+        if cache is None:
+            return {}
+        try:
+            return cache.stats()
+        except Exception as e:
+            self.logger.error(f"Error reading AI cache statistics: {e}")
+            return {}
+
     def classify_content(self, text: str) -> dict[str, Any]:
         """
         Legacy method for backward compatibility.
@@ -2,9 +2,14 @@
 Main service for coordinating note processing in the SAT/ACT Notes Organizer.
 """
 
+import os
+import queue
+import threading
 import time
 import logging
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import asdict
+from typing import Any, Callable, Iterable, Iterator, Optional
 from data.models.note import ProcessingResult, OCRResult, ImageInfo
 
 # Import exceptions properly
@@ -17,32 +22,268 @@ class OCRProcessingError(ProcessingError):
     """OCR processing specific error."""
     pass
 
+# OCR processor owned by a process-pool worker, created once by _init_ocr_worker
+_worker_ocr_processor: Any = None
+
+
+def _init_ocr_worker(ocr_settings: dict[str, Any], cpu_allocation: dict[str, Any]) -> None:
+    """Apply the worker's CPU budget and create the OCR processor used by a process-pool worker."""
+    global _worker_ocr_processor
+    from src.cpu_budget import CPUBudget
+    from src.ocr_processor import OCRProcessor
+    CPUBudget.apply_allocation(cpu_allocation)
+    _worker_ocr_processor = OCRProcessor.from_config({**ocr_settings, 'threads': cpu_allocation['ocr_threads']})
+
+
+def _run_ocr_stage_in_worker(image_info: ImageInfo) -> dict[str, Any]:
+    """Run the OCR stage for one image inside a process-pool worker."""
+    return _run_ocr_stage(_worker_ocr_processor, image_info)
+
+
+def _run_ocr_stage_batch_in_worker(image_infos: list[ImageInfo]) -> list[Any]:
+    """Run the batched OCR stage for a group of small images inside a process-pool worker."""
+    return _run_ocr_stage_batch(_worker_ocr_processor, image_infos)
+
+
+def _analysis_hints(image_info: ImageInfo) -> tuple[Optional[dict[str, Any]], Optional[dict[str, Any]]]:
+    """
+    Get the upload-time analysis of an image as OCR processor hints.
+
+    Detection failures (no metrics or no method) are not reused, so they are redone.
+
+    Args:
+        image_info: ImageInfo object with the attached analysis
+
+    Returns:
+        Tuple of (quality, orientation) dictionaries, None where not available
+    """
+    quality_hint = None
+    if image_info.quality_info is not None and image_info.quality_info.metrics:
+        quality_hint = asdict(image_info.quality_info)
+    orientation_hint = None
+    if image_info.orientation_info is not None and image_info.orientation_info.method is not None:
+        orientation_hint = asdict(image_info.orientation_info)
+    return quality_hint, orientation_hint
+
+
+def _run_ocr_stage_batch(ocr_processor: Any, image_infos: list[ImageInfo]) -> list[Any]:
+    """
+    Run the OCR stage for a group of small images with batched engine calls.
+
+    Args:
+        ocr_processor: OCRProcessor instance to use
+        image_infos: ImageInfo objects of small images
+
+    Returns:
+        OCR stage dictionaries as returned by _run_ocr_stage in input order, or
+        the exception raised for an image that failed
+    """
+    start_time = time.time()
+    qualities, orientations = zip(*(_analysis_hints(image_info) for image_info in image_infos))
+    try:
+        batch_details = ocr_processor.extract_text_batch([image_info.path for image_info in image_infos],
+                                                         orientations=list(orientations), qualities=list(qualities))
+    except Exception as e:
+        error = OCRProcessingError(f"OCR extraction failed: {str(e)}")
+        return [error for _ in image_infos]
+
+    # Share the batched OCR time between the images
+    batch_time = (time.time() - start_time) / len(image_infos)
+    stages: list[Any] = []
+    for image_info, ocr_details in zip(image_infos, batch_details):
+        try:
+            stage = _run_ocr_stage(ocr_processor, image_info, ocr_details)
+            stage['processing_time'] += batch_time
+            stages.append(stage)
+        except Exception as e:
+            stages.append(e)
+    return stages
+
+
+def _is_small_image(image_path: str, max_pixels: int) -> bool:
+    """Check from the image header whether an image has at most max_pixels pixels."""
+    try:
+        from PIL import Image
+        with Image.open(image_path) as image:
+            return image.width * image.height <= max_pixels
+    except Exception:
+        return False
+
+
+def _run_ocr_stage(ocr_processor: Any, image_info: ImageInfo,
+                   ocr_details: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+    """
+    Run OCR and quality assessment for a single image.
+
+    Quality and orientation already analysed at upload time (attached to the
+    ImageInfo) are reused instead of being computed again.
+
+    Args:
+        ocr_processor: OCRProcessor instance to use
+        image_info: ImageInfo object to process
+        ocr_details: OCR result of the image from a batched call; OCR runs
+            here when it is not given
+
+    Returns:
+        Dictionary with the extracted text, quality info, rotation applied
+        before OCR, average word confidence, word data sidecar path, model
+        tier and escalation, and OCR stage time
+    """
+    start_time = time.time()
+
+    quality_hint, orientation_hint = _analysis_hints(image_info)
+
+    # Decode the image once and share it between OCR and quality assessment
+    try:
+        from src.image_context import ImageAnalysisContext
+        image = ImageAnalysisContext(image_info.path)
+    except Exception as e:
+        raise OCRProcessingError(f"Could not open image: {str(e)}")
+
+    try:
+        if ocr_details is None:
+            if not hasattr(ocr_processor, 'extract_text_details'):
+                raise OCRProcessingError("OCR extract_text_details method not found")
+            ocr_details = ocr_processor.extract_text_details(image, orientation=orientation_hint, quality=quality_hint)
+        ocr_text = str(ocr_details.get('text', ''))
+    except Exception as e:
+        raise OCRProcessingError(f"OCR extraction failed: {str(e)}")
+
+    if ocr_details.get('yield_action') == 'skip':
+        raise OCRProcessingError(
+            f"Image {image_info.original_name} is unlikely to contain readable text "
+            f"({ocr_details.get('yield_probability', 0):.0%} predicted OCR success); please retake it"
+        )
+
+    if not ocr_text or not ocr_text.strip():
+        raise OCRProcessingError(f"No text found in image {image_info.original_name}")
+
+    # Keep the words, boxes and confidences next to the image for later steps
+    word_data_path = _save_word_data(ocr_details.get('words'), image_info.path)
+
+    # Get OCR quality metrics
+    try:
+        if quality_hint is not None:
+            quality_info = quality_hint
+        elif hasattr(ocr_processor, 'assess_image_quality'):
+            quality_info = ocr_processor.assess_image_quality(image)
+            if not isinstance(quality_info, dict):
+                quality_info = {'overall_score': 0, 'grade': 'N/A'}
+        else:
+            quality_info = {'overall_score': 0, 'grade': 'N/A'}
+    except Exception:
+        quality_info = {'overall_score': 0, 'grade': 'N/A'}
+
+    return {
+        'text': ocr_text,
+        'quality_info': quality_info,
+        'rotation_applied': float(ocr_details.get('rotation_applied', 0.0)),
+        'confidence': float(ocr_details.get('confidence', 0.0)),
+        'word_data_path': word_data_path,
+        'model_tier': ocr_details.get('model_tier'),
+        'escalated': bool(ocr_details.get('escalated', False)),
+        'processing_time': time.time() - start_time
+    }
+
+
+def _save_word_data(words: Any, image_path: str) -> Optional[str]:
+    """
+    Save word-level OCR data as a sidecar file next to the image.
+
+    A sidecar left by an earlier run is removed when there are no words, so
+    it is never read back as the word data of this result.
+
+    Args:
+        words: WordBoxes of the image (also restored for cached results), or
+            None when OCR did not produce any
+        image_path: Path to the image file
+
+    Returns:
+        Path of the sidecar file, or None if there is none
+    """
+    from src.word_data import sidecar_path
+    path = sidecar_path(image_path)
+    try:
+        if words is not None and len(words):
+            return words.save(path)
+        if os.path.exists(path):
+            os.remove(path)
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Could not save word data for {image_path}: {e}")
+    return None
+
+
 class NoteProcessingService:
     """Service for coordinating the complete note processing workflow."""
 
-    def __init__(self):
-        """Initialize the processing service with required processors."""
+    def __init__(self, ocr_workers: Optional[int] = None):
+        """
+        Initialize the processing service with required processors.
+
+        Args:
+            ocr_workers: Number of processes used for the OCR stage of batches.
+                Defaults to the 'workers' value of the OCR configuration; 0 or
+                less means one worker per CPU core and 1 disables the pool;
+                capped at the number of cores.
+        """
         self.logger: logging.Logger = logging.getLogger(__name__)
         # Import processors dynamically to avoid type issues
         from src.ocr_processor import OCRProcessor
         from src.ai_processor import AIProcessor
         from src.notes_saver import NotesSaver
+        from src.cpu_budget import CPUBudget
+        from src.utils import load_config
 
-        self._ocr_processor: OCRProcessor = OCRProcessor()
+        self._ocr_settings: dict[str, Any] = load_config().get('ocr', {})
+        self._ocr_processor: OCRProcessor = OCRProcessor.from_config(self._ocr_settings)
         self._ai_processor: AIProcessor = AIProcessor()
         self._notes_saver: NotesSaver = NotesSaver()
 
-    def process_batch(self, image_infos: list[ImageInfo]) -> list[ProcessingResult]:
+        if ocr_workers is None:
+            ocr_workers = int(self._ocr_settings.get('workers', 1))
+        cores = int(self._ocr_settings.get('cpu_cores', 0))
+        # More worker processes than cores would only oversubscribe them
+        budget_cores = cores if cores > 0 else CPUBudget.available_cores()
+        self.ocr_workers: int = min(ocr_workers, budget_cores) if ocr_workers > 0 else budget_cores
+
+        # OCR in this process (single images, batches without a pool) gets all the cores;
+        # the per-worker share is only applied inside the pool workers
+        self._cpu_budget: CPUBudget = CPUBudget(1, self._ocr_processor.threads, cores)
+        self.cpu_allocation: dict[str, Any] = self._cpu_budget.apply()
+        self._ocr_processor.threads = self._cpu_budget.ocr_threads
+        self.worker_allocation: dict[str, Any] = self._worker_allocation(self.ocr_workers)
+
+    def process_batch(self, image_infos: Iterable[ImageInfo],
+                      progress_callback: Optional[Callable[[int, int, ProcessingResult], None]] = None,
+                      total: Optional[int] = None,
+                      stream_callback: Optional[Callable[[int, dict[str, Any]], None]] = None) -> list[ProcessingResult]:
         """
         Process a list of images through the complete workflow.
 
+        With more than one OCR worker, OCR and quality assessment run in a
+        process pool. When the 'batch' OCR setting is enabled, small images
+        (screenshots, crops) are grouped and OCR'd with batched engine calls.
+        The AI requests of each image start as soon as it is OCR'd and run
+        concurrently with the OCR of later images; notes are saved one at a
+        time in input order.
+
         Args:
-            image_infos: List of ImageInfo objects to process
+            image_infos: ImageInfo objects to process; may be a generator that
+                produces images while earlier ones are already being OCR'd
+            progress_callback: Optional callable receiving (index, total, result)
+                as each image finishes
+            total: Number of images, required for a generator to be consumed
+                lazily; otherwise image_infos is read into a list first
+            stream_callback: Optional callable receiving (index, progress) with
+                the fields of an image's AI response as they stream in (see
+                AIProcessor.process_text_stream), on the calling thread
 
         Returns:
-            List of ProcessingResult objects
+            List of ProcessingResult objects, in the same order as image_infos
         """
-        results: list[ProcessingResult] = []
+        if total is None:
+            image_infos = list(image_infos)
+            total = len(image_infos)
 
         # Test AI connection first
         try:
@@ -52,18 +293,228 @@ class NoteProcessingService:
         except Exception:
             pass  # Continue without AI test if method doesn't exist
 
-        for image_info in image_infos:
+        ocr_stages = self._run_ocr_stages(image_infos, total)
+        return self._finish_ocr_stages(ocr_stages, total, progress_callback, stream_callback)
+
+    def _run_ocr_stages(self, image_infos: Iterable[ImageInfo], total: int) -> Iterator[list[tuple[int, ImageInfo, Any]]]:
+        """
+        Run the OCR stage of every image, in a process pool when more than one worker is configured.
+
+        Args:
+            image_infos: ImageInfo objects to OCR
+            total: Number of images
+
+        Yields:
+            Lists of (input index, ImageInfo, OCR stage dictionary or the
+            exception raised for the image) tuples, as each image or group of
+            small images finishes
+        """
+        workers = min(self.ocr_workers, total)
+        if workers <= 1:
+            for group in self._ocr_groups(image_infos):
+                if len(group) == 1:
+                    index, image_info = group[0]
+                    try:
+                        yield [(index, image_info, _run_ocr_stage(self._ocr_processor, image_info))]
+                    except Exception as e:
+                        yield [(index, image_info, e)]
+                else:
+                    ocr_stages = _run_ocr_stage_batch(self._ocr_processor, [image_info for _, image_info in group])
+                    yield [(index, image_info, ocr_stage) for (index, image_info), ocr_stage in zip(group, ocr_stages)]
+            return
+
+        # Budget the workers actually started, which may be fewer than configured for small batches
+        worker_allocation = self._worker_allocation(workers)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_ocr_worker,
+                                 initargs=(self._ocr_settings, worker_allocation)) as executor:
+            # Images from a generator are submitted as soon as they are produced; small
+            # images as soon as their group is full
+            groups: dict[Any, list[tuple[int, ImageInfo]]] = {}
+            for group in self._ocr_groups(image_infos):
+                if len(group) == 1:
+                    future = executor.submit(_run_ocr_stage_in_worker, group[0][1])
+                else:
+                    future = executor.submit(_run_ocr_stage_batch_in_worker, [image_info for _, image_info in group])
+                groups[future] = group
+
+            for future in as_completed(groups):
+                group = groups[future]
+                try:
+                    ocr_stages = future.result()
+                    if len(group) == 1:
+                        ocr_stages = [ocr_stages]
+                except Exception as e:
+                    ocr_stages = [e] * len(group)
+                yield [(index, image_info, ocr_stage) for (index, image_info), ocr_stage in zip(group, ocr_stages)]
+
+    def _worker_allocation(self, workers: int) -> dict[str, Any]:
+        """
+        Compute the CPU budget of each process of an OCR pool.
+
+        Args:
+            workers: Number of pool workers sharing the cores
+
+        Returns:
+            Allocation from CPUBudget.allocation(), applied by _init_ocr_worker
+        """
+        from src.cpu_budget import CPUBudget
+        return CPUBudget(workers, int(self._ocr_settings.get('threads', 1)), self._cpu_budget.cores).allocation()
+
+    def _finish_ocr_stages(self, ocr_stages: Iterator[list[tuple[int, ImageInfo, Any]]], total: int,
+                           progress_callback: Optional[Callable[[int, int, ProcessingResult], None]] = None,
+                           stream_callback: Optional[Callable[[int, dict[str, Any]], None]] = None) -> list[ProcessingResult]:
+        """
+        Run AI processing for images as their OCR stage finishes, and save their notes in input order.
+
+        OCR runs in a background thread, and the AI requests of each image (or
+        group of small images) start as soon as it is OCR'd, in up to the AI
+        'max_concurrency' threads, so AI overlaps the OCR of later images.
+        Notes are saved, and progress_callback called, on the calling thread
+        as soon as an image and all images before it have finished.
+
+        Args:
+            ocr_stages: Lists of (index, ImageInfo, OCR stage dictionary or
+                exception) tuples from _run_ocr_stages
+            total: Number of images, passed to progress_callback
+            progress_callback: Optional callable receiving (index, total, result)
+                as each image finishes
+            stream_callback: Optional callable receiving (index, progress) as
+                streamed AI response fields arrive
+
+        Returns:
+            List of ProcessingResult objects, in input order
+        """
+        events: queue.Queue = queue.Queue()
+
+        def run_ocr() -> None:
             try:
-                result = self.process_single_image(image_info)
-                results.append(result)
+                for chunk in ocr_stages:
+                    events.put(('ocr', chunk))
+                events.put(('ocr_done', None))
             except Exception as e:
-                self.logger.error(f"Error processing image {image_info.original_name}: {e}")
-                # Create a failed result
-                failed_result = self._create_failed_result(image_info, str(e))
-                results.append(failed_result)
+                events.put(('ocr_done', e))
 
+        def run_ai(indices: list[int], items: list[tuple[str, str]]) -> None:
+            # Streamed fields are handed to the calling thread, which runs the callbacks
+            def on_stream(position: int, progress: dict[str, Any]) -> None:
+                events.put(('stream', (indices[position], progress)))
+
+            try:
+                # One request in flight per AI thread, so the pool size bounds the total
+                ai_results = self._ai_processor.process_texts(items, max_concurrency=1,
+                                                              stream_callback=on_stream if stream_callback else None)
+            except Exception as e:
+                self.logger.warning(f"AI processing failed: {e}")
+                ai_results = [{}] * len(items)
+            events.put(('ai', list(zip(indices, ai_results))))
+
+        ocr_thread = threading.Thread(target=run_ocr, name='ocr-stages', daemon=True)
+        ai_executor = ThreadPoolExecutor(max_workers=max(1, int(getattr(self._ai_processor, 'max_concurrency', 1))),
+                                         thread_name_prefix='ai')
+        # Per index: (ImageInfo, OCR stage or exception, AI start time) and the AI result once known
+        stages: dict[int, tuple[ImageInfo, Any, Optional[float]]] = {}
+        ai_results: dict[int, Optional[dict[str, Any]]] = {}
+        ai_pending, ocr_running = 0, True
+
+        results: list[ProcessingResult] = []
+        try:
+            ocr_thread.start()
+            while ocr_running or ai_pending:
+                kind, payload = events.get()
+                if kind == 'ocr':
+                    ai_start = time.time()
+                    indices, items = [], []
+                    for index, image_info, ocr_stage in payload:
+                        stages[index] = (image_info, ocr_stage, ai_start)
+                        if isinstance(ocr_stage, Exception):
+                            ai_results[index] = None
+                        else:
+                            indices.append(index)
+                            items.append((str(ocr_stage['text']), image_info.original_name))
+                    if items:
+                        ai_executor.submit(run_ai, indices, items)
+                        ai_pending += 1
+                elif kind == 'ai':
+                    ai_results.update(payload)
+                    ai_pending -= 1
+                elif kind == 'stream':
+                    if stream_callback:
+                        stream_callback(*payload)
+                    continue
+                else:
+                    ocr_running = False
+                    if payload is not None:
+                        raise payload
+
+                # Save every image whose predecessors are all done
+                while len(results) in ai_results:
+                    index = len(results)
+                    image_info, ocr_stage, ai_start = stages.pop(index)
+                    result = self._finish_ocr_stage(image_info, ocr_stage, ai_results.pop(index), ai_start)
+                    results.append(result)
+                    if progress_callback:
+                        progress_callback(index, total, result)
+        finally:
+            ai_executor.shutdown(wait=not ocr_running, cancel_futures=True)
         return results
 
+    def _ocr_groups(self, image_infos: Iterable[ImageInfo]) -> Iterator[list[tuple[int, ImageInfo]]]:
+        """
+        Group images for the OCR stage.
+
+        With the 'batch' OCR setting enabled, images of at most 'max_pixels'
+        pixels are collected into groups of 'size' that are OCR'd together;
+        every other image forms a group of its own.
+
+        Args:
+            image_infos: ImageInfo objects to group
+
+        Yields:
+            Lists of (input index, ImageInfo) tuples
+        """
+        batch_settings = self._ocr_settings.get('batch', {})
+        if not batch_settings.get('enabled', False):
+            for index, image_info in enumerate(image_infos):
+                yield [(index, image_info)]
+            return
+
+        max_pixels = int(batch_settings.get('max_pixels', 1000000))
+        size = max(1, int(batch_settings.get('size', 16)))
+        pending: list[tuple[int, ImageInfo]] = []
+        for index, image_info in enumerate(image_infos):
+            if not _is_small_image(image_info.path, max_pixels):
+                yield [(index, image_info)]
+                continue
+            pending.append((index, image_info))
+            if len(pending) >= size:
+                yield pending
+                pending = []
+        if pending:
+            yield pending
+
+    def _finish_ocr_stage(self, image_info: ImageInfo, ocr_stage: Any,
+                          ai_result: Optional[dict[str, Any]] = None, ai_start: Optional[float] = None) -> ProcessingResult:
+        """
+        Complete an image from its OCR stage result, turning failures into failed results.
+
+        Args:
+            image_info: ImageInfo object that was OCR'd
+            ocr_stage: OCR stage dictionary, or the exception raised for the image
+            ai_result: AI result of the image when it was already processed
+            ai_start: Time the AI processing of the image started
+
+        Returns:
+            ProcessingResult object
+        """
+        try:
+            if isinstance(ocr_stage, Exception):
+                raise ProcessingError(f"Failed to process image {image_info.original_name}: {str(ocr_stage)}") from ocr_stage
+            start_time = (ai_start or time.time()) - ocr_stage['processing_time']
+            return self._complete_processing(image_info, ocr_stage, start_time, ai_result)
+        except Exception as e:
+            self.logger.error(f"Error processing image {image_info.original_name}: {e}")
+            return self._create_failed_result(image_info, str(e))
+
     def process_single_image(self, image_info: ImageInfo) -> ProcessingResult:
         """
         Process a single image through the complete workflow.
@@ -78,41 +529,48 @@ class NoteProcessingService:
 
         try:
             # Step 1: OCR Processing
-            try:
-                if hasattr(self._ocr_processor, 'extract_text'):
-                    ocr_text = str(self._ocr_processor.extract_text(image_info.path))
-                else:
-                    raise OCRProcessingError("OCR extract_text method not found")
-            except Exception as e:
-                raise OCRProcessingError(f"OCR extraction failed: {str(e)}")
+            ocr_stage = _run_ocr_stage(self._ocr_processor, image_info)
+        except Exception as e:
+            raise ProcessingError(f"Failed to process image {image_info.original_name}: {str(e)}") from e
 
-            if not ocr_text or not ocr_text.strip():
-                raise OCRProcessingError(f"No text found in image {image_info.original_name}")
+        return self._complete_processing(image_info, ocr_stage, start_time)
 
-            # Get OCR quality metrics
-            try:
-                if hasattr(self._ocr_processor, 'assess_image_quality'):
-                    quality_info = self._ocr_processor.assess_image_quality(image_info.path)
-                    if not isinstance(quality_info, dict):
-                        quality_info = {'overall_score': 0, 'grade': 'N/A'}
-                else:
-                    quality_info = {'overall_score': 0, 'grade': 'N/A'}
-            except Exception:
-                quality_info = {'overall_score': 0, 'grade': 'N/A'}
+    def _complete_processing(self, image_info: ImageInfo, ocr_stage: dict[str, Any], start_time: float,
+                             ai_result: Optional[dict[str, Any]] = None) -> ProcessingResult:
+        """
+        Run AI processing and note saving on the output of the OCR stage.
+
+        Args:
+            image_info: ImageInfo object being processed
+            ocr_stage: Result of _run_ocr_stage for this image
+            start_time: Time the image started processing
+            ai_result: AI result of the image when it was already processed;
+                AI processing runs here when it is not given
+
+        Returns:
+            ProcessingResult object
+        """
+        try:
+            ocr_text = ocr_stage['text']
+            quality_info = ocr_stage['quality_info']
 
             # Create OCR result with proper type casting
             ocr_result = OCRResult(
                 text=str(ocr_text),
                 quality_score=float(quality_info.get('overall_score', 0)),
                 quality_grade=str(quality_info.get('grade', 'N/A')),
-                confidence=0.0,  # TODO: Implement confidence calculation
-                processing_time=time.time() - start_time
+                confidence=float(ocr_stage.get('confidence', 0.0)),
+                processing_time=ocr_stage['processing_time'],
+                rotation_applied=ocr_stage.get('rotation_applied', 0.0),
+                word_data_path=ocr_stage.get('word_data_path'),
+                model_tier=ocr_stage.get('model_tier'),
+                escalated=ocr_stage.get('escalated', False)
             )
 
             # Step 2: AI Processing
-            ai_result_dict = {}
+            ai_result_dict = ai_result if ai_result is not None else {}
             try:
-                if hasattr(self._ai_processor, 'process_text'):
+                if ai_result is None and hasattr(self._ai_processor, 'process_text'):
                     ai_result_dict = self._ai_processor.process_text(str(ocr_text), image_info.original_name)
             except Exception as e:
                 self.logger.warning(f"AI processing failed: {e}")
@@ -140,7 +598,6 @@ class NoteProcessingService:
             )
 
         except Exception as e:
-            processing_time = time.time() - start_time
             raise ProcessingError(f"Failed to process image {image_info.original_name}: {str(e)}") from e
 
     def _create_successful_result(self, image_info: ImageInfo, ocr_result: OCRResult, notes_path: Optional[str], processing_time: float) -> ProcessingResult:
@@ -3,7 +3,11 @@ OCR service for the SAT/ACT Notes Organizer.
 """
 
 import logging
+import os
+from dataclasses import asdict
+from typing import IO, Any, Optional, Union
 from data.models.image_info import ImageQualityInfo, ImageOrientationInfo
+from src.image_context import ImageAnalysisContext
 
 class OCRService:
     """Service for OCR-related operations."""
@@ -13,14 +17,16 @@ class OCRService:
         self.logger: logging.Logger = logging.getLogger(__name__)
         # Import OCR processor dynamically to avoid type issues
         from src.ocr_processor import OCRProcessor
-        self._processor: OCRProcessor = OCRProcessor()
+        from src.utils import load_config
+        self._processor: OCRProcessor = OCRProcessor.from_config(load_config().get('ocr', {}))
 
-    def extract_text(self, image_path: str) -> str:
+    def extract_text(self, image_path: Union[str, ImageAnalysisContext]) -> str:
         """
         Extract text from an image.
 
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, or an ImageAnalysisContext shared
+                with other calls on the same image
 
         Returns:
             Extracted text
@@ -37,12 +43,108 @@ class OCRService:
             self.logger.error(f"Error extracting text: {e}")
             return ""
 
-    def assess_image_quality(self, image_path: str) -> ImageQualityInfo:
+    def extract_text_details(self, image_path: Union[str, ImageAnalysisContext],
+                             quality_info: Optional[ImageQualityInfo] = None,
+                             orientation_info: Optional[ImageOrientationInfo] = None) -> dict[str, Any]:
+        """
+        Extract text from an image and save its word-level data next to it.
+
+        Args:
+            image_path: Path to the image file, or an ImageAnalysisContext shared
+                with other calls on the same image
+            quality_info: Earlier quality assessment of the image to reuse
+            orientation_info: Earlier orientation detection of the image to reuse
+
+        Returns:
+            Dictionary with 'text', 'confidence' (average word confidence),
+            'word_data_path' (sidecar file, or None), 'model_tier' and 'escalated'
+        """
+        result: dict[str, Any] = {'text': '', 'confidence': 0.0, 'word_data_path': None,
+                                  'model_tier': None, 'escalated': False}
+        try:
+            quality = asdict(quality_info) if quality_info is not None and quality_info.metrics else None
+            orientation = None
+            if orientation_info is not None and orientation_info.method is not None:
+                orientation = asdict(orientation_info)
+            details = self._processor.extract_text_details(image_path, orientation=orientation, quality=quality)
+            result['text'] = str(details.get('text') or '')
+            result['confidence'] = float(details.get('confidence', 0.0))
+            result['model_tier'] = details.get('model_tier')
+            result['escalated'] = bool(details.get('escalated', False))
+
+            path = image_path.image_path if isinstance(image_path, ImageAnalysisContext) else image_path
+            if path:
+                from src.word_data import sidecar_path
+                words = details.get('words')
+                sidecar = sidecar_path(path)
+                if words is not None and len(words):
+                    result['word_data_path'] = words.save(sidecar)
+                elif os.path.exists(sidecar):
+                    # Stale word data of an earlier run must not pass for this result's
+                    os.remove(sidecar)
+        except Exception as e:
+            self.logger.error(f"Error extracting text: {e}")
+        return result
+
+    def predict_yield(self, quality_info: ImageQualityInfo) -> Optional[dict[str, Any]]:
+        """
+        Predict whether OCR will find text in an image from its quality assessment.
+
+        Args:
+            quality_info: Quality assessment of the image
+
+        Returns:
+            Dictionary with 'probability', 'action' ('proceed', 'aggressive' or
+            'skip') and 'source', or None when the predictor is disabled
+        """
+        predictor = getattr(self._processor, 'yield_predictor', None)
+        if predictor is None or not quality_info.metrics:
+            return None
+        try:
+            return predictor.predict(asdict(quality_info))
+        except Exception as e:
+            self.logger.error(f"Error predicting OCR yield: {e}")
+            return None
+
+    def cache_stats(self) -> dict[str, Any]:
+        """
+        Get hit/miss statistics of the OCR result cache.
+
+        Returns:
+            Cache statistics, or an empty dictionary when caching is disabled
+        """
+        cache = getattr(self._processor, 'cache', None)
+        if cache is None:
+            return {}
+        try:
+            return cache.stats()
+        except Exception as e:
+            self.logger.error(f"Error reading OCR cache statistics: {e}")
+            return {}
+
+    def telemetry_stats(self) -> dict[str, Any]:
+        """
+        Get win statistics of the OCR variant/PSM candidates.
+
+        Returns:
+            Telemetry statistics, or an empty dictionary when telemetry is disabled
+        """
+        telemetry = getattr(self._processor, 'telemetry', None)
+        if telemetry is None:
+            return {}
+        try:
+            return telemetry.stats()
+        except Exception as e:
+            self.logger.error(f"Error reading OCR telemetry statistics: {e}")
+            return {}
+
+    def assess_image_quality(self, image_path: Union[str, ImageAnalysisContext]) -> ImageQualityInfo:
         """
         Assess the quality of an image for OCR purposes.
 
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, or an ImageAnalysisContext shared
+                with other calls on the same image
 
         Returns:
             ImageQualityInfo object
@@ -61,6 +163,38 @@ class OCRService:
         except Exception as e:
             self.logger.error(f"Error assessing image quality: {e}")
 
+        return self._to_quality_info(quality_data)
+
+    def assess_image_quality_batch(self, images: list[Union[str, IO[bytes], ImageAnalysisContext]]) -> list[ImageQualityInfo]:
+        """
+        Assess the quality of many images in parallel on reduced copies.
+
+        Args:
+            images: Image paths, open binary files (e.g. uploaded files) or
+                ImageAnalysisContext objects
+
+        Returns:
+            ImageQualityInfo objects in input order
+        """
+        try:
+            results = self._processor.assess_image_quality_batch(images)
+        except Exception as e:
+            self.logger.error(f"Error assessing image quality: {e}")
+            results = [{} for _ in images]
+
+        default = {'grade': 'N/A', 'quality_description': 'Error', 'overall_score': 0, 'metrics': {}}
+        return [self._to_quality_info(result if isinstance(result, dict) and result else default) for result in results]
+
+    def _to_quality_info(self, quality_data: dict[str, Any]) -> ImageQualityInfo:
+        """
+        Convert a processor quality assessment to an ImageQualityInfo.
+
+        Args:
+            quality_data: Quality assessment dictionary
+
+        Returns:
+            ImageQualityInfo object
+        """
         # Safe type conversion with fallbacks
         grade = quality_data.get('grade', 'N/A')
         description = quality_data.get('quality_description', '')
@@ -74,18 +208,19 @@ class OCRService:
             metrics=dict(metrics) if isinstance(metrics, dict) else {}
         )
 
-    def detect_orientation(self, image_path: str) -> ImageOrientationInfo:
+    def detect_orientation(self, image_path: Union[str, ImageAnalysisContext]) -> ImageOrientationInfo:
         """
         Detect the orientation of an image.
 
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, or an ImageAnalysisContext shared
+                with other calls on the same image
 
         Returns:
             ImageOrientationInfo object
         """
         # Default values
-        orientation_data = {'angle': 0, 'needs_rotation': False, 'recommended_rotation': 0, 'method': None}
+        orientation_data = {'angle': 0, 'needs_rotation': False, 'recommended_rotation': 0, 'skew': 0.0, 'method': None}
 
         try:
             # Use direct method call instead of dynamic calling
@@ -103,10 +238,12 @@ class OCRService:
         needs_rotation = orientation_data.get('needs_rotation', False)
         recommended_rotation = orientation_data.get('recommended_rotation', 0)
         method = orientation_data.get('method')
+        skew = orientation_data.get('skew', 0.0)
 
         return ImageOrientationInfo(
             angle=float(angle) if isinstance(angle, (int, float)) else 0.0,
             needs_rotation=bool(needs_rotation),
             recommended_rotation=float(recommended_rotation) if isinstance(recommended_rotation, (int, float)) else 0.0,
-            method=str(method) if method is not None else None
+            method=str(method) if method is not None else None,
+            skew=float(skew) if isinstance(skew, (int, float)) else 0.0
         )
@@ -4,10 +4,13 @@ Storage service for the SAT/ACT Notes Organizer.
 
 import os
 import logging
+import shutil
 import time
 from typing import Any
 
-from src.utils import get_resource_path, ensure_directory_exists
+from src.document_loader import DocumentLoader
+from src.word_data import SIDECAR_EXTENSION, sidecar_path
+from src.utils import get_resource_path, ensure_directory_exists, load_config
 from data.models.note import ImageInfo
 
 logger = logging.getLogger(__name__)
@@ -56,6 +59,65 @@ class StorageService:
             path=temp_path
         )
 
+    def save_document(self, uploaded_file: Any, original_name: str) -> list[ImageInfo]:
+        """
+        Save the pages of an uploaded multi-page PDF or TIFF as separate images.
+
+        Pages are read and written one at a time, and the document itself is
+        removed once all its pages are saved.
+
+        Args:
+            uploaded_file: Uploaded file object
+            original_name: Original filename of the document
+
+        Returns:
+            List of ImageInfo objects, one per page, in page order
+        """
+        filename_base, filename_ext = os.path.splitext(original_name)
+        timestamp = int(time.time() * 1000) % 1000000
+        unique_document_name = f"{filename_base}_{timestamp}{filename_ext}"
+        document_path = os.path.join(self.temp_dir, unique_document_name)
+
+        # Copy in chunks rather than reading the whole document into memory
+        uploaded_file.seek(0)
+        with open(document_path, 'wb') as f:
+            shutil.copyfileobj(uploaded_file, f)
+
+        pages: list[ImageInfo] = []
+        try:
+            loader = DocumentLoader(dpi=int(load_config().get('ocr', {}).get('pdf_dpi', 300)))
+            for page_number, page_path in loader.save_pages(document_path, self.temp_dir, unique_document_name):
+                pages.append(ImageInfo(
+                    name=os.path.basename(page_path),
+                    original_name=f"{filename_base}_page{page_number:03d}.png",
+                    path=page_path,
+                    page_number=page_number,
+                    source_document=original_name
+                ))
+        finally:
+            os.remove(document_path)
+
+        return pages
+
+    def is_document_file(self, filename: str) -> bool:
+        """Check if a file has a multi-page document format (PDF or TIFF)."""
+        return DocumentLoader.is_document(filename)
+
+    def is_multi_page_document(self, uploaded_file: Any) -> bool:
+        """
+        Check if an uploaded file should be saved with save_document.
+
+        Single-frame TIFFs are saved with save_temp_image instead, so they keep
+        the quality and orientation analysis made when they were previewed.
+
+        Args:
+            uploaded_file: Uploaded file object
+
+        Returns:
+            True for PDFs and multi-frame TIFFs
+        """
+        return DocumentLoader.is_multi_page(uploaded_file.name, uploaded_file)
+
     def get_temp_images(self) -> list[ImageInfo]:
         """
         Get all images in the temporary directory.
@@ -89,6 +151,9 @@ class StorageService:
             file_path = os.path.join(self.temp_dir, image_name)
             if os.path.exists(file_path):
                 os.remove(file_path)
+                word_data_path = sidecar_path(file_path)
+                if os.path.exists(word_data_path):
+                    os.remove(word_data_path)
                 return True
             return False
         except Exception as e:
@@ -105,7 +170,8 @@ class StorageService:
         try:
             if os.path.exists(self.temp_dir):
                 for filename in os.listdir(self.temp_dir):
-                    if self._is_image_file(filename):
+                    if (self._is_image_file(filename) or self.is_document_file(filename)
+                            or filename.endswith(SIDECAR_EXTENSION)):
                         file_path = os.path.join(self.temp_dir, filename)
                         os.remove(file_path)
             return True
@@ -1,25 +1,51 @@
+import asyncio
+import hashlib
+import inspect
 import json
 import requests
 import logging
 import re
-from typing import Any
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from typing import Any, Callable, Dict, Iterator, Optional
 import os
 import sys
-from typing import Dict, Any
 
 # Add parent directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from src.utils import load_config
+from src.disk_cache import DiskCache
+from src.http_client import get_session
+from src.json_stream import JSONFieldStream
+from src.utils import load_config, get_resource_path
+
+# System message sent with every analysis request
+SYSTEM_PROMPT = "You are an expert tutor analyzing SAT/ACT study materials. Provide structured, helpful analysis."
 
 class AIProcessor:
     """
     Simplified AI Processor for analyzing SAT/ACT study content.
     """
 
-    def __init__(self):
-        """Initialize AI processor with configuration."""
+    # Generation settings of analysis requests
+    MAX_TOKENS = 1000
+    TEMPERATURE = 0.3
+
+    # Text fields whose partial values are reported while a response streams
+    STREAMED_FIELDS = ('summary', 'notes')
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize AI processor with configuration.
+
+        Args:
+            session: HTTP session to send API requests with; defaults to the
+                pooled keep-alive session shared by the whole process
+        """
         self.logger = logging.getLogger(__name__)
+        self.session = session if session is not None else get_session()
+        self.config: Dict[str, Any] = {}
 
         try:
             self.config = load_config()
@@ -42,6 +68,76 @@ class AIProcessor:
             'Content-Type': 'application/json'
         }
 
+        # Requests that process_texts keeps in flight at the same time
+        ai_settings = self.config.get('ai', {})
+        self.max_concurrency = max(1, int(ai_settings.get('max_concurrency', 8)))
+
+        # Server-sent events for single-text requests with a progress listener
+        self.stream_enabled = bool(ai_settings.get('stream', False))
+
+        # Packing of short texts into one multi-item request
+        batch_settings = ai_settings.get('batch', {})
+        self.batch_enabled = bool(batch_settings.get('enabled', False))
+        self.batch_max_prompt_tokens = int(batch_settings.get('max_prompt_tokens', 3000))
+        self.batch_max_items = max(1, int(batch_settings.get('max_items', 8)))
+        self.batch_max_item_tokens = int(batch_settings.get('max_item_tokens', 500))
+        # Ceiling of a batched request's max_tokens; at least one item's budget
+        self.batch_max_response_tokens = max(self.MAX_TOKENS, int(batch_settings.get('max_response_tokens', 8000)))
+
+        # Persistent cache of parsed responses
+        self.cache: Optional[DiskCache] = None
+        try:
+            self.cache = self._create_cache(ai_settings.get('cache', {}))
+        except Exception as e:
+            self.logger.warning(f"AI response cache disabled: {e}")
+
+    @staticmethod
+    def _create_cache(cache_settings: Dict[str, Any]) -> Optional[DiskCache]:
+        """Create the AI response cache described by the 'cache' AI setting."""
+        if not cache_settings.get('enabled', False):
+            return None
+
+        path = cache_settings.get('path') or os.path.join(get_resource_path('data/cache'), 'ai_cache.sqlite3')
+        ttl_days = cache_settings.get('ttl_days', 30)
+        return DiskCache(
+            path,
+            max_bytes=int(float(cache_settings.get('max_mb', 64)) * 1024 * 1024),
+            ttl=float(ttl_days) * 86400 if ttl_days is not None else None
+        )
+
+    @classmethod
+    @cache
+    def prompt_version(cls) -> str:
+        """
+        Get a hash identifying the prompts and generation settings.
+
+        Changing the prompt template, the system prompt or the generation
+        settings changes the version, so cached responses to old prompts are
+        no longer used. Computed once per class, since reading the source is
+        too slow for every cache lookup.
+
+        Returns:
+            str: Short hex digest
+        """
+        try:
+            template = inspect.getsource(cls._create_analysis_prompt) + inspect.getsource(cls._create_batch_prompt)
+        except (OSError, TypeError):
+            # Source unavailable (e.g. a frozen build); fall back to the rendered prompts
+            template = (cls._create_analysis_prompt(cls, '') + cls._create_analysis_prompt(cls, 'sample text')
+                        + cls._create_batch_prompt(['sample text']))
+        settings = f"{SYSTEM_PROMPT}|{cls.MAX_TOKENS}|{cls.TEMPERATURE}"
+        return hashlib.sha256((template + settings).encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Normalize OCR text for cache lookups: Unicode NFKC and collapsed whitespace."""
+        return ' '.join(unicodedata.normalize('NFKC', text).split())
+
+    def _cache_key(self, text: str) -> str:
+        """Build the response cache key from the normalized text, model and prompt version."""
+        payload = json.dumps([self.normalize_text(text), self.model, self.prompt_version()])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
     def _get_provider_config(self) -> Dict[str, Any]:
         """Get ModelScope provider configuration."""
         providers = self.config.get('providers', [])
@@ -66,7 +162,7 @@ class AIProcessor:
                 "max_tokens": 10
             }
 
-            response = requests.post(
+            response = self.session.post(
                 self.base_url,
                 headers=self.headers,
                 json=test_data,
@@ -84,51 +180,375 @@ class AIProcessor:
             self.logger.error(f"Error testing AI connection: {e}")
             return False
 
-    def process_text(self, text: str, image_name: str) -> Dict[str, Any]:
+    def process_text(self, text: str, image_name: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Process extracted text and generate structured notes.
 
         Args:
             text: Extracted text from OCR
             image_name: Name of the source image
+            use_cache: Whether to look up the response in the response cache;
+                False always requests a fresh completion, which still replaces
+                the cached one
 
         Returns:
             Dict containing processed information
         """
+        cache_key = self._cache_key(text) if self.cache is not None else None
+        if cache_key is not None and use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                cached['source_image'] = image_name
+                return cached
+
         try:
-            # Create prompt for content analysis
-            prompt = self._create_analysis_prompt(text)
+            # Create prompt for content analysis and send it to the AI API
+            content = self._request_completion(self._create_analysis_prompt(text), self.MAX_TOKENS)
 
-            # Send request to AI API
-            data = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": "You are an expert tutor analyzing SAT/ACT study materials. Provide structured, helpful analysis."},
-                    {"role": "user", "content": prompt}
-                ],
-                "max_tokens": 1000,
-                "temperature": 0.3
-            }
+            # Parse the structured response; only complete analyses are cached
+            parsed = self._parse_ai_response(content, image_name)
+            if cache_key is not None and self._extract_json(content) is not None:
+                self.cache.set(cache_key, parsed)
+            return parsed
 
-            response = requests.post(
-                self.base_url,
-                headers=self.headers,
-                json=data,
-                timeout=30
-            )
+        except Exception as e:
+            self.logger.error(f"Error processing text: {e}")
+            return self._create_fallback_response(text, image_name)
+
+    def _request_completion(self, prompt: str, max_tokens: int) -> str:
+        """
+        Send one chat completion request with the analysis system prompt.
+
+        Args:
+            prompt: User message
+            max_tokens: Maximum number of tokens to generate
+
+        Returns:
+            Content of the model's reply
+
+        Raises:
+            Exception: If the request fails or returns a non-200 status
+        """
+        data = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": max_tokens,
+            "temperature": self.TEMPERATURE
+        }
+
+        response = self.session.post(
+            self.base_url,
+            headers=self.headers,
+            json=data,
+            timeout=30
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"API request failed: {response.status_code}")
+
+        result = response.json()
+        return result['choices'][0]['message']['content']
 
+    def _stream_completion(self, prompt: str, max_tokens: int) -> Iterator[str]:
+        """
+        Send one chat completion request and read the reply as server-sent events.
+
+        Reasoning deltas of thinking models ('reasoning_content') are skipped;
+        only the answer content is yielded.
+
+        Args:
+            prompt: User message
+            max_tokens: Maximum number of tokens to generate
+
+        Yields:
+            Pieces of the reply content as they arrive
+
+        Raises:
+            Exception: If the request fails or returns a non-200 status
+        """
+        data = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": max_tokens,
+            "temperature": self.TEMPERATURE,
+            "stream": True
+        }
+
+        # The timeout applies between received chunks, not to the whole reply
+        with self.session.post(self.base_url, headers=self.headers, json=data, timeout=30, stream=True) as response:
             if response.status_code != 200:
                 raise Exception(f"API request failed: {response.status_code}")
 
-            result = response.json()
-            content = result['choices'][0]['message']['content']
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith('data:'):
+                    continue
+                payload = line[len('data:'):].strip()
+                if payload == '[DONE]':
+                    break
+                choices = json.loads(payload).get('choices') or [{}]
+                content = (choices[0].get('delta') or {}).get('content')
+                if content:
+                    yield content
+
+    def process_text_stream(self, text: str, image_name: str, use_cache: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Process extracted text with a streamed response, reporting fields as they complete.
 
-            # Parse the structured response
-            return self._parse_ai_response(content, image_name)
+        Args:
+            text: Extracted text from OCR
+            image_name: Name of the source image
+            use_cache: Whether to look up the response in the response cache;
+                a fresh response is stored either way
+
+        Yields:
+            Progress dicts with 'fields' (top-level fields completed so far),
+            'partial' (values so far of the STREAMED_FIELDS still arriving) and
+            'result' (None until the last dict, which carries the same result
+            as process_text)
+        """
+        cache_key = self._cache_key(text) if self.cache is not None else None
+        if cache_key is not None and use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                cached['source_image'] = image_name
+                yield {'fields': cached, 'partial': {}, 'result': cached}
+                return
+
+        chunks: list[str] = []
+        try:
+            stream = JSONFieldStream()
+            for chunk in self._stream_completion(self._create_analysis_prompt(text), self.MAX_TOKENS):
+                chunks.append(chunk)
+                completed = stream.feed(chunk)
+                partial = {field: value for field in self.STREAMED_FIELDS
+                           if field not in stream.fields and (value := stream.partial(field))}
+                if completed or partial:
+                    yield {'fields': dict(stream.fields), 'partial': partial, 'result': None}
+
+            # The whole reply is parsed once more, exactly like a non-streamed one
+            content = ''.join(chunks)
+            parsed = self._parse_ai_response(content, image_name)
+            if cache_key is not None and self._extract_json(content) is not None:
+                self.cache.set(cache_key, parsed)
 
         except Exception as e:
             self.logger.error(f"Error processing text: {e}")
-            return self._create_fallback_response(text, image_name)
+            parsed = self._create_fallback_response(text, image_name)
+
+        yield {'fields': parsed, 'partial': {}, 'result': parsed}
+
+    def _process_text_streamed(self, text: str, image_name: str, use_cache: bool,
+                               on_progress: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+        """Run process_text_stream to the end, passing each progress dict to on_progress."""
+        result = None
+        for progress in self.process_text_stream(text, image_name, use_cache):
+            on_progress(progress)
+            result = progress['result']
+        return result if result is not None else self._create_fallback_response(text, image_name)
+
+    def process_text_batch(self, items: list[tuple[str, str]], use_cache: bool = True) -> list[Dict[str, Any]]:
+        """
+        Process several texts with one multi-item request.
+
+        Cached texts are answered from the cache and the rest are sent in a
+        single prompt whose reply is a JSON array with one object per text.
+        Texts the reply does not cover, or covers with an unusable object, are
+        processed again with their own request.
+
+        Args:
+            items: (text, image_name) pairs to process
+            use_cache: Whether to look up responses in the response cache;
+                fresh responses are stored either way
+
+        Returns:
+            List of result dicts as returned by process_text, in input order
+        """
+        results: list[Optional[Dict[str, Any]]] = [None] * len(items)
+        cache_keys: list[Optional[str]] = [None] * len(items)
+        if self.cache is not None:
+            for index, (text, image_name) in enumerate(items):
+                cache_keys[index] = self._cache_key(text)
+                if not use_cache:
+                    continue
+                cached = self.cache.get(cache_keys[index])
+                if cached is not None:
+                    cached['source_image'] = image_name
+                    results[index] = cached
+
+        pending = [index for index, result in enumerate(results) if result is None]
+        if len(pending) > 1:
+            try:
+                content = self._request_completion(
+                    self._create_batch_prompt([items[index][0] for index in pending]),
+                    min(self.MAX_TOKENS * len(pending), self.batch_max_response_tokens)
+                )
+                parsed = self._parse_batch_response(content, [items[index][1] for index in pending])
+            except Exception as e:
+                self.logger.error(f"Error processing text batch: {e}")
+                parsed = [None] * len(pending)
+
+            for index, result in zip(pending, parsed):
+                if result is not None:
+                    results[index] = result
+                    if cache_keys[index] is not None:
+                        self.cache.set(cache_keys[index], result)
+
+            missing = sum(result is None for result in results)
+            if missing:
+                self.logger.warning(f"Batched AI response covered {len(pending) - missing} of {len(pending)} texts; "
+                                    f"processing the rest one by one")
+
+        # Per-item fallback for texts the batched reply did not cover
+        return [
+            result if result is not None else self.process_text(text, image_name, use_cache)
+            for result, (text, image_name) in zip(results, items)
+        ]
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """Roughly estimate the number of tokens of a text (about four characters per token)."""
+        return len(text) // 4 + 1
+
+    def _pack_batches(self, items: list[tuple[str, str]]) -> list[list[int]]:
+        """
+        Group items for multi-item requests.
+
+        Short texts are packed in input order into groups that fit the batch
+        prompt token budget and whose MAX_TOKENS per item fit the response
+        ceiling; long or corrupted texts, which get their own prompt, form
+        groups of one.
+
+        Args:
+            items: (text, image_name) pairs
+
+        Returns:
+            Lists of item indices, each sent as one request
+        """
+        if not self.batch_enabled:
+            return [[index] for index in range(len(items))]
+
+        overhead = self._estimate_tokens(self._create_batch_prompt([]))
+        max_items = min(self.batch_max_items, self.batch_max_response_tokens // self.MAX_TOKENS)
+        groups: list[list[int]] = []
+        current: list[int] = []
+        current_tokens = overhead
+        for index, (text, _) in enumerate(items):
+            # The text is embedded as a JSON string with its index
+            tokens = self._estimate_tokens(json.dumps(text, ensure_ascii=False)) + 8
+            if tokens > self.batch_max_item_tokens or self._assess_text_quality(text) == "corrupted":
+                groups.append([index])
+                continue
+            if current and (current_tokens + tokens > self.batch_max_prompt_tokens
+                            or len(current) >= max_items):
+                groups.append(current)
+                current, current_tokens = [], overhead
+            current.append(index)
+            current_tokens += tokens
+        if current:
+            groups.append(current)
+        return groups
+
+    async def process_texts_async(self, items: list[tuple[str, str]], max_concurrency: Optional[int] = None,
+                                  progress_callback: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+                                  use_cache: bool = True,
+                                  stream_callback: Optional[Callable[[int, Dict[str, Any]], None]] = None) -> list[Dict[str, Any]]:
+        """
+        Process many texts concurrently.
+
+        Each request runs in a worker thread, so the blocking HTTP calls wait
+        on the network in parallel; a semaphore bounds how many are in flight.
+        With the 'batch' AI setting enabled, short texts are packed into
+        multi-item requests (process_text_batch) up to a token budget. With
+        the 'stream' AI setting enabled and a stream_callback given, texts with
+        a request of their own are streamed and their fields reported as they
+        arrive.
+
+        Args:
+            items: (text, image_name) pairs to process
+            max_concurrency: Maximum number of requests in flight; defaults to
+                the 'max_concurrency' value of the 'ai' configuration
+            progress_callback: Optional callable receiving (index, result) as
+                each item finishes, in completion order
+            use_cache: Whether to look up responses in the response cache
+            stream_callback: Optional callable receiving (index, progress) for
+                the progress dicts of process_text_stream; called on the event
+                loop's thread
+
+        Returns:
+            List of result dicts as returned by process_text, in input order
+        """
+        limit = max(1, max_concurrency or self.max_concurrency)
+        semaphore = asyncio.Semaphore(limit)
+        loop = asyncio.get_running_loop()
+
+        results: list[Dict[str, Any]] = [{} for _ in items]
+        groups = self._pack_batches(items)
+
+        with ThreadPoolExecutor(max_workers=min(limit, max(1, len(groups))), thread_name_prefix='ai') as executor:
+            async def process_group(indices: list[int]) -> None:
+                group_items = [items[index] for index in indices]
+                async with semaphore:
+                    try:
+                        if len(group_items) == 1 and self.stream_enabled and stream_callback:
+                            text, image_name = group_items[0]
+
+                            # Hand progress from the worker thread to the loop's thread
+                            def on_progress(progress: Dict[str, Any], index: int = indices[0]) -> None:
+                                loop.call_soon_threadsafe(stream_callback, index, progress)
+
+                            group_results = [await loop.run_in_executor(
+                                executor, self._process_text_streamed, text, image_name, use_cache, on_progress)]
+                        elif len(group_items) == 1:
+                            text, image_name = group_items[0]
+                            group_results = [await loop.run_in_executor(
+                                executor, self.process_text, text, image_name, use_cache)]
+                        else:
+                            group_results = await loop.run_in_executor(
+                                executor, self.process_text_batch, group_items, use_cache)
+                    except Exception as e:
+                        self.logger.error(f"Error processing text: {e}")
+                        group_results = [self._create_fallback_response(text, image_name)
+                                         for text, image_name in group_items]
+                for index, result in zip(indices, group_results):
+                    results[index] = result
+                    if progress_callback:
+                        progress_callback(index, result)
+
+            await asyncio.gather(*(process_group(indices) for indices in groups))
+        return results
+
+    def process_texts(self, items: list[tuple[str, str]], max_concurrency: Optional[int] = None,
+                      progress_callback: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+                      use_cache: bool = True,
+                      stream_callback: Optional[Callable[[int, Dict[str, Any]], None]] = None) -> list[Dict[str, Any]]:
+        """
+        Process many texts concurrently from synchronous code.
+
+        Runs process_texts_async in a new event loop; use process_texts_async
+        directly from code that already runs in one.
+
+        Args:
+            items: (text, image_name) pairs to process
+            max_concurrency: Maximum number of requests in flight
+            progress_callback: Optional callable receiving (index, result) as
+                each item finishes
+            use_cache: Whether to look up responses in the response cache
+            stream_callback: Optional callable receiving (index, progress) as
+                streamed fields arrive, in the calling thread
+
+        Returns:
+            List of result dicts as returned by process_text, in input order
+        """
+        if not items:
+            return []
+        return asyncio.run(self.process_texts_async(items, max_concurrency, progress_callback, use_cache,
+                                                    stream_callback))
 
     def _create_analysis_prompt(self, text: str) -> str:
         """Create analysis prompt for the AI."""
@@ -174,37 +594,106 @@ Please provide your analysis in the following JSON format:
 Focus on creating helpful, organized study notes that would be useful for SAT/ACT preparation.
 """
 
+    @staticmethod
+    def _create_batch_prompt(texts: list[str]) -> str:
+        """Create the analysis prompt for several texts answered with one JSON array."""
+        entries = json.dumps([{"index": index, "text": text} for index, text in enumerate(texts)],
+                             ensure_ascii=False, indent=2)
+        return f"""
+Analyze each of the following SAT/ACT study material texts separately. They are given as a JSON array of objects with an "index" and the "text":
+
+TEXTS TO ANALYZE:
+{entries}
+
+Please provide your analysis as a JSON array with exactly one object per text, each carrying the index of its text:
+[
+    {{
+        "index": 0,
+        "subject": "math|english|science|social_studies",
+        "content_type": "notes|practice_problem|wrong_answer_explanation|concept_summary",
+        "confidence": 85,
+        "key_concepts": ["concept1", "concept2"],
+        "notes": "Well-organized study notes based on the content...",
+        "summary": "Brief summary of the main points..."
+    }}
+]
+
+Do not mix content between texts. Focus on creating helpful, organized study notes that would be useful for SAT/ACT preparation.
+"""
+
+    def _parse_batch_response(self, response_content: str, image_names: list[str]) -> list[Optional[Dict[str, Any]]]:
+        """
+        Map the JSON array of a multi-item response back to its texts.
+
+        Args:
+            response_content: Content of the model's reply
+            image_names: Source image names, in the order the texts were sent
+
+        Returns:
+            One result dict per text, or None for texts without a usable
+            object in the reply
+        """
+        results: list[Optional[Dict[str, Any]]] = [None] * len(image_names)
+
+        json_start = response_content.find('[')
+        json_end = response_content.rfind(']') + 1
+        if json_start == -1 or json_end <= json_start:
+            return results
+        try:
+            entries = json.loads(response_content[json_start:json_end])
+        except json.JSONDecodeError:
+            return results
+        if not isinstance(entries, list):
+            return results
+
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            index = entry.get('index')
+            if isinstance(index, str) and index.isdigit():
+                index = int(index)
+            if isinstance(index, int) and 0 <= index < len(results) and results[index] is None:
+                results[index] = self._result_from_data(entry, image_names[index])
+        return results
+
+    @staticmethod
+    def _extract_json(response_content: str) -> Optional[Dict[str, Any]]:
+        """Extract the JSON object from an AI response, or None if it contains none."""
+        json_start = response_content.find('{')
+        json_end = response_content.rfind('}') + 1
+        if json_start == -1 or json_end <= json_start:
+            return None
+        try:
+            parsed_data = json.loads(response_content[json_start:json_end])
+        except json.JSONDecodeError:
+            return None
+        return parsed_data if isinstance(parsed_data, dict) else None
+
     def _parse_ai_response(self, response_content: str, image_name: str) -> Dict[str, Any]:
         """Parse AI response and extract structured data."""
-        try:
-            # Try to extract JSON from the response
-            json_start = response_content.find('{')
-            json_end = response_content.rfind('}') + 1
-
-            if json_start != -1 and json_end > json_start:
-                json_str = response_content[json_start:json_end]
-                parsed_data = json.loads(json_str)
-
-                # Ensure required fields exist
-                result = {
-                    'subject': parsed_data.get('subject', 'general'),
-                    'content_type': parsed_data.get('content_type', 'notes'),
-                    'confidence': parsed_data.get('confidence', 75),
-                    'key_concepts': parsed_data.get('key_concepts', []),
-                    'notes': parsed_data.get('notes', ''),
-                    'summary': parsed_data.get('summary', ''),
-                    'source_image': image_name
-                }
-
-                return result
-            else:
-                # If no JSON found, treat entire response as notes
-                return self._create_fallback_response(response_content, image_name)
+        # Try to extract JSON from the response
+        parsed_data = self._extract_json(response_content)
 
-        except json.JSONDecodeError:
-            # If JSON parsing fails, use the response as notes
+        if parsed_data is None:
+            # If no valid JSON found, treat entire response as notes
             return self._create_fallback_response(response_content, image_name)
 
+        return self._result_from_data(parsed_data, image_name)
+
+    @staticmethod
+    def _result_from_data(parsed_data: Dict[str, Any], image_name: str) -> Dict[str, Any]:
+        """Build a result dict from the JSON object of one analysis."""
+        # Ensure required fields exist
+        return {
+            'subject': parsed_data.get('subject', 'general'),
+            'content_type': parsed_data.get('content_type', 'notes'),
+            'confidence': parsed_data.get('confidence', 75),
+            'key_concepts': parsed_data.get('key_concepts', []),
+            'notes': parsed_data.get('notes', ''),
+            'summary': parsed_data.get('summary', ''),
+            'source_image': image_name
+        }
+
     def _create_fallback_response(self, content: str, image_name: str) -> Dict[str, Any]:
         """Create a fallback response when AI processing fails."""
         return {
@@ -0,0 +1,141 @@
+import logging
+import os
+import sys
+from typing import Any, Optional
+
+import cv2
+
+
+class CPUBudget:
+    """
+    Splits the available cores between the thread pools of the pipeline:
+    OpenCV's own pool, tesseract's OpenMP threads and torch's intra-op threads
+    (sentence embeddings). Each OCR worker process gets an equal share, and
+    the share is divided again between the OCR candidates a worker runs at
+    the same time, so parallel images do not oversubscribe the machine. The
+    OCR threads of a worker are capped at its share, so that workers times
+    OCR threads never exceeds the cores.
+    """
+
+    # cgroup v2 CPU quota of the container, e.g. '200000 100000' for two cores or 'max 100000'
+    CGROUP_CPU_MAX: str = '/sys/fs/cgroup/cpu.max'
+
+    def __init__(self, workers: int = 1, ocr_threads: int = 1, cores: Optional[int] = None):
+        """
+        Initialize the CPU budget.
+
+        Args:
+            workers (int): Number of OCR worker processes (1 when OCR runs in-process)
+            ocr_threads (int): OCR candidates each worker evaluates at the same
+                time; capped at the worker's share of the cores
+            cores (int): Cores to budget; detected with available_cores() when
+                not given or 0
+        """
+        self.logger: logging.Logger = logging.getLogger(__name__)
+        self.workers: int = max(1, workers)
+        self.cores: int = cores if cores and cores > 0 else self.available_cores()
+        self.ocr_threads: int = min(max(1, ocr_threads), self.per_worker)
+        if self.ocr_threads < ocr_threads:
+            self.logger.info(f"Capping OCR threads at {self.ocr_threads} per worker "
+                             f"({self.workers} workers on {self.cores} cores)")
+
+    @property
+    def per_worker(self) -> int:
+        """Cores of one OCR worker's share, at least 1."""
+        return max(1, self.cores // self.workers)
+
+    @classmethod
+    def available_cores(cls) -> int:
+        """
+        Count the cores this process may use.
+
+        Takes the CPU affinity mask (taskset, container cpusets) and the cgroup
+        CPU quota into account, which os.cpu_count() ignores on shared hosts.
+
+        Returns:
+            int: Number of usable cores, at least 1
+        """
+        try:
+            cores = len(os.sched_getaffinity(0))
+        except (AttributeError, OSError):
+            cores = os.cpu_count() or 1
+
+        try:
+            with open(cls.CGROUP_CPU_MAX) as f:
+                quota, period = f.read().split()[:2]
+            if quota != 'max':
+                cores = min(cores, max(1, int(int(quota) / int(period))))
+        except (OSError, ValueError):
+            pass
+
+        return max(1, cores)
+
+    def allocation(self) -> dict[str, int]:
+        """
+        Compute the thread counts of one process.
+
+        Returns:
+            dict: 'cores', 'workers' and the effective 'ocr_threads' budgeted,
+                and the thread counts 'opencv_threads', 'omp_thread_limit' (per
+                tesseract call) and 'torch_threads'
+        """
+        per_worker = self.per_worker
+        return {
+            'cores': self.cores,
+            'workers': self.workers,
+            'ocr_threads': self.ocr_threads,
+            'opencv_threads': per_worker,
+            'omp_thread_limit': max(1, per_worker // self.ocr_threads),
+            'torch_threads': per_worker
+        }
+
+    def apply(self) -> dict[str, Any]:
+        """
+        Apply the budget to the current process.
+
+        Returns:
+            dict: The effective allocation, as reported by apply_allocation()
+        """
+        return self.apply_allocation(self.allocation())
+
+    @classmethod
+    def apply_allocation(cls, allocation: dict[str, int]) -> dict[str, Any]:
+        """
+        Set the thread pools of the current process to an allocation.
+
+        OMP_THREAD_LIMIT applies to tesseract processes started afterwards and
+        to in-process tesseract loaded afterwards; torch is only configured
+        when it is already imported, so the budget never loads it.
+
+        Args:
+            allocation (dict): Thread counts from allocation(), e.g. computed in
+                the parent process and passed to a worker
+
+        Returns:
+            dict: The allocation with the effective 'opencv_threads' and
+                'torch_threads' read back from the libraries ('torch_threads'
+                is None without torch)
+        """
+        logger = logging.getLogger(__name__)
+        effective: dict[str, Any] = dict(allocation)
+
+        cv2.setNumThreads(int(allocation['opencv_threads']))
+        effective['opencv_threads'] = cv2.getNumThreads()
+
+        os.environ['OMP_THREAD_LIMIT'] = str(allocation['omp_thread_limit'])
+
+        torch = sys.modules.get('torch')
+        effective['torch_threads'] = None
+        if torch is not None:
+            try:
+                torch.set_num_threads(int(allocation['torch_threads']))
+                effective['torch_threads'] = torch.get_num_threads()
+            except Exception as e:
+                logger.warning(f"Could not set torch threads: {e}")
+
+        logger.info(
+            f"CPU budget: {effective['cores']} cores, {effective['workers']} workers x "
+            f"{effective['ocr_threads']} OCR threads; OpenCV {effective['opencv_threads']}, "
+            f"tesseract OMP {effective['omp_thread_limit']}, torch {effective['torch_threads']} threads"
+        )
+        return effective
@@ -0,0 +1,164 @@
+import json
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+
+class DiskCache:
+    """
+    Persistent key/value cache stored in SQLite with size-bounded LRU eviction
+    and optional expiry. Values must be JSON-serializable. The database can be
+    shared by several processes, so worker pools see each other's entries.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path (str): Path of the SQLite database file
+            max_bytes (int): Total size of stored values above which the least
+                recently used entries are evicted
+            ttl (float): Seconds after which a stored value expires; None keeps
+                values until they are evicted
+        """
+        self.logger: logging.Logger = logging.getLogger(__name__)
+        self.path: str = path
+        self.max_bytes: int = max_bytes
+        self.ttl: Optional[float] = ttl
+
+        # Counters for this instance; totals across processes live in the database
+        self.hits: int = 0
+        self.misses: int = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+            conn.execute("CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            # Caches created before entries could expire get the column added
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(entries)")}
+            if 'created' not in columns:
+                conn.execute("ALTER TABLE entries ADD COLUMN created REAL")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a transaction; one connection per operation keeps the cache thread- and fork-safe."""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a value and mark it as recently used.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            The cached value, or None on a miss or when it has expired
+        """
+        value = None
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT value, created FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is not None and self.ttl is not None and (row[1] or 0) < time.time() - self.ttl:
+                    conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                elif row is not None:
+                    value = json.loads(row[0])
+                    conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+                conn.execute(
+                    "INSERT INTO counters (name, value) VALUES (?, 1) "
+                    "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+                    ('hits' if value is not None else 'misses',)
+                )
+        except (sqlite3.Error, json.JSONDecodeError) as e:
+            self.logger.warning(f"Cache lookup failed: {e}")
+            value = None
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value, evicting least recently used entries if the cache is full.
+
+        Args:
+            key (str): Cache key
+            value: JSON-serializable value
+        """
+        serialized = json.dumps(value)
+        try:
+            with self._connect() as conn:
+                now = time.time()
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, size, last_access, created) VALUES (?, ?, ?, ?, ?)",
+                    (key, serialized, len(serialized), now, now)
+                )
+                self._evict(conn)
+        except sqlite3.Error as e:
+            self.logger.warning(f"Cache write failed: {e}")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete expired entries, then least recently used ones until the cache fits in max_bytes."""
+        if self.ttl is not None:
+            conn.execute("DELETE FROM entries WHERE COALESCE(created, 0) < ?", (time.time() - self.ttl,))
+
+        total_size = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total_size <= self.max_bytes:
+            return
+
+        evicted = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY last_access").fetchall():
+            if total_size <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total_size -= size
+        conn.executemany("DELETE FROM entries WHERE key = ?", evicted)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries")
+            conn.execute("DELETE FROM counters")
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get cache usage statistics.
+
+        Returns:
+            dict: Entry count and size, plus hit/miss counters for this
+                instance ('hits', 'misses') and for all processes
+                ('total_hits', 'total_misses', 'hit_rate')
+        """
+        with self._connect() as conn:
+            entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+            counters = dict(conn.execute("SELECT name, value FROM counters").fetchall())
+
+        total_hits = counters.get('hits', 0)
+        total_misses = counters.get('misses', 0)
+        lookups = total_hits + total_misses
+        return {
+            'entries': entries,
+            'size_bytes': size,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'total_hits': total_hits,
+            'total_misses': total_misses,
+            'hit_rate': total_hits / lookups if lookups else 0.0
+        }
@@ -0,0 +1,176 @@
+import logging
+import os
+from typing import IO, Iterator, Optional, Union
+
+from PIL import Image, ImageSequence
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    # Optional PDF renderer; pdf2image (poppler) is used when it is missing
+    pdfium = None
+
+try:
+    import pdf2image
+except ImportError:
+    pdf2image = None
+
+
+# File extensions read as multi-page documents
+DOCUMENT_EXTENSIONS: frozenset[str] = frozenset({'.pdf', '.tif', '.tiff'})
+
+
+class DocumentLoader:
+    """
+    Streams the pages of multi-page PDF and TIFF documents one at a time, so a
+    long scanned practice test is never held in memory as a whole.
+    """
+
+    def __init__(self, dpi: int = 300):
+        """
+        Initialize the document loader.
+
+        Args:
+            dpi (int): Resolution that PDF pages are rendered at
+        """
+        self.logger: logging.Logger = logging.getLogger(__name__)
+        self.dpi: int = dpi
+
+    @staticmethod
+    def is_document(filename: str) -> bool:
+        """Check if a file is a multi-page document format."""
+        _, ext = os.path.splitext(filename.lower())
+        return ext in DOCUMENT_EXTENSIONS
+
+    @classmethod
+    def is_multi_page(cls, filename: str, source: Optional[Union[str, IO[bytes]]] = None) -> bool:
+        """
+        Check if a file has more than one page and should be split into page images.
+
+        PDFs always are; a TIFF only when it holds more than one frame, so a
+        single-page TIFF is handled like any other image.
+
+        Args:
+            filename (str): Name of the file, used for its extension
+            source (str | file): Path or open binary file to count the frames
+                of; defaults to filename. The position of an open file is kept
+
+        Returns:
+            bool: True if the file is a PDF or a multi-frame TIFF
+        """
+        if not cls.is_document(filename):
+            return False
+        if cls._is_pdf(filename):
+            return True
+
+        source = filename if source is None else source
+        position = source.tell() if hasattr(source, 'tell') else None
+        if position is not None:
+            source.seek(0)
+        try:
+            with Image.open(source) as image:
+                return getattr(image, 'n_frames', 1) > 1
+        finally:
+            if position is not None:
+                source.seek(position)
+
+    def page_count(self, path: str) -> int:
+        """
+        Count the pages of a document without rendering them.
+
+        Args:
+            path (str): Path to the PDF or TIFF file
+
+        Returns:
+            int: Number of pages
+        """
+        if self._is_pdf(path):
+            if pdfium is not None:
+                pdf = pdfium.PdfDocument(path)
+                try:
+                    return len(pdf)
+                finally:
+                    pdf.close()
+            if pdf2image is not None:
+                return int(pdf2image.pdfinfo_from_path(path)['Pages'])
+            raise ImportError("PDF support requires pypdfium2 or pdf2image")
+
+        with Image.open(path) as image:
+            return getattr(image, 'n_frames', 1)
+
+    def iter_pages(self, path: str) -> Iterator[tuple[int, Image.Image]]:
+        """
+        Yield the pages of a document one at a time.
+
+        Args:
+            path (str): Path to the PDF or TIFF file
+
+        Yields:
+            tuple: (1-based page number, page image)
+        """
+        if not self._is_pdf(path):
+            with Image.open(path) as image:
+                # Frames are decoded one by one as the sequence is advanced
+                for index, frame in enumerate(ImageSequence.Iterator(image)):
+                    yield index + 1, frame.copy()
+            return
+
+        if pdfium is not None:
+            pdf = pdfium.PdfDocument(path)
+            try:
+                for index in range(len(pdf)):
+                    page = pdf[index]
+                    try:
+                        yield index + 1, page.render(scale=self.dpi / 72).to_pil()
+                    finally:
+                        page.close()
+            finally:
+                pdf.close()
+            return
+
+        if pdf2image is not None:
+            for page_number in range(1, self.page_count(path) + 1):
+                pages = pdf2image.convert_from_path(path, dpi=self.dpi, first_page=page_number, last_page=page_number)
+                if pages:
+                    yield page_number, pages[0]
+            return
+
+        raise ImportError("PDF support requires pypdfium2 or pdf2image")
+
+    def save_pages(self, path: str, output_dir: str, source_document: Optional[str] = None) -> Iterator[tuple[int, str]]:
+        """
+        Write each page of a document to a PNG file as soon as it is read.
+
+        Pages are named after the document, e.g. 'test_page003.png'.
+
+        Args:
+            path (str): Path to the PDF or TIFF file
+            output_dir (str): Directory the page images are written to
+            source_document (str): Name of the original document the page
+                names are derived from; defaults to the file name of path
+
+        Yields:
+            tuple: (1-based page number, path of the saved page image)
+        """
+        source_document = source_document or os.path.basename(path)
+        base_name = os.path.splitext(os.path.basename(source_document))[0]
+
+        for page_number, page in self.iter_pages(path):
+            filename = f"{base_name}_page{page_number:03d}.png"
+            page_path = os.path.join(output_dir, filename)
+            try:
+                if page.mode not in ('RGB', 'L'):
+                    page = page.convert('RGB')
+                page.save(page_path)
+            except Exception as e:
+                self.logger.error(f"Could not save page {page_number} of {source_document}: {e}")
+                continue
+            finally:
+                page.close()
+
+            yield page_number, page_path
+
+    @staticmethod
+    def _is_pdf(path: str) -> bool:
+        """Check if a document is a PDF."""
+        return path.lower().endswith('.pdf')
@@ -0,0 +1,86 @@
+import logging
+import os
+import threading
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.utils import load_config
+
+# Defaults of the 'http' config section
+DEFAULT_HTTP_SETTINGS: dict[str, Any] = {
+    'pool_connections': 4,
+    'pool_maxsize': 10,
+    'pool_block': True,
+    'max_retries': 2
+}
+
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+_lock = threading.Lock()
+
+
+def create_session(http_settings: Optional[dict[str, Any]] = None) -> requests.Session:
+    """
+    Create a requests session with pooled keep-alive connections.
+
+    Args:
+        http_settings (dict): 'pool_connections' (hosts whose pools are kept),
+            'pool_maxsize' (open connections per host), 'pool_block' (wait for
+            a free connection instead of opening one beyond pool_maxsize) and
+            'max_retries' (retries of failed connection attempts)
+
+    Returns:
+        requests.Session: Session mounting the pooled adapter for http and https
+    """
+    settings = {**DEFAULT_HTTP_SETTINGS, **(http_settings or {})}
+
+    # Only connection failures are retried; a request that reached the API may have been billed
+    max_retries = int(settings['max_retries'])
+    retry = Retry(total=max_retries, connect=max_retries, read=0, status=0, backoff_factor=0.3)
+
+    adapter = HTTPAdapter(
+        pool_connections=int(settings['pool_connections']),
+        pool_maxsize=int(settings['pool_maxsize']),
+        pool_block=bool(settings['pool_block']),
+        max_retries=retry
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Get the session shared by all HTTP clients of this process.
+
+    The session is created from the 'http' config section on first use, so
+    every AIProcessor reuses the same warm connections. A process forked after
+    the session was created gets its own, since pooled sockets cannot be shared
+    across processes.
+
+    Returns:
+        requests.Session: The shared session
+    """
+    global _session, _session_pid
+    with _lock:
+        if _session is None or _session_pid != os.getpid():
+            try:
+                http_settings = load_config().get('http', {})
+            except Exception as e:
+                logging.getLogger(__name__).warning(f"Using default HTTP settings due to error: {e}")
+                http_settings = {}
+            _session, _session_pid = create_session(http_settings), os.getpid()
+        return _session
+
+
+def close_session() -> None:
+    """Close the shared session and its pooled connections; the next get_session() creates a new one."""
+    global _session, _session_pid
+    with _lock:
+        if _session is not None and _session_pid == os.getpid():
+            _session.close()
+        _session, _session_pid = None, None
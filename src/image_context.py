@@ -0,0 +1,156 @@
+import hashlib
+import os
+from functools import cached_property
+from typing import IO, Optional
+
+import cv2
+import numpy as np
+from PIL import Image
+
+# EXIF tag holding the camera orientation of a photo
+EXIF_ORIENTATION_TAG = 274
+
+
+def hash_file(f: IO[bytes]) -> str:
+    """
+    Get the SHA-256 of a binary file's contents, read from the start in chunks.
+
+    Args:
+        f (IO[bytes]): Open binary file, e.g. an uploaded file
+
+    Returns:
+        str: Hex digest, equal to ImageAnalysisContext.content_hash of the saved file
+    """
+    digest = hashlib.sha256()
+    f.seek(0)
+    for chunk in iter(lambda: f.read(1024 * 1024), b''):
+        digest.update(chunk)
+    f.seek(0)
+    return digest.hexdigest()
+
+
+class ImageAnalysisContext:
+    """
+    Decoded image shared by OCR, quality assessment and orientation detection.
+    The file is decoded once and intermediates such as the grayscale array and
+    its blurred copies are computed on first use and then reused by every
+    consumer.
+    """
+
+    # Long side, in pixels, of the downscaled copy used to estimate text height
+    TEXT_HEIGHT_SAMPLE_SIZE: int = 1600
+
+    # Minimum number of character-like components needed for a text height estimate
+    MIN_TEXT_COMPONENTS: int = 15
+
+    def __init__(self, image_path: Optional[str] = None, image: Optional[Image.Image] = None):
+        """
+        Initialize the context from a file path or an already opened image.
+
+        Args:
+            image_path (str): Path to the image file
+            image (Image.Image): Opened image, used instead of reading image_path
+        """
+        if image_path is None and image is None:
+            raise ValueError("An image path or image is required")
+        if image is None and not os.path.exists(image_path):
+            raise FileNotFoundError(f"Image file not found: {image_path}")
+
+        self.image_path: Optional[str] = image_path
+        self._image: Optional[Image.Image] = image
+        self._blurred: dict[int, np.ndarray] = {}
+
+    def __repr__(self) -> str:
+        return f"ImageAnalysisContext({self.image_path or '<in-memory image>'})"
+
+    @cached_property
+    def content_hash(self) -> str:
+        """SHA-256 of the file bytes, or of the decoded pixels for in-memory images."""
+        if self.image_path is not None:
+            with open(self.image_path, 'rb') as f:
+                return hash_file(f)
+        digest = hashlib.sha256()
+        digest.update(str(self.gray.shape).encode())
+        digest.update(self.gray.tobytes())
+        return digest.hexdigest()
+
+    @cached_property
+    def exif_orientation(self) -> Optional[int]:
+        """EXIF Orientation tag of the original image, or None when it has none."""
+        try:
+            if self._image is not None:
+                return self._image.getexif().get(EXIF_ORIENTATION_TAG)
+            if self.image_path is not None:
+                # Only the header is read; the pixels are not decoded
+                with Image.open(self.image_path) as image:
+                    return image.getexif().get(EXIF_ORIENTATION_TAG)
+        except Exception:
+            pass
+        return None
+
+    @cached_property
+    def gray(self) -> np.ndarray:
+        """Grayscale pixels as a uint8 array."""
+        if self._image is not None:
+            # In-memory images keep their EXIF only until they are released below
+            self.exif_orientation
+        image = self._image if self._image is not None else Image.open(self.image_path)
+        gray = np.array(image.convert('L'))
+        # The decoded original is not needed once the grayscale copy exists
+        self._image = None
+        return gray
+
+    @cached_property
+    def gray_image(self) -> Image.Image:
+        """Grayscale image as a PIL image sharing the decoded pixels."""
+        return Image.fromarray(self.gray)
+
+    @cached_property
+    def edges(self) -> np.ndarray:
+        """Canny edge map used for quality assessment of images within its sample size."""
+        return cv2.Canny(self.gray, 50, 150, apertureSize=3)
+
+    @cached_property
+    def text_height(self) -> Optional[float]:
+        """
+        Estimated typical character height in pixels of the full-size image.
+
+        Measured as the median height of character-sized connected components
+        of an Otsu-binarized, downscaled copy. None when too few character-like
+        components are found to give a reliable estimate.
+        """
+        gray = self.gray
+        factor = min(1.0, self.TEXT_HEIGHT_SAMPLE_SIZE / max(gray.shape))
+        sample = cv2.resize(gray, None, fx=factor, fy=factor, interpolation=cv2.INTER_AREA) if factor < 1.0 else gray
+
+        # Dark text on a light background becomes white components
+        _, binary = cv2.threshold(sample, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+        _, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+
+        # Skip the background component and keep glyph-shaped, reasonably filled components
+        widths = stats[1:, cv2.CC_STAT_WIDTH]
+        heights = stats[1:, cv2.CC_STAT_HEIGHT]
+        areas = stats[1:, cv2.CC_STAT_AREA]
+        is_character = (
+            (heights >= 6) & (heights <= sample.shape[0] / 8) &
+            (widths <= heights * 3) & (widths * 7 >= heights) &
+            (areas >= 0.1 * widths * heights)
+        )
+        if np.count_nonzero(is_character) < self.MIN_TEXT_COMPONENTS:
+            return None
+
+        return float(np.median(heights[is_character])) / factor
+
+    def blurred(self, kernel_size: int = 5) -> np.ndarray:
+        """
+        Gaussian-blurred grayscale pixels.
+
+        Args:
+            kernel_size (int): Size of the square Gaussian kernel
+
+        Returns:
+            np.ndarray: Blurred uint8 array, cached per kernel size
+        """
+        if kernel_size not in self._blurred:
+            self._blurred[kernel_size] = cv2.GaussianBlur(self.gray, (kernel_size, kernel_size), 0)
+        return self._blurred[kernel_size]
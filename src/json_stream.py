@@ -0,0 +1,156 @@
+import json
+from typing import Any, Optional
+
+
+class JSONFieldStream:
+    """
+    Incremental extractor of the top-level fields of a JSON object that
+    arrives in chunks, such as a streamed model response. Text before the
+    object (e.g. reasoning output) is skipped, and a brace that turns out not
+    to start a JSON object is passed over. Each field becomes available as
+    soon as its value is complete, and the decoded prefix of a string value
+    that is still arriving can be read with partial().
+    """
+
+    def __init__(self):
+        """Initialize an empty stream."""
+        self.fields: dict[str, Any] = {}
+        self.complete: bool = False
+
+        self._buffer: str = ''
+        self._pos: int = 0
+        self._depth: int = 0
+        self._in_string: bool = False
+        self._escape: bool = False
+
+        # Parser state of the top-level object: 'key', 'colon', 'value', 'in_value' or 'comma'
+        self._object_start: int = 0
+        self._expect: str = 'key'
+        self._key: Optional[str] = None
+        self._token_start: int = 0
+        self._string_value: bool = False
+
+    def feed(self, chunk: str) -> dict[str, Any]:
+        """
+        Add the next chunk of the response.
+
+        Args:
+            chunk (str): Next piece of the response text
+
+        Returns:
+            dict: Fields whose values were completed by this chunk
+        """
+        completed: dict[str, Any] = {}
+        self._buffer += chunk
+
+        while self._pos < len(self._buffer) and not self.complete:
+            char = self._buffer[self._pos]
+
+            if self._depth == 0:
+                # Skip everything before the object starts
+                if char == '{':
+                    self._depth, self._expect, self._object_start = 1, 'key', self._pos
+            elif self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._expect == 'key':
+                        self._key = self._decode(self._buffer[self._token_start:self._pos + 1])
+                        self._expect = 'colon'
+                    elif self._depth == 1 and self._string_value:
+                        self._complete_value(self._pos + 1, completed)
+            elif char == '"':
+                self._in_string = True
+                if self._depth == 1 and self._expect in ('key', 'value'):
+                    self._string_value = self._expect == 'value'
+                    self._token_start = self._pos
+                    if self._string_value:
+                        self._expect = 'in_value'
+            elif char in '{[':
+                if self._depth == 1 and self._expect == 'value':
+                    self._token_start, self._string_value, self._expect = self._pos, False, 'in_value'
+                self._depth += 1
+            elif char in '}]':
+                self._depth -= 1
+                if self._depth == 1 and self._expect == 'in_value':
+                    # A nested object or array value closed
+                    self._complete_value(self._pos + 1, completed)
+                elif self._depth == 0:
+                    if self._expect == 'in_value':
+                        # The last value was a number, boolean or null
+                        self._complete_value(self._pos, completed)
+                    # An empty object (e.g. '{}' in reasoning text) is skipped
+                    self.complete = bool(self.fields)
+            elif self._depth == 1:
+                if char == ':' and self._expect == 'colon':
+                    self._expect = 'value'
+                elif char == ',' and self._expect == 'in_value':
+                    self._complete_value(self._pos, completed)
+                    self._expect = 'key'
+                elif char == ',' and self._expect == 'comma':
+                    self._expect = 'key'
+                elif self._expect == 'value' and not char.isspace():
+                    self._token_start, self._string_value, self._expect = self._pos, False, 'in_value'
+                elif self._expect != 'in_value' and not char.isspace():
+                    # Not a JSON object after all; look for the next one
+                    self._restart(completed)
+
+            self._pos += 1
+
+        return completed
+
+    def _restart(self, completed: dict[str, Any]) -> None:
+        """Discard the object being parsed and resume scanning after its opening brace."""
+        for key in self.fields:
+            completed.pop(key, None)
+        self.fields = {}
+        self._pos = self._object_start
+        self._depth = 0
+        self._in_string = self._escape = False
+        self._key = None
+
+    def _complete_value(self, end: int, completed: dict[str, Any]) -> None:
+        """Decode the value of the current key ending before end and record it."""
+        raw = self._buffer[self._token_start:end].strip()
+        value = self._decode(raw)
+        if self._key is not None and (value is not None or raw == 'null'):
+            self.fields[self._key] = value
+            completed[self._key] = value
+        self._key = None
+        self._expect = 'comma'
+
+    @staticmethod
+    def _decode(raw: str) -> Any:
+        """Decode a JSON value, or None if it is malformed."""
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            return None
+
+    def partial(self, key: str) -> Optional[str]:
+        """
+        Get the value of a string field so far.
+
+        Args:
+            key (str): Field name
+
+        Returns:
+            str: The complete value if the field is complete, the decoded prefix
+                if its string value is still arriving, otherwise None
+        """
+        if key in self.fields:
+            value = self.fields[key]
+            return value if isinstance(value, str) else None
+        if not (self._in_string and self._string_value and self._depth == 1 and self._key == key):
+            return None
+
+        # Drop a trailing incomplete escape sequence (at most '\uXXX') until the prefix decodes
+        raw = self._buffer[self._token_start + 1:self._pos]
+        for cut in range(min(6, len(raw)) + 1):
+            value = self._decode('"' + raw[:len(raw) - cut] + '"')
+            if value is not None:
+                return value
+        return None
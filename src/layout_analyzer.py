@@ -0,0 +1,136 @@
+import logging
+from typing import Any, Optional
+
+import cv2
+import numpy as np
+
+
+class LayoutAnalyzer:
+    """
+    Finds text blocks on a page with morphology and contours and orders them
+    for reading. Used to OCR only the inked parts of worksheet photos and to
+    keep multi-column layouts from being read across the columns.
+    """
+
+    def __init__(self, padding: float = 0.5, min_region_lines: float = 0.6):
+        """
+        Initialize the layout analyzer.
+
+        Args:
+            padding (float): Margin added around each region, in text heights
+            min_region_lines (float): Regions shorter than this many text
+                heights are treated as noise
+        """
+        self.logger: logging.Logger = logging.getLogger(__name__)
+        self.padding: float = padding
+        self.min_region_lines: float = min_region_lines
+
+    def detect_regions(self, gray: np.ndarray, text_height: Optional[float] = None) -> list[dict[str, Any]]:
+        """
+        Detect text blocks in a grayscale page image.
+
+        Args:
+            gray (np.ndarray): Grayscale page, dark text on a light background
+            text_height (float): Typical character height in pixels; estimated
+                from the page size when unknown
+
+        Returns:
+            list: Regions in reading order, each with 'left', 'top', 'width',
+                'height' (padded pixel box), 'lines' (estimated line count)
+                and 'psm' (tesseract config suited to the region)
+        """
+        page_height, page_width = gray.shape
+        if not text_height:
+            text_height = max(page_height, page_width) / 100.0
+
+        # Binarize, then smear characters into words and lines into blocks;
+        # the kernel is smaller than a typical column gap so columns stay apart
+        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+        kernel = cv2.getStructuringElement(
+            cv2.MORPH_RECT,
+            (max(3, int(text_height * 1.2)), max(3, int(text_height * 1.0)))
+        )
+        blocks = cv2.dilate(binary, kernel)
+        contours, _ = cv2.findContours(blocks, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+        min_height = text_height * self.min_region_lines
+        boxes = []
+        for contour in contours:
+            x, y, w, h = cv2.boundingRect(contour)
+            if h < min_height or w < text_height:
+                continue
+            # Drop page-sized blobs such as photo borders and shadows
+            if w > page_width * 0.98 and h > page_height * 0.98:
+                continue
+            boxes.append((x, y, x + w, y + h))
+
+        regions = []
+        pad = int(text_height * self.padding)
+        for x1, y1, x2, y2 in self._reading_order(boxes, text_height):
+            x1, y1 = max(0, x1 - pad), max(0, y1 - pad)
+            x2, y2 = min(page_width, x2 + pad), min(page_height, y2 + pad)
+            lines = max(1, int(round((y2 - y1 - 2 * pad) / (text_height * 1.8))))
+            regions.append({
+                'left': x1,
+                'top': y1,
+                'width': x2 - x1,
+                'height': y2 - y1,
+                'lines': lines,
+                'psm': '--psm 7' if lines == 1 else '--psm 6'  # Single line / uniform block
+            })
+
+        return regions
+
+    def _reading_order(self, boxes: list[tuple[int, int, int, int]], text_height: float) -> list[tuple[int, int, int, int]]:
+        """
+        Order boxes for reading with a recursive XY-cut.
+
+        Boxes are split into sections at wide horizontal whitespace (top to
+        bottom) first, then into columns at vertical gutters (left to right).
+        Gaps are measured in text heights so ordinary line spacing inside a
+        column never splits it into rows.
+
+        Args:
+            boxes (list): (x1, y1, x2, y2) boxes
+            text_height (float): Typical character height in pixels
+
+        Returns:
+            list: The same boxes in reading order
+        """
+        if len(boxes) <= 1:
+            return list(boxes)
+
+        for axis, min_gap in ((1, text_height * 2), (0, text_height)):
+            groups = self._split_by_gap(boxes, axis, min_gap)
+            if len(groups) > 1:
+                ordered = []
+                for group in groups:
+                    ordered.extend(self._reading_order(group, text_height))
+                return ordered
+
+        return sorted(boxes, key=lambda box: (box[1], box[0]))
+
+    def _split_by_gap(self, boxes: list[tuple[int, int, int, int]], axis: int,
+                      min_gap: float) -> list[list[tuple[int, int, int, int]]]:
+        """
+        Group boxes whose projections on an axis are separated by less than min_gap.
+
+        Args:
+            boxes (list): (x1, y1, x2, y2) boxes
+            axis (int): 0 to project on x, 1 to project on y
+            min_gap (float): Smallest whitespace gap, in pixels, that separates groups
+
+        Returns:
+            list: Groups of boxes, ordered along the axis
+        """
+        groups: list[list[tuple[int, int, int, int]]] = []
+        group_end = None
+        for box in sorted(boxes, key=lambda b: b[axis]):
+            start, end = box[axis], box[axis + 2]
+            if group_end is None or start - group_end >= min_gap:
+                groups.append([box])
+                group_end = end
+            else:
+                groups[-1].append(box)
+                group_end = max(group_end, end)
+        return groups
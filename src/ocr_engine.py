@@ -0,0 +1,371 @@
+import logging
+import os
+import re
+import shlex
+import subprocess
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+import pytesseract
+from PIL import Image
+
+try:
+    import tesserocr
+except ImportError:
+    # Optional persistent backend; pytesseract is used when it is missing
+    tesserocr = None
+
+
+class OCREngine:
+    """
+    Interface for the OCR engines used by OCRProcessor.
+    Engines take in-memory PIL images and tesseract-style config strings.
+    """
+
+    name: str = 'base'
+
+    def image_to_data(self, image: Image.Image, config: str = '') -> dict[str, list[Any]]:
+        """
+        Recognize text and return word-level data.
+
+        Args:
+            image (Image.Image): Image to recognize
+            config (str): Tesseract configuration string (e.g. '--psm 6')
+
+        Returns:
+            dict: Columns in pytesseract's Output.DICT layout ('text', 'conf',
+                'left', 'top', 'width', 'height', 'block_num', 'par_num',
+                'line_num', 'word_num')
+        """
+        raise NotImplementedError
+
+    def image_to_data_batch(self, images: list[Image.Image], config: str = '') -> list[dict[str, list[Any]]]:
+        """
+        Recognize many images with the same config and return word-level data for each.
+
+        Engines with a per-call startup cost override this to recognize all
+        images in one invocation; the default recognizes them one by one.
+
+        Args:
+            images (list): Images to recognize
+            config (str): Tesseract configuration string shared by all images
+
+        Returns:
+            list: One image_to_data dictionary per image, in input order
+        """
+        return [self.image_to_data(image, config=config) for image in images]
+
+    def image_to_string(self, image: Image.Image, config: str = '') -> str:
+        """
+        Recognize text and return it as a plain string.
+
+        Args:
+            image (Image.Image): Image to recognize
+            config (str): Tesseract configuration string
+
+        Returns:
+            str: Recognized text
+        """
+        raise NotImplementedError
+
+    def image_to_osd(self, image: Image.Image) -> str:
+        """
+        Run orientation and script detection.
+
+        Args:
+            image (Image.Image): Image to analyze
+
+        Returns:
+            str: OSD report in tesseract's text format (includes a 'Rotate:' line)
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any resources held by the engine."""
+        pass
+
+
+class PytesseractEngine(OCREngine):
+    """Engine that runs a tesseract subprocess for every call via pytesseract."""
+
+    name: str = 'pytesseract'
+
+    def __init__(self, lang: str = 'eng', tessdata_dir: Optional[str] = None):
+        """
+        Initialize the engine.
+
+        Args:
+            lang (str): Tesseract language(s), e.g. 'eng'
+            tessdata_dir (str): Optional directory holding the traineddata files
+        """
+        self.lang: str = lang
+        self.tessdata_dir: Optional[str] = tessdata_dir
+
+    def _config(self, config: str) -> str:
+        """Add engine-wide options to a call's config string."""
+        if self.tessdata_dir:
+            return f'--tessdata-dir "{self.tessdata_dir}" {config}'.strip()
+        return config
+
+    def image_to_data(self, image: Image.Image, config: str = '') -> dict[str, list[Any]]:
+        data = pytesseract.image_to_data(image, lang=self.lang, config=self._config(config),
+                                         output_type=pytesseract.Output.DICT)
+        if not isinstance(data, dict):
+            raise ValueError("Invalid data format from pytesseract")
+        return data
+
+    def image_to_data_batch(self, images: list[Image.Image], config: str = '') -> list[dict[str, list[Any]]]:
+        """
+        Recognize many images in a single tesseract process.
+
+        The images are listed in a text file that tesseract reads as the pages
+        of one document, so the process start and model load are paid once for
+        the whole batch; the TSV output is split back per image by page number.
+        """
+        if len(images) <= 1:
+            return [self.image_to_data(image, config=config) for image in images]
+
+        with tempfile.TemporaryDirectory(prefix='ocr_batch_') as temp_dir:
+            list_path = os.path.join(temp_dir, 'images.txt')
+            with open(list_path, 'w', encoding='utf-8') as list_file:
+                for index, image in enumerate(images):
+                    image_path = os.path.join(temp_dir, f'{index:05d}.png')
+                    image.save(image_path)
+                    list_file.write(image_path + '\n')
+
+            output_base = os.path.join(temp_dir, 'output')
+            command = [pytesseract.pytesseract.tesseract_cmd, list_path, output_base, '-l', self.lang]
+            command += shlex.split(self._config(config)) + ['tsv']
+            process = subprocess.run(command, capture_output=True)
+            if process.returncode != 0:
+                raise pytesseract.TesseractError(process.returncode, process.stderr.decode('utf-8', 'replace').strip())
+
+            with open(output_base + '.tsv', encoding='utf-8') as tsv_file:
+                return self._split_tsv(tsv_file.read(), len(images))
+
+    @staticmethod
+    def _split_tsv(tsv: str, page_count: int) -> list[dict[str, list[Any]]]:
+        """
+        Split tesseract's TSV output of a multi-page run into one dictionary per page.
+
+        Args:
+            tsv (str): TSV output with a header row
+            page_count (int): Number of pages (images) in the run
+
+        Returns:
+            list: Dictionaries in pytesseract's Output.DICT layout, by page
+        """
+        lines = tsv.splitlines()
+        header = lines[0].split('\t') if lines else []
+        pages: list[dict[str, list[Any]]] = [{column: [] for column in header} for _ in range(page_count)]
+
+        for line in lines[1:]:
+            # The text column is last and may be missing for non-word rows
+            values = line.split('\t', len(header) - 1)
+            values += [''] * (len(header) - len(values))
+            row = dict(zip(header, values))
+            page_index = int(row['page_num']) - 1
+            if not 0 <= page_index < page_count:
+                continue
+            for column, value in row.items():
+                if column == 'text':
+                    pages[page_index][column].append(value)
+                elif column == 'conf':
+                    pages[page_index][column].append(float(value))
+                else:
+                    pages[page_index][column].append(int(value))
+
+        return pages
+
+    def image_to_string(self, image: Image.Image, config: str = '') -> str:
+        raw_text = pytesseract.image_to_string(image, lang=self.lang, config=self._config(config))
+        return str(raw_text) if isinstance(raw_text, (bytes, dict)) else raw_text
+
+    def image_to_osd(self, image: Image.Image) -> str:
+        osd = pytesseract.image_to_osd(image, config=self._config(''))
+        return str(osd) if isinstance(osd, (bytes, dict)) else osd
+
+
+class TesserocrEngine(OCREngine):
+    """
+    Engine that keeps tesseract loaded in-process through tesserocr.
+    API handles are kept in a pool and reused by later calls from any thread,
+    so traineddata is loaded once per concurrent call instead of once per
+    call, and the pool never grows beyond the peak number of concurrent calls.
+    """
+
+    name: str = 'tesserocr'
+
+    def __init__(self, lang: str = 'eng', tessdata_dir: Optional[str] = None):
+        """
+        Initialize the engine.
+
+        Args:
+            lang (str): Tesseract language(s), e.g. 'eng'
+            tessdata_dir (str): Optional directory holding the traineddata files
+        """
+        if tesserocr is None:
+            raise ImportError("tesserocr is not installed")
+
+        self.lang: str = lang
+        self.tessdata_dir: Optional[str] = tessdata_dir
+        self._lock: threading.Lock = threading.Lock()
+        self._handles: list[Any] = []
+
+        # Idle handles by kind ('ocr' or 'osd'), ready for the next call
+        self._idle: dict[str, list[Any]] = {'ocr': [], 'osd': []}
+
+    def _create_handle(self, kind: str) -> Any:
+        """Create and register a tesseract API handle for recognition or orientation detection."""
+        kwargs: dict[str, Any] = {'lang': self.lang} if kind == 'ocr' else {'lang': 'osd', 'psm': tesserocr.PSM.OSD_ONLY}
+        if self.tessdata_dir:
+            kwargs['path'] = self.tessdata_dir
+        handle = tesserocr.PyTessBaseAPI(**kwargs)
+        with self._lock:
+            self._handles.append(handle)
+        return handle
+
+    @contextmanager
+    def _handle(self, kind: str) -> Iterator[Any]:
+        """Borrow an idle handle of a kind, creating one only when all are in use."""
+        with self._lock:
+            handle = self._idle[kind].pop() if self._idle[kind] else None
+        if handle is None:
+            handle = self._create_handle(kind)
+        try:
+            yield handle
+        finally:
+            with self._lock:
+                self._idle[kind].append(handle)
+
+    @contextmanager
+    def _prepare(self, image: Image.Image, config: str) -> Iterator[Any]:
+        """
+        Borrow a recognition handle with a config string applied and an image loaded.
+
+        Variables set with '-c name=value' are restored when the call ends,
+        since Clear() keeps them and the handle is reused by later calls.
+        """
+        with self._handle('ocr') as api:
+            overridden: dict[str, str] = {}
+            try:
+                psm_match = re.search(r'--psm\s+(\d+)', config)
+                api.SetPageSegMode(int(psm_match.group(1)) if psm_match else tesserocr.PSM.AUTO)
+                for name, value in re.findall(r'-c\s+(\w+)=(\S+)', config):
+                    if name not in overridden:
+                        previous = api.GetVariableAsString(name)
+                        if previous is not None:
+                            overridden[name] = previous
+                    api.SetVariable(name, value)
+
+                api.SetImage(image)
+                yield api
+            finally:
+                for name, value in overridden.items():
+                    api.SetVariable(name, value)
+                api.Clear()
+
+    def image_to_data(self, image: Image.Image, config: str = '') -> dict[str, list[Any]]:
+        with self._prepare(image, config) as api:
+            api.Recognize()
+            return self._collect_words(api)
+
+    @staticmethod
+    def _collect_words(api: Any) -> dict[str, list[Any]]:
+        """Read the recognized words of a handle into pytesseract's Output.DICT layout."""
+
+        data: dict[str, list[Any]] = {key: [] for key in (
+            'text', 'conf', 'left', 'top', 'width', 'height',
+            'block_num', 'par_num', 'line_num', 'word_num'
+        )}
+        block_num = par_num = line_num = word_num = 0
+        level = tesserocr.RIL.WORD
+
+        for word in tesserocr.iterate_level(api.GetIterator(), level):
+            box = word.BoundingBox(level)
+            if box is None:
+                continue
+
+            # Keep pytesseract-style numbering of blocks, paragraphs and lines
+            if word.IsAtBeginningOf(tesserocr.RIL.BLOCK):
+                block_num, par_num, line_num, word_num = block_num + 1, 0, 0, 0
+            if word.IsAtBeginningOf(tesserocr.RIL.PARA):
+                par_num, line_num, word_num = par_num + 1, 0, 0
+            if word.IsAtBeginningOf(tesserocr.RIL.TEXTLINE):
+                line_num, word_num = line_num + 1, 0
+            word_num += 1
+
+            x1, y1, x2, y2 = box
+            data['text'].append(word.GetUTF8Text(level) or '')
+            data['conf'].append(word.Confidence(level))
+            data['left'].append(x1)
+            data['top'].append(y1)
+            data['width'].append(x2 - x1)
+            data['height'].append(y2 - y1)
+            data['block_num'].append(block_num)
+            data['par_num'].append(par_num)
+            data['line_num'].append(line_num)
+            data['word_num'].append(word_num)
+
+        return data
+
+    def image_to_string(self, image: Image.Image, config: str = '') -> str:
+        with self._prepare(image, config) as api:
+            return api.GetUTF8Text()
+
+    def image_to_osd(self, image: Image.Image) -> str:
+        with self._handle('osd') as api:
+            api.SetImage(image)
+            osd = api.DetectOrientationScript()
+            api.Clear()
+        if not osd:
+            raise RuntimeError("Orientation detection failed")
+
+        orient_deg = int(osd['orient_deg'])
+        return (
+            f"Orientation in degrees: {orient_deg}\n"
+            f"Rotate: {(360 - orient_deg) % 360}\n"
+            f"Orientation confidence: {osd['orient_conf']:.2f}\n"
+            f"Script: {osd['script_name']}\n"
+            f"Script confidence: {osd['script_conf']:.2f}\n"
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            for handle in self._handles:
+                handle.End()
+            self._handles = []
+            self._idle = {'ocr': [], 'osd': []}
+
+
+# Available engines by configuration name
+ENGINES: dict[str, type[OCREngine]] = {
+    'pytesseract': PytesseractEngine,
+    'tesserocr': TesserocrEngine,
+}
+
+
+def create_engine(name: str = 'pytesseract', lang: str = 'eng', tessdata_dir: Optional[str] = None) -> OCREngine:
+    """
+    Create an OCR engine by name.
+
+    Falls back to the pytesseract engine when an optional backend is not installed.
+
+    Args:
+        name (str): Engine name, one of ENGINES
+        lang (str): Tesseract language(s)
+        tessdata_dir (str): Optional directory holding the traineddata files
+
+    Returns:
+        OCREngine: Engine instance
+    """
+    if name not in ENGINES:
+        raise ValueError(f"Unknown OCR engine: {name}")
+
+    try:
+        return ENGINES[name](lang=lang, tessdata_dir=tessdata_dir)
+    except ImportError as e:
+        logging.getLogger(__name__).warning(f"OCR engine '{name}' unavailable ({e}), using pytesseract")
+        return PytesseractEngine(lang=lang, tessdata_dir=tessdata_dir)
@@ -1,95 +1,280 @@
-import pytesseract
 from PIL import Image
 import cv2
 import numpy as np
-import os
 import logging
+import os
 import re
-from typing import Any
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import IO, Any, Optional, Union
+
+from src.cpu_budget import CPUBudget
+from src.disk_cache import DiskCache
+from src.image_context import ImageAnalysisContext
+from src.layout_analyzer import LayoutAnalyzer
+from src.ocr_engine import OCREngine, create_engine
+from src.ocr_telemetry import OCRTelemetry
+from src.preprocessing import LazyVariants, VariantFunction, resolve_variant
+from src import preprocessing
+from src.word_data import WordBoxes
+from src.yield_predictor import YieldPredictor
 
 class OCRProcessor:
     """
-    Enhanced OCR Processor for extracting text from images using pytesseract.
+    Enhanced OCR Processor for extracting text from images with tesseract.
     Optimized for SAT/ACT study materials with advanced preprocessing.
     """
 
-    def __init__(self):
-        """Initialize OCR processor."""
+    # Preprocessing variants tried by default, in order (see src.preprocessing)
+    VARIANT_NAMES: tuple[str, ...] = ('grayscale', 'blurred', 'adaptive_threshold', 'morph_close')
+
+    # Page Segmentation Mode configurations tried for every variant
+    PSM_CONFIGS: tuple[str, ...] = (
+        '--psm 6',  # Uniform block of text
+        '--psm 4',  # Single column of text
+        '--psm 3',  # Fully automatic page segmentation
+        '--psm 1',  # Automatic page segmentation with OSD
+    )
+
+    # Variant order for adaptive search; other configured variants follow in configured order
+    ADAPTIVE_VARIANT_PRIORITY: tuple[str, ...] = ('grayscale', 'adaptive_threshold', 'morph_close', 'blurred')
+
+    # Variants tried first on the aggressive path for images unlikely to be read
+    AGGRESSIVE_VARIANT_PRIORITY: tuple[str, ...] = ('morph_close', 'adaptive_threshold')
+
+    SEARCH_MODES: tuple[str, ...] = ('adaptive', 'exhaustive')
+
+    # Fields of extract_text_details stored in the OCR result cache, besides the word boxes
+    CACHED_FIELDS: tuple[str, ...] = ('text', 'score', 'confidence', 'variant', 'psm', 'attempts', 'scale_factor', 'regions',
+                                      'rotation_applied', 'skew_corrected', 'model_tier', 'escalated', 'escalated_regions')
+
+    # Scale factors applied by resolution normalization are clamped to this range
+    MIN_SCALE_FACTOR: float = 0.2
+    MAX_SCALE_FACTOR: float = 2.0
+
+    # Skew corrections outside this range (degrees) are skipped as too small to matter or unreliable
+    MIN_DESKEW_ANGLE: float = 1.0
+    MAX_DESKEW_ANGLE: float = 15.0
+
+    # EXIF Orientation tag values of rotated photos and the clockwise rotation that makes them upright
+    EXIF_ORIENTATION_ROTATIONS: dict[int, int] = {3: 180, 6: 90, 8: 270}
+
+    # Long side, in pixels, of the copy searched for text lines by detect_orientation
+    ORIENTATION_SAMPLE_SIZE: int = 1024
+
+    # Hough lines needed for a skew estimate, and how many of the strongest are used
+    HOUGH_MIN_LINES: int = 8
+    HOUGH_TOP_LINES: int = 50
+
+    # Row/column ink variance ratio above which text lines are horizontal
+    PROFILE_VARIANCE_RATIO: float = 1.5
+
+    # Balance of ink above vs below the x-height band of text lines beyond which
+    # the page is taken as upright (ascenders on top) or upside down, and the
+    # text lines needed for that decision; closer balances are left to OSD
+    ASCENDER_BALANCE: float = 0.2
+    ASCENDER_MIN_LINES: int = 3
+
+    # Long side, in pixels, of the reduced copy every quality assessment is graded
+    # on, so that resolution-dependent metrics match the grading thresholds
+    # whatever the scan size
+    QUALITY_SAMPLE_SIZE: int = 1600
+
+    def __init__(self, search_mode: str = 'adaptive', early_exit_score: float = 80.0, threads: int = 1,
+                 engine: Union[str, OCREngine] = 'pytesseract', cache: Optional[DiskCache] = None,
+                 target_text_height: Optional[float] = 28.0, layout_analysis: bool = False,
+                 auto_rotate: bool = True, telemetry: Optional[OCRTelemetry] = None,
+                 variants: Optional[list[str]] = None, fast_engine: Optional[OCREngine] = None,
+                 escalation_score: float = 70.0, yield_predictor: Optional[YieldPredictor] = None):
+        """
+        Initialize OCR processor.
+
+        Args:
+            search_mode (str): 'adaptive' stops at the first candidate whose combined
+                score reaches early_exit_score; 'exhaustive' tries every variant/PSM pair
+            early_exit_score (float): Combined confidence/text-quality score (0-100)
+                that ends an adaptive search
+            threads (int): Number of OCR candidates of one image evaluated
+                concurrently; 1 evaluates them one after another
+            engine (str | OCREngine): OCR engine instance or name ('pytesseract'
+                runs a subprocess per call, 'tesserocr' keeps tesseract loaded)
+            cache (DiskCache): Optional persistent cache of OCR results keyed by
+                image content and OCR configuration
+            target_text_height (float): Character height in pixels that images are
+                rescaled to before OCR (about 300 DPI for printed text); None
+                disables resolution normalization
+            layout_analysis (bool): Whether to detect text blocks and OCR them
+                separately, in parallel and in reading order, before falling
+                back to the full-page search
+            auto_rotate (bool): Whether to rotate pages upright and deskew them
+                before OCR
+            telemetry (OCRTelemetry): Optional record of candidate scores;
+                when given, adaptive searches try the candidates that scored
+                best on similar images first
+            variants (list): Preprocessing variants to try, as registered names
+                or 'module:function' paths; defaults to VARIANT_NAMES
+            fast_engine (OCREngine): Optional engine with fast traineddata used
+                for the first pass; engine then serves as the accurate tier
+            escalation_score (float): Combined score below which an image or
+                region read by fast_engine is read again with engine
+            yield_predictor (YieldPredictor): Optional predictor of OCR success
+                from the quality metrics; images it rates hopeless are skipped
+                and unlikely ones take the aggressive path
+        """
+        if search_mode not in self.SEARCH_MODES:
+            raise ValueError(f"Unknown OCR search mode: {search_mode}")
+
         self.logger: logging.Logger = logging.getLogger(__name__)
         # Start with a more flexible PSM mode
         self.tesseract_config: str = '--psm 6'
+        self.search_mode: str = search_mode
+        self.early_exit_score: float = early_exit_score
+        self.threads: int = max(1, threads)
+        self.engine: OCREngine = create_engine(engine) if isinstance(engine, str) else engine
+        self.fast_engine: Optional[OCREngine] = fast_engine
+        self.escalation_score: float = escalation_score
+        self.yield_predictor: Optional[YieldPredictor] = yield_predictor
+        self.cache: Optional[DiskCache] = cache
+        self.target_text_height: Optional[float] = target_text_height
+        self.layout_analysis: bool = layout_analysis
+        self.auto_rotate: bool = auto_rotate
+        self.telemetry: Optional[OCRTelemetry] = telemetry
+        self.variant_names: list[str] = list(variants or self.VARIANT_NAMES)
+        self.variant_functions: list[VariantFunction] = [resolve_variant(name) for name in self.variant_names]
+        self.layout_analyzer: LayoutAnalyzer = LayoutAnalyzer()
+
+    @classmethod
+    def from_config(cls, ocr_settings: dict[str, Any]) -> 'OCRProcessor':
+        """
+        Create an OCR processor from the 'ocr' section of the configuration.
 
-    def detect_orientation(self, image_path: str) -> dict[str, Any]:
+        Args:
+            ocr_settings (dict): OCR configuration values
+
+        Returns:
+            OCRProcessor: Configured processor
+        """
+        engine_name = str(ocr_settings.get('engine', 'pytesseract'))
+        lang = str(ocr_settings.get('lang', 'eng'))
+        models = ocr_settings.get('models', {})
+        fast_engine = None
+        if models.get('fast_tessdata_dir'):
+            fast_engine = create_engine(engine_name, lang=lang, tessdata_dir=models['fast_tessdata_dir'])
+
+        telemetry = cls._create_telemetry(ocr_settings.get('telemetry', {}))
+        return cls(
+            search_mode=str(ocr_settings.get('search_mode', 'adaptive')),
+            early_exit_score=float(ocr_settings.get('early_exit_score', 80.0)),
+            threads=int(ocr_settings.get('threads', 1)),
+            engine=create_engine(
+                engine_name,
+                lang=lang,
+                tessdata_dir=models.get('best_tessdata_dir') or ocr_settings.get('tessdata_dir')
+            ),
+            cache=cls._create_cache(ocr_settings.get('cache', {})),
+            target_text_height=ocr_settings.get('target_text_height', 28.0),
+            layout_analysis=bool(ocr_settings.get('layout_analysis', False)),
+            auto_rotate=bool(ocr_settings.get('auto_rotate', True)),
+            telemetry=telemetry,
+            variants=ocr_settings.get('variants'),
+            fast_engine=fast_engine,
+            escalation_score=float(models.get('escalation_score', 70.0)),
+            yield_predictor=cls._create_yield_predictor(ocr_settings.get('yield_predictor', {}), telemetry)
+        )
+
+    @staticmethod
+    def _create_cache(cache_settings: dict[str, Any]) -> Optional[DiskCache]:
+        """Create the OCR result cache described by the 'cache' OCR setting."""
+        if not cache_settings.get('enabled', False):
+            return None
+
+        from src.utils import get_resource_path
+        path = cache_settings.get('path') or os.path.join(get_resource_path('data/cache'), 'ocr_cache.sqlite3')
+        return DiskCache(path, max_bytes=int(float(cache_settings.get('max_mb', 256)) * 1024 * 1024))
+
+    @staticmethod
+    def _create_telemetry(telemetry_settings: dict[str, Any]) -> Optional[OCRTelemetry]:
+        """Create the candidate telemetry store described by the 'telemetry' OCR setting."""
+        if not telemetry_settings.get('enabled', False):
+            return None
+
+        from src.utils import get_resource_path
+        path = telemetry_settings.get('path') or os.path.join(get_resource_path('data/cache'), 'ocr_telemetry.sqlite3')
+        return OCRTelemetry(path, min_samples=int(telemetry_settings.get('min_samples', 20)),
+                            max_rows=int(telemetry_settings.get('max_rows', 50000)))
+
+    @staticmethod
+    def _create_yield_predictor(predictor_settings: dict[str, Any],
+                                telemetry: Optional[OCRTelemetry]) -> Optional[YieldPredictor]:
+        """Create the OCR-yield predictor described by the 'yield_predictor' OCR setting."""
+        if not predictor_settings.get('enabled', False):
+            return None
+
+        return YieldPredictor(
+            telemetry,
+            skip_below=float(predictor_settings.get('skip_below', 0.05)),
+            aggressive_below=float(predictor_settings.get('aggressive_below', 0.3)),
+            min_samples=int(predictor_settings.get('min_samples', 50)),
+            usable_score=float(predictor_settings.get('usable_score', 50.0))
+        )
+
+    def _get_context(self, image_path: Union[str, ImageAnalysisContext]) -> ImageAnalysisContext:
+        """Wrap an image path in an analysis context, reusing one that is passed in."""
+        if isinstance(image_path, ImageAnalysisContext):
+            return image_path
+        return ImageAnalysisContext(image_path)
+
+    def detect_orientation(self, image_path: Union[str, ImageAnalysisContext]) -> dict[str, Any]:
         """
         Detect the orientation of an image to improve OCR accuracy.
         Handles 90°, 180°, and 270° rotations commonly found in camera photos.
 
+        Detection is tiered from cheapest to most expensive: the EXIF
+        Orientation tag written by the camera, then the text lines of a
+        downscaled copy, and tesseract OSD only when neither is conclusive.
+        The text line tier finds whether lines run horizontally or vertically
+        (Hough transform and ink profiles), then tells the two remaining
+        directions apart by where the ascenders and descenders of the lines
+        fall (upright Latin text has more ink above its x-height band than
+        below it). The skew of the text lines is measured in every case.
+
         Args:
-            image_path (str): Path to the image file
+            image_path (str | ImageAnalysisContext): Path to the image file or a
+                shared analysis context of it
 
         Returns:
-            dict: Orientation information
+            dict: Orientation information; 'recommended_rotation' is the
+                clockwise rotation in multiples of 90° that makes the page
+                upright, 'skew' the remaining small clockwise correction,
+                'angle' their sum and 'method' the tier that decided the
+                rotation ('exif', 'hough', 'osd' or 'none')
         """
         try:
-            # Open image
-            image = Image.open(image_path)
-            opencv_image = np.array(image.convert('L'))
-
-            # Method 1: Try to detect text orientation using HoughLines for small rotations
-            edges = cv2.Canny(opencv_image, 50, 150, apertureSize=3)
-            lines = cv2.HoughLines(edges, 1, np.pi/180, threshold=100)
-
-            hough_angle = 0
-            if lines is not None and len(lines) > 0:
-                angles = []
-                for rho, theta in lines[:, 0]:
-                    # Convert to degrees
-                    angle_deg = np.degrees(theta)
-                    # Normalize to -45 to 45 range
-                    if angle_deg > 45 and angle_deg < 135:
-                        angles.append(angle_deg - 90)
-                    elif angle_deg > 135:
-                        angles.append(angle_deg - 180)
-                    else:
-                        angles.append(angle_deg)
-
-                if angles:
-                    hough_angle = np.median(angles)
-
-            # Method 2: Use pytesseract's built-in OSD (Orientation and Script Detection)
-            osd_angle = 0
-            try:
-                osd = pytesseract.image_to_osd(image)
-                osd_str = str(osd) if isinstance(osd, (bytes, dict)) else osd
-                for line in osd_str.split('\n'):
-                    if line.strip().startswith('Rotate:'):
-                        osd_angle = int(line.split(':')[1].strip())
-                        break
-            except Exception as e:
-                self.logger.debug(f"OSD detection failed: {e}")
-
-            # Choose the most reliable angle
-            final_angle = osd_angle if abs(osd_angle) > 5 else hough_angle
-
-            # Determine if rotation is needed (threshold of 5 degrees)
-            needs_rotation = abs(final_angle) > 5
-
-            # Recommend rotation angle (round to nearest 90 degrees for major rotations)
-            if abs(final_angle) > 45:
-                if final_angle > 0:
-                    recommended_rotation = 90
-                else:
-                    recommended_rotation = -90
-            elif abs(final_angle) > 5:
-                recommended_rotation = -final_angle  # Counter-rotate
-            else:
-                recommended_rotation = 0
-
+            context = self._get_context(image_path)
+            hough = self._hough_orientation(context.gray)
+
+            # Tier 1: the camera's EXIF Orientation tag
+            rotation = self.EXIF_ORIENTATION_ROTATIONS.get(context.exif_orientation)
+            method = 'exif'
+
+            # Tier 2: text line direction, then ascenders vs descenders for 0/180 or 90/270
+            if rotation is None and hough['upright'] is not None:
+                candidates = (0, 180) if hough['horizontal'] else (90, 270)
+                rotation = candidates[0] if hough['upright'] else candidates[1]
+                method = 'hough'
+
+            # Tier 3: tesseract's built-in OSD (Orientation and Script Detection)
+            if rotation is None:
+                rotation, method = self._osd_rotation(context), 'osd'
+            if rotation is None:
+                rotation, method = 0, 'none'
+
+            skew = hough['skew']
             return {
-                'angle': final_angle,
-                'needs_rotation': needs_rotation,
-                'recommended_rotation': recommended_rotation,
-                'method': 'osd' if abs(osd_angle) > 5 else 'hough'
+                'angle': rotation + skew,
+                'needs_rotation': rotation != 0 or abs(skew) > 5,
+                'recommended_rotation': rotation,
+                'skew': skew,
+                'method': method
             }
 
         except Exception as e:
@@ -98,183 +283,405 @@ class OCRProcessor:
                 'angle': 0,
                 'needs_rotation': False,
                 'recommended_rotation': 0,
+                'skew': 0.0,
                 'method': 'error'
             }
 
-    def assess_image_quality(self, image_path: str) -> dict[str, Any]:
+    def _hough_orientation(self, gray: np.ndarray) -> dict[str, Any]:
+        """
+        Measure skew and text line direction on a downscaled copy of a page.
+
+        The skew is the median angle of the strongest Hough lines. Whether the
+        text runs horizontally is decided on the straightened copy: ink varies
+        much more between rows than between columns when lines are horizontal.
+        Lines that run vertically are turned horizontal (90° clockwise) before
+        their ascenders and descenders are compared.
+
+        Args:
+            gray (np.ndarray): Grayscale page
+
+        Returns:
+            dict: 'skew' (clockwise correction in degrees, within ±45),
+                'horizontal' (True when the text lines are horizontal) and
+                'upright' (True when the lines, turned horizontal, have their
+                ascenders on top, False when upside down, None when the
+                direction or the ascenders are inconclusive)
+        """
+        factor = min(1.0, self.ORIENTATION_SAMPLE_SIZE / max(gray.shape))
+        sample = cv2.resize(gray, None, fx=factor, fy=factor, interpolation=cv2.INTER_AREA) if factor < 1.0 else gray
+        edges = cv2.Canny(sample, 50, 150, apertureSize=3)
+        lines = cv2.HoughLines(edges, 1, np.pi / 360, threshold=max(30, int(min(sample.shape) * 0.15)))
+
+        skew = 0.0
+        if lines is not None and len(lines) >= self.HOUGH_MIN_LINES:
+            # Lines come strongest first; fold their tilt from horizontal into -45..45
+            tilt = np.degrees(lines[:self.HOUGH_TOP_LINES, 0, 1]) - 90
+            skew = 0.0 - round(float(np.median((tilt + 45) % 90 - 45)), 1)
+
+        _, binary = cv2.threshold(sample, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+        if abs(skew) >= 0.5:
+            height, width = binary.shape
+            matrix = cv2.getRotationMatrix2D((width / 2, height / 2), -skew, 1.0)
+            binary = cv2.warpAffine(binary, matrix, (width, height))
+
+        row_variance = self._inked_span(binary.mean(axis=1, dtype=np.float32)).var()
+        column_variance = self._inked_span(binary.mean(axis=0, dtype=np.float32)).var()
+
+        horizontal = bool(row_variance > 0 and row_variance >= self.PROFILE_VARIANCE_RATIO * column_variance)
+        vertical = bool(column_variance > 0 and column_variance >= self.PROFILE_VARIANCE_RATIO * row_variance)
+        upright = None
+        if horizontal:
+            upright = self._ascenders_on_top(binary)
+        elif vertical:
+            upright = self._ascenders_on_top(cv2.rotate(binary, cv2.ROTATE_90_CLOCKWISE))
+
+        return {'skew': skew, 'horizontal': horizontal, 'upright': upright}
+
+    def _ascenders_on_top(self, binary: np.ndarray) -> Optional[bool]:
+        """
+        Tell upright from upside-down horizontal text lines.
+
+        Each text line (a run of inked rows) has a dense x-height band; ascenders
+        and capitals add ink above it and descenders below it. Ascenders are
+        far more common in Latin text, so more ink above the band means the
+        page is upright.
+
+        Args:
+            binary (np.ndarray): Binarized page with ink as 255 and horizontal lines
+
+        Returns:
+            bool: True for upright, False for upside down, None when there are
+                too few lines or the balance is too close to call
+        """
+        profile = binary.mean(axis=1, dtype=np.float32)
+        if profile.max() <= 0:
+            return None
+
+        inked = profile > profile.max() * 0.02
+        edges = np.flatnonzero(np.diff(np.r_[0, inked.astype(np.int8), 0]))
+        above = below = 0.0
+        lines = 0
+        for start, end in zip(edges[::2], edges[1::2]):
+            line = profile[start:end]
+            if len(line) < 4:
+                continue
+            core = np.flatnonzero(line >= line.max() * 0.5)
+            above += float(line[:core[0]].sum())
+            below += float(line[core[-1] + 1:].sum())
+            lines += 1
+
+        if lines < self.ASCENDER_MIN_LINES or above + below <= 0:
+            return None
+        balance = (above - below) / (above + below)
+        if abs(balance) < self.ASCENDER_BALANCE:
+            return None
+        return balance > 0
+
+    @staticmethod
+    def _inked_span(profile: np.ndarray) -> np.ndarray:
+        """Trim an ink projection profile to the span holding the central 96% of the ink."""
+        cumulative = np.cumsum(profile)
+        if cumulative[-1] <= 0:
+            return profile
+        low, high = np.searchsorted(cumulative, cumulative[-1] * np.array([0.02, 0.98]))
+        return profile[low:high + 1]
+
+    def _osd_rotation(self, context: ImageAnalysisContext) -> Optional[int]:
+        """
+        Get the clockwise rotation that makes the page upright from tesseract OSD.
+
+        Args:
+            context (ImageAnalysisContext): Analysis context of the image
+
+        Returns:
+            int: 0, 90, 180 or 270, or None when OSD fails
+        """
+        try:
+            osd_str = self.engine.image_to_osd(context.gray_image)
+            for line in osd_str.split('\n'):
+                if line.strip().startswith('Rotate:'):
+                    return int(line.split(':')[1].strip()) % 360
+        except Exception as e:
+            self.logger.debug(f"OSD detection failed: {e}")
+        return None
+
+    def assess_image_quality(self, image_path: Union[str, ImageAnalysisContext]) -> dict[str, Any]:
         """
         Assess the quality of an image for OCR purposes.
 
+        The image is graded on the same QUALITY_SAMPLE_SIZE copy as in
+        assess_image_quality_batch, so both give the same grade.
+
         Args:
-            image_path (str): Path to the image file
+            image_path (str | ImageAnalysisContext): Path to the image file or a
+                shared analysis context of it
 
         Returns:
             dict: Quality assessment information
         """
         try:
-            # Open image
-            image = Image.open(image_path)
-            opencv_image = np.array(image.convert('L'))
-
-            # Calculate various quality metrics
-
-            # 1. Sharpness (Laplacian variance)
-            laplacian = cv2.Laplacian(opencv_image, cv2.CV_64F)
-            sharpness = laplacian.var()
-
-            # 2. Contrast (standard deviation)
-            contrast = opencv_image.std()
-
-            # 3. Brightness (mean pixel value)
-            brightness = opencv_image.mean()
-
-            # 4. Noise estimation (using Gaussian blur difference)
-            blurred = cv2.GaussianBlur(opencv_image, (5, 5), 0)
-            noise_level = np.sum((opencv_image.astype("float") - blurred.astype("float")) ** 2)
-            noise_level /= float(opencv_image.shape[0] * opencv_image.shape[1])
-
-            # 5. Text region detection
-            edges = cv2.Canny(opencv_image, 50, 150, apertureSize=3)
-            contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-            text_regions = len(contours)
-
-            # 6. Horizontal line detection (common in text)
-            horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (25, 1))
-            detect_horizontal = cv2.morphologyEx(edges, cv2.MORPH_OPEN, horizontal_kernel, iterations=2)
-            horizontal_lines = cv2.countNonZero(detect_horizontal)
-
-            # 7. Resolution score
-            height, width = opencv_image.shape
-            resolution_score = min(100, (width * height) / 10000)  # Normalize to 100
-
-            # Calculate overall quality score (0-100)
-            quality_score = 0
-
-            # Sharpness contribution (30%)
-            if sharpness > 100:
-                quality_score += 30
-            elif sharpness > 50:
-                quality_score += 20
-            elif sharpness > 10:
-                quality_score += 10
-
-            # Contrast contribution (25%)
-            if contrast > 50:
-                quality_score += 25
-            elif contrast > 30:
-                quality_score += 15
-            elif contrast > 10:
-                quality_score += 8
-
-            # Brightness contribution (20%) - prefer moderate brightness
-            if 50 <= brightness <= 200:
-                quality_score += 20
-            elif 30 <= brightness <= 220:
-                quality_score += 15
-            elif 10 <= brightness <= 240:
-                quality_score += 10
-
-            # Low noise contribution (15%)
-            if noise_level < 50:
-                quality_score += 15
-            elif noise_level < 100:
-                quality_score += 10
-            elif noise_level < 200:
-                quality_score += 5
-
-            # Text regions contribution (10%)
-            if text_regions > 10:
-                quality_score += 10
-            elif text_regions > 5:
-                quality_score += 7
-            elif text_regions > 0:
-                quality_score += 3
-
-            # Determine quality grade
-            if quality_score >= 80:
-                grade = 'A'
-                quality_description = 'Excellent - Optimal for OCR'
-            elif quality_score >= 65:
-                grade = 'B'
-                quality_description = 'Good - Should work well for OCR'
-            elif quality_score >= 50:
-                grade = 'C'
-                quality_description = 'Fair - May need preprocessing'
-            elif quality_score >= 35:
-                grade = 'D'
-                quality_description = 'Poor - Significant OCR challenges expected'
-            else:
-                grade = 'F'
-                quality_description = 'Very Poor - OCR likely to fail'
-
-            return {
-                'overall_score': quality_score,
-                'grade': grade,
-                'quality_description': quality_description,
-                'metrics': {
-                    'sharpness': sharpness,
-                    'contrast': contrast,
-                    'brightness': brightness,
-                    'noise_level': noise_level,
-                    'text_regions': text_regions,
-                    'horizontal_lines': horizontal_lines,
-                    'resolution_score': resolution_score,
-                    'edges': cv2.countNonZero(edges)
-                }
-            }
+            context = self._get_context(image_path)
+            return self._grade_quality(self._sample_quality_metrics(context))
 
         except Exception as e:
             self.logger.error(f"Error assessing image quality: {e}")
-            return {
-                'overall_score': 0,
-                'grade': 'F',
-                'quality_description': 'Error assessing quality',
-                'metrics': {}
-            }
+            return self._failed_quality_assessment()
 
-    def preprocess_image(self, image_path: str) -> list[Image.Image]:
+    def assess_image_quality_batch(self, images: list[Union[str, IO[bytes], ImageAnalysisContext]],
+                                   max_workers: Optional[int] = None) -> list[dict[str, Any]]:
         """
-        Preprocess image with essential techniques to improve OCR accuracy.
+        Assess the quality of many images in parallel.
+
+        Each image is graded on a copy reduced to QUALITY_SAMPLE_SIZE pixels on
+        its long side; JPEGs are decoded directly at a reduced DCT scale, so the
+        full-resolution pixels are never materialized. The resolution score is
+        still computed from the original dimensions.
 
         Args:
-            image_path (str): Path to the image file
+            images (list): Image paths, open binary files or analysis contexts
+            max_workers (int): Number of threads; defaults to one per CPU core
 
         Returns:
-            list: List of processed PIL Images to try OCR on
+            list: Quality assessment information for each image, in input order
         """
+        if not images:
+            return []
+
+        workers = max_workers or min(len(images), CPUBudget.available_cores())
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            return list(executor.map(self._assess_reduced_quality, images))
+
+    def _assess_reduced_quality(self, image: Union[str, IO[bytes], ImageAnalysisContext]) -> dict[str, Any]:
+        """Grade one image of a batch on its reduced copy."""
         try:
-            # Load image
-            image = Image.open(image_path)
-            opencv_image = np.array(image.convert('L'))
+            return self._grade_quality(self._sample_quality_metrics(image))
 
-            processed_images: list[Image.Image] = []
+        except Exception as e:
+            self.logger.error(f"Error assessing image quality of {image}: {e}")
+            return self._failed_quality_assessment()
 
-            # 1. Original grayscale (baseline)
-            processed_images.append(Image.fromarray(opencv_image))
+    def _sample_quality_metrics(self, image: Union[str, IO[bytes], ImageAnalysisContext]) -> dict[str, Any]:
+        """
+        Compute the quality metrics of an image on its reduced copy.
 
-            # 2. Gaussian blur to reduce noise
-            blurred = cv2.GaussianBlur(opencv_image, (3, 3), 0)
-            processed_images.append(Image.fromarray(blurred))
+        Sharpness, noise and text region counts depend on the pixel scale of the
+        image, so grading a 4000px scan directly would score it differently
+        from its reduced copy; every assessment therefore measures the copy.
 
-            # 3. Adaptive threshold (good for uneven lighting)
-            adaptive_thresh = cv2.adaptiveThreshold(
-                opencv_image, 255,
-                cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-                cv2.THRESH_BINARY, 11, 2
-            )
-            processed_images.append(Image.fromarray(adaptive_thresh))
+        Args:
+            image (str | file | ImageAnalysisContext): Image to measure
 
-            # 4. Morphological operations to clean up text
-            kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
-            morphed = cv2.morphologyEx(adaptive_thresh, cv2.MORPH_CLOSE, kernel)
-            processed_images.append(Image.fromarray(morphed))
+        Returns:
+            dict: Quality metrics, with the resolution score of the original size
+        """
+        gray, original_size = self._load_quality_sample(image)
+        if isinstance(image, ImageAnalysisContext) and gray is image.gray:
+            # Small enough already; reuse the maps cached on the context
+            edges, blurred = image.edges, image.blurred(5)
+        else:
+            edges = cv2.Canny(gray, 50, 150, apertureSize=3)
+            blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+        return self._quality_metrics(gray, edges, blurred, original_size)
+
+    def _load_quality_sample(self, image: Union[str, IO[bytes], ImageAnalysisContext]) -> tuple[np.ndarray, tuple[int, int]]:
+        """
+        Load a grayscale copy of an image no larger than QUALITY_SAMPLE_SIZE.
+
+        Args:
+            image (str | file | ImageAnalysisContext): Image to load
+
+        Returns:
+            tuple: (reduced uint8 grayscale array, original (width, height))
+        """
+        if isinstance(image, ImageAnalysisContext):
+            gray = image.gray
+            original_size = (gray.shape[1], gray.shape[0])
+        else:
+            if hasattr(image, 'seek'):
+                image.seek(0)
+            with Image.open(image) as pil_image:
+                original_size = pil_image.size
+                factor = min(1.0, self.QUALITY_SAMPLE_SIZE / max(original_size))
+                # Lets the JPEG decoder skip DCT detail; a no-op for other formats
+                pil_image.draft('L', (max(1, int(original_size[0] * factor)), max(1, int(original_size[1] * factor))))
+                gray = np.asarray(pil_image.convert('L'))
+
+        factor = self.QUALITY_SAMPLE_SIZE / max(gray.shape)
+        if factor < 1.0:
+            gray = cv2.resize(gray, None, fx=factor, fy=factor, interpolation=cv2.INTER_AREA)
+        return gray, original_size
+
+    def _quality_metrics(self, gray: np.ndarray, edges: np.ndarray, blurred: np.ndarray,
+                         original_size: Optional[tuple[int, int]] = None) -> dict[str, Any]:
+        """
+        Compute the raw quality metrics of a grayscale image.
 
-            return processed_images
+        Args:
+            gray (np.ndarray): Grayscale image
+            edges (np.ndarray): Canny edge map of gray
+            blurred (np.ndarray): 5x5 Gaussian blur of gray
+            original_size (tuple): (width, height) of the full-size image when
+                gray is a reduced copy
+
+        Returns:
+            dict: Quality metrics
+        """
+        height, width = gray.shape
+        pixel_count = float(height * width)
+
+        # 1. Sharpness (Laplacian variance)
+        laplacian = cv2.Laplacian(gray, cv2.CV_32F)
+        _, laplacian_std = cv2.meanStdDev(laplacian)
+        sharpness = float(laplacian_std[0][0]) ** 2
+
+        # 2. Contrast (standard deviation) and 3. Brightness (mean pixel value)
+        mean, std = cv2.meanStdDev(gray)
+        contrast = float(std[0][0])
+        brightness = float(mean[0][0])
+
+        # 4. Noise estimation (mean squared Gaussian blur difference)
+        noise_level = cv2.norm(gray, blurred, cv2.NORM_L2SQR) / pixel_count
+
+        # 5. Text region detection
+        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        text_regions = len(contours)
+
+        # 6. Horizontal line detection (common in text)
+        horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (25, 1))
+        detect_horizontal = cv2.morphologyEx(edges, cv2.MORPH_OPEN, horizontal_kernel, iterations=2)
+        horizontal_lines = cv2.countNonZero(detect_horizontal)
+
+        # 7. Resolution score
+        if original_size is not None:
+            width, height = original_size
+        resolution_score = min(100, (width * height) / 10000)  # Normalize to 100
+
+        return {
+            'sharpness': sharpness,
+            'contrast': contrast,
+            'brightness': brightness,
+            'noise_level': noise_level,
+            'text_regions': text_regions,
+            'horizontal_lines': horizontal_lines,
+            'resolution_score': resolution_score,
+            'edges': cv2.countNonZero(edges)
+        }
+
+    def _grade_quality(self, metrics: dict[str, Any]) -> dict[str, Any]:
+        """
+        Turn quality metrics into an overall score and grade.
+
+        Args:
+            metrics (dict): Metrics from _quality_metrics
+
+        Returns:
+            dict: Quality assessment information
+        """
+        sharpness = metrics['sharpness']
+        contrast = metrics['contrast']
+        brightness = metrics['brightness']
+        noise_level = metrics['noise_level']
+        text_regions = metrics['text_regions']
+
+        # Calculate overall quality score (0-100)
+        quality_score = 0
+
+        # Sharpness contribution (30%)
+        if sharpness > 100:
+            quality_score += 30
+        elif sharpness > 50:
+            quality_score += 20
+        elif sharpness > 10:
+            quality_score += 10
+
+        # Contrast contribution (25%)
+        if contrast > 50:
+            quality_score += 25
+        elif contrast > 30:
+            quality_score += 15
+        elif contrast > 10:
+            quality_score += 8
+
+        # Brightness contribution (20%) - prefer moderate brightness
+        if 50 <= brightness <= 200:
+            quality_score += 20
+        elif 30 <= brightness <= 220:
+            quality_score += 15
+        elif 10 <= brightness <= 240:
+            quality_score += 10
+
+        # Low noise contribution (15%)
+        if noise_level < 50:
+            quality_score += 15
+        elif noise_level < 100:
+            quality_score += 10
+        elif noise_level < 200:
+            quality_score += 5
+
+        # Text regions contribution (10%)
+        if text_regions > 10:
+            quality_score += 10
+        elif text_regions > 5:
+            quality_score += 7
+        elif text_regions > 0:
+            quality_score += 3
+
+        # Determine quality grade
+        if quality_score >= 80:
+            grade = 'A'
+            quality_description = 'Excellent - Optimal for OCR'
+        elif quality_score >= 65:
+            grade = 'B'
+            quality_description = 'Good - Should work well for OCR'
+        elif quality_score >= 50:
+            grade = 'C'
+            quality_description = 'Fair - May need preprocessing'
+        elif quality_score >= 35:
+            grade = 'D'
+            quality_description = 'Poor - Significant OCR challenges expected'
+        else:
+            grade = 'F'
+            quality_description = 'Very Poor - OCR likely to fail'
+
+        return {
+            'overall_score': quality_score,
+            'grade': grade,
+            'quality_description': quality_description,
+            'metrics': metrics
+        }
+
+    @staticmethod
+    def _failed_quality_assessment() -> dict[str, Any]:
+        """Quality assessment returned when an image cannot be analyzed."""
+        return {
+            'overall_score': 0,
+            'grade': 'F',
+            'quality_description': 'Error assessing quality',
+            'metrics': {}
+        }
+
+    def preprocess_image(self, image_path: Union[str, ImageAnalysisContext]) -> list[Image.Image]:
+        """
+        Preprocess image with essential techniques to improve OCR accuracy.
+
+        Builds every configured variant at once; the OCR search itself uses
+        LazyVariants to hold only the variants it is currently trying.
+
+        Args:
+            image_path (str | ImageAnalysisContext): Path to the image file or a
+                shared analysis context of it
+
+        Returns:
+            list: List of processed PIL Images to try OCR on, in variant_names order
+        """
+        try:
+            context = self._get_context(image_path)
+            return [Image.fromarray(function(context.gray)) for function in self.variant_functions]
 
         except Exception as e:
             self.logger.error(f"Error preprocessing image: {e}")
             # Return original image as fallback
-            return [Image.open(image_path).convert('L')]
+            return [self._get_context(image_path).gray_image]
 
     def _clean_text(self, text: str) -> str:
         """
@@ -310,88 +717,941 @@ class OCRProcessor:
 
         return text.strip()
 
-    def extract_text(self, image_path: str, preprocess: bool = True) -> str:
+    def extract_text(self, image_path: Union[str, ImageAnalysisContext], preprocess: bool = True) -> str:
         """
         Extract text from an image using OCR with multiple advanced approaches.
 
         Args:
-            image_path (str): Path to the image file
+            image_path (str | ImageAnalysisContext): Path to the image file or a
+                shared analysis context of it
             preprocess (bool): Whether to preprocess the image
 
         Returns:
             str: Extracted text
         """
-        try:
-            if not os.path.exists(image_path):
-                raise FileNotFoundError(f"Image file not found: {image_path}")
-
-            best_text = ""
-            best_confidence = 0
-
-            # Get list of images to try (preprocessed versions if enabled)
-            if preprocess:
-                images_to_try = self.preprocess_image(image_path)
-            else:
-                images_to_try = [Image.open(image_path).convert('L')]
-
-            # Try different PSM (Page Segmentation Mode) configurations
-            psm_configs = [
-                '--psm 6',  # Uniform block of text
-                '--psm 4',  # Single column of text
-                '--psm 3',  # Fully automatic page segmentation
-                '--psm 1',  # Automatic page segmentation with OSD
-            ]
-
-            for img in images_to_try:
-                for config in psm_configs:
-                    try:
-                        # Try to get confidence data
-                        try:
-                            data = pytesseract.image_to_data(img, config=config, output_type=pytesseract.Output.DICT)
-                            if isinstance(data, dict) and 'conf' in data and 'text' in data:
-                                confidences = [int(conf) for conf in data['conf'] if int(conf) > 0]
-                                avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-                                text = ' '.join([data['text'][i] for i, conf in enumerate(data['conf']) if int(conf) > 30])
-                            else:
-                                raise ValueError("Invalid data format from pytesseract")
-                        except:
-                            # Fallback to simple OCR if no confidence data
-                            raw_text = pytesseract.image_to_string(img, config=config)
-                            text = str(raw_text) if isinstance(raw_text, (bytes, dict)) else raw_text
-                            avg_confidence = 50  # Default confidence
-
-                        # Clean up extracted text
-                        cleaned_text = self._clean_text(text)
-
-                        # Score this attempt
-                        text_score = self._score_text_quality(cleaned_text)
-                        combined_score = (avg_confidence + text_score) / 2
-
-                        if combined_score > best_confidence and len(cleaned_text.strip()) > 0:
-                            best_text = cleaned_text
-                            best_confidence = combined_score
+        return self.extract_text_details(image_path, preprocess)['text']
 
-                    except Exception as e:
-                        self.logger.debug(f"OCR attempt failed with config {config}: {e}")
-                        continue
+    def extract_text_details(self, image_path: Union[str, ImageAnalysisContext], preprocess: bool = True,
+                             use_cache: bool = True, orientation: Optional[dict[str, Any]] = None,
+                             quality: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        """
+        Extract text from an image and report how the winning attempt was found.
+
+        Args:
+            image_path (str | ImageAnalysisContext): Path to the image file or a
+                shared analysis context of it
+            preprocess (bool): Whether to preprocess the image
+            use_cache (bool): Whether to read and write the OCR result cache
+            orientation (dict): Earlier detect_orientation result of the same
+                image, used instead of detecting the orientation again
+            quality (dict): Earlier quality assessment of the same image, used
+                for the telemetry bucket instead of assessing it again
+
+        Returns:
+            dict: Extracted text, its score and average tesseract confidence,
+                the winning variant and PSM config, the number of attempts,
+                the clockwise rotation applied before OCR ('rotation_applied',
+                including the 'skew_corrected' part), the winning attempt's
+                WordBoxes in original image coordinates ('words'; restored
+                from the cache on a hit, None for plain-text results), the model tier of the winner
+                ('model_tier': 'fast', 'best', 'mixed' for regions read by
+                both, or 'default' without tiered models), whether the image
+                or any of its regions was escalated to the accurate tier
+                ('escalated', 'escalated_regions'), the predicted OCR success
+                ('yield_probability') and the path it chose ('yield_action';
+                'skip' means no OCR was attempted) and whether the result came
+                from the cache
+        """
+        details = self._empty_details()
+
+        try:
+            context = self._get_context(image_path)
+
+            cache_key = None
+            if self.cache is not None and use_cache:
+                cache_key = self._cache_key(context, preprocess)
+                cached = self._get_cached(cache_key)
+                if cached is not None:
+                    details.update(cached)
+                    return details
+
+            # Predict before any tesseract call whether the image can be read at all
+            quality, action = self._predict_yield(context, quality, details)
+            metrics = quality.get('metrics', {}) if quality else {}
+            if action == 'skip':
+                return details
+            aggressive = action == 'aggressive'
+
+            # Turn the page upright and rescale it once, before any variant is generated
+            upright_context, rotation, skew = self.correct_orientation(context, orientation)
+            details['rotation_applied'], details['skew_corrected'] = rotation + skew, skew
+            working_context, details['scale_factor'] = self.normalize_resolution(upright_context)
+
+            # Quality bucket used to predict and later record the winning candidate
+            bucket = OCRTelemetry.quality_bucket(metrics) if self.telemetry is not None else None
+
+            # With tiered models the fast traineddata reads first; the accurate one only on escalation.
+            # The aggressive path goes straight to the accurate models and the full-page search.
+            first_tier, first_engine = ('fast', self.fast_engine) if self.fast_engine is not None else ('default', self.engine)
+            if aggressive:
+                first_tier, first_engine = ('best', self.engine) if self.fast_engine is not None else ('default', self.engine)
+
+            # Layout pass: OCR each detected text block on its own, in parallel
+            best = None
+            if self.layout_analysis and not aggressive:
+                best = self._search_regions(working_context, preprocess, first_engine)
+
+            # Full-page search unless the layout pass already cleared the bar
+            if best is None or self.search_mode == 'exhaustive' or best['score'] < self.early_exit_score:
+                page_best = self._search_full_page(working_context, preprocess, bucket, first_engine,
+                                                   aggressive=aggressive)
+                page_best['model_tier'] = first_tier
+                best = self._better_result(best, page_best)
+
+                if first_engine is self.fast_engine and best['score'] < self.escalation_score:
+                    # Start the accurate tier with the candidate the fast tier read best
+                    first = (page_best['variant_index'], page_best['psm']) if page_best['psm'] else None
+                    escalated = self._search_full_page(working_context, preprocess, bucket, self.engine, first)
+                    escalated['model_tier'] = 'best'
+                    best = self._better_result(best, escalated)
+                    details['escalated'] = True
+
+            details['model_tier'] = best.get('model_tier', first_tier)
+            details['escalated_regions'] = best.get('escalated_regions', 0)
+            details['escalated'] = details['escalated'] or details['escalated_regions'] > 0
+            best_text = best['text']
+            best_confidence = best['score']
+            details['attempts'] = best['attempts']
+            if best_text:
+                details.update({
+                    'score': best['score'],
+                    'confidence': best['confidence'],
+                    'variant': best.get('variant') or self._variant_name(best['variant_index'], preprocess),
+                    'psm': best['psm'],
+                    'regions': best.get('regions', 0)
+                })
+
+                # Word boxes are reported in the pixel coordinates of the original image
+                height, width = context.gray.shape
+                transform = self._working_transform(width, height, rotation, skew, details['scale_factor'])
+                details['words'] = best.get('words', WordBoxes.empty()).transformed(np.linalg.inv(transform))
 
             # If we still don't have good text, try one more aggressive approach
             if not best_text.strip() or best_confidence < 30:
                 try:
                     # Last resort: try with no preprocessing and minimal config
-                    simple_image = Image.open(image_path).convert('L')
-                    raw_fallback = pytesseract.image_to_string(simple_image, config='--psm 8')
-                    fallback_text = str(raw_fallback) if isinstance(raw_fallback, (bytes, dict)) else raw_fallback
+                    simple_image = working_context.gray_image
+                    fallback_text = self.engine.image_to_string(simple_image, config='--psm 8')
+                    details['attempts'] += 1
                     if len(fallback_text.strip()) > len(best_text.strip()):
                         best_text = self._clean_text(fallback_text)
+                        details.update({'variant': 'fallback', 'psm': '--psm 8', 'words': None})
                 except Exception as e:
                     self.logger.debug(f"Fallback OCR failed: {e}")
 
-            return best_text if best_text else ""
+            details['text'] = best_text if best_text else ""
+
+            if self.telemetry is not None:
+                found = bool(details['text'])
+                self.telemetry.record(bucket, details['variant'] if found else None, details['psm'] if found else None,
+                                      details['score'], details['attempts'], self.search_mode, metrics,
+                                      best.get('candidates'))
+
+            # Only cache real results so a missing tesseract install is not remembered
+            if cache_key is not None and details['text']:
+                self._set_cached(cache_key, details)
 
         except Exception as e:
             self.logger.error(f"Error extracting text from {image_path}: {e}")
-            return ""
+
+        return details
+
+    def _predict_yield(self, context: ImageAnalysisContext, quality: Optional[dict[str, Any]],
+                       details: dict[str, Any]) -> tuple[Optional[dict[str, Any]], Optional[str]]:
+        """
+        Predict before any tesseract call whether an image can be read at all.
+
+        The cheap quality metrics of a reduced copy are computed when telemetry
+        or the predictor needs them and no earlier assessment is given. The
+        prediction is written to details, and a skipped image is recorded in
+        the telemetry.
+
+        Args:
+            context (ImageAnalysisContext): Image to OCR
+            quality (dict): Earlier quality assessment of the image, or None
+            details (dict): extract_text_details result being built
+
+        Returns:
+            tuple: (quality assessment, 'proceed', 'aggressive' or 'skip', or
+                None without a predictor)
+        """
+        if self.telemetry is not None or self.yield_predictor is not None:
+            if not quality or not quality.get('metrics'):
+                quality = self._assess_reduced_quality(context)
+        if self.yield_predictor is None:
+            return quality, None
+
+        prediction = self.yield_predictor.predict(quality)
+        details['yield_probability'], details['yield_action'] = prediction['probability'], prediction['action']
+        if prediction['action'] == 'skip':
+            self.logger.info(f"Skipping {context}: predicted OCR success {prediction['probability']:.0%}")
+            if self.telemetry is not None:
+                metrics = quality.get('metrics', {}) if quality else {}
+                self.telemetry.record(OCRTelemetry.quality_bucket(metrics), None, None, 0.0, 0,
+                                      OCRTelemetry.SKIPPED_MODE, metrics)
+        return quality, prediction['action']
+
+    def extract_text_batch(self, image_paths: list[Union[str, ImageAnalysisContext]], config: Optional[str] = None,
+                           fallback: bool = True,
+                           orientations: Optional[list[Optional[dict[str, Any]]]] = None,
+                           qualities: Optional[list[Optional[dict[str, Any]]]] = None) -> list[dict[str, Any]]:
+        """
+        Extract text from many small images with batched engine calls.
+
+        Meant for screenshots and crops, where starting tesseract costs more
+        than recognizing the image. Every image is turned upright and rescaled
+        as usual, then all of them are recognized with one config in a few
+        batched calls (one per thread). Images whose batched result does not
+        reach early_exit_score get the full search of extract_text_details.
+        The OCR-yield predictor runs first, as in extract_text_details: images
+        it skips are not OCR'd and images it sends down the aggressive path get
+        the full search right away. Batched results are recorded in the
+        telemetry with the 'batch' search mode and cached under their own key,
+        since a single-config read must not stand in for the full search.
+
+        Args:
+            image_paths (list): Paths to the image files or shared analysis
+                contexts of them
+            config (str): Tesseract configuration string for the batched pass;
+                defaults to the processor's tesseract_config
+            fallback (bool): Whether to run the full search on images the
+                batched pass does not read well enough; without it they get
+                their batched result, which is not cached
+            orientations (list): Earlier detect_orientation results by image,
+                None where the orientation still has to be detected
+            qualities (list): Earlier quality assessments by image, None where
+                the image still has to be assessed
+
+        Returns:
+            list: extract_text_details dictionaries in input order
+        """
+        config = config or self.tesseract_config
+        results: list[dict[str, Any]] = [self._empty_details() for _ in image_paths]
+        pending: list[dict[str, Any]] = []
+
+        for index, image_path in enumerate(image_paths):
+            try:
+                context = self._get_context(image_path)
+                cache_key = None
+                if self.cache is not None:
+                    # A full-search result beats a batched one; batched ones have a key of their own
+                    full_key = self._cache_key(context, True)
+                    cache_key = f"{full_key}|batch|{config}"
+                    cached = self._get_cached(full_key) or self._get_cached(cache_key)
+                    if cached is not None:
+                        results[index].update(cached)
+                        continue
+
+                orientation = orientations[index] if orientations else None
+                quality, action = self._predict_yield(context, qualities[index] if qualities else None, results[index])
+                if action == 'skip':
+                    continue
+                if action == 'aggressive':
+                    results[index] = self.extract_text_details(context, orientation=orientation, quality=quality)
+                    continue
+
+                if orientation is None and self.auto_rotate:
+                    orientation = self.detect_orientation(context)
+                upright_context, rotation, skew = self.correct_orientation(context, orientation)
+                working_context, scale_factor = self.normalize_resolution(upright_context)
+                pending.append({
+                    'index': index, 'context': context, 'working_context': working_context,
+                    'orientation': orientation, 'quality': quality, 'rotation': rotation, 'skew': skew,
+                    'scale_factor': scale_factor, 'cache_key': cache_key
+                })
+            except Exception as e:
+                self.logger.error(f"Error preparing {image_path} for batched OCR: {e}")
+
+        # The batched pass uses the fast tier; images it does not read well get the full, tiered search
+        batch_tier, batch_engine = ('fast', self.fast_engine) if self.fast_engine is not None else ('default', self.engine)
+        images = [item['working_context'].gray_image for item in pending]
+        attempts = self._run_attempts_batch(images, config, batch_engine) if pending else []
+
+        for item, attempt in zip(pending, attempts):
+            details = results[item['index']]
+            below_bar = attempt is None or not attempt[0] or attempt[1] < self.early_exit_score
+            if below_bar and fallback:
+                results[item['index']] = self.extract_text_details(item['context'], orientation=item['orientation'],
+                                                                   quality=item['quality'])
+                results[item['index']]['attempts'] += 1
+                continue
+            if attempt is None:
+                continue
+
+            text, score, confidence, data = attempt
+            height, width = item['context'].gray.shape
+            transform = self._working_transform(width, height, item['rotation'], item['skew'], item['scale_factor'])
+            details.update({
+                'text': text,
+                'score': score,
+                'confidence': confidence,
+                'variant': 'grayscale',
+                'psm': config,
+                'attempts': 1,
+                'search_mode': 'batch',
+                'scale_factor': item['scale_factor'],
+                'rotation_applied': item['rotation'] + item['skew'],
+                'skew_corrected': item['skew'],
+                'words': WordBoxes.from_tesseract(data).transformed(np.linalg.inv(transform)),
+                'model_tier': batch_tier
+            })
+            if self.telemetry is not None:
+                metrics = item['quality'].get('metrics', {}) if item['quality'] else {}
+                self.telemetry.record(OCRTelemetry.quality_bucket(metrics), 'grayscale' if text else None,
+                                      config if text else None, score, 1, 'batch', metrics)
+
+            # A result below the bar would stand in for the full search of later batched calls
+            if item['cache_key'] is not None and not below_bar:
+                self._set_cached(item['cache_key'], details)
+
+        return results
+
+    def _empty_details(self) -> dict[str, Any]:
+        """Get the extract_text_details result of an image without text."""
+        return {
+            'text': '',
+            'score': 0.0,
+            'confidence': 0.0,
+            'variant': None,
+            'psm': None,
+            'attempts': 0,
+            'search_mode': self.search_mode,
+            'scale_factor': 1.0,
+            'regions': 0,
+            'rotation_applied': 0.0,
+            'skew_corrected': 0.0,
+            'words': None,
+            'model_tier': None,
+            'escalated': False,
+            'escalated_regions': 0,
+            'yield_probability': None,
+            'yield_action': None,
+            'cached': False
+        }
+
+    def _get_cached(self, cache_key: str) -> Optional[dict[str, Any]]:
+        """
+        Look up a cached OCR result.
+
+        Args:
+            cache_key (str): Key from _cache_key
+
+        Returns:
+            dict: The cached extract_text_details fields with their word boxes
+                and 'cached' set, or None on a miss. Entries written before word
+                boxes were cached count as misses, so they are redone and
+                their word data is not lost.
+        """
+        cached = self.cache.get(cache_key)
+        if cached is None or 'words' not in cached:
+            return None
+        words = cached.pop('words')
+        cached['words'] = WordBoxes.from_dict(words) if words is not None else None
+        cached['cached'] = True
+        return cached
+
+    def _set_cached(self, cache_key: str, details: dict[str, Any]) -> None:
+        """Store the CACHED_FIELDS and word boxes of an OCR result."""
+        entry = {field: details[field] for field in self.CACHED_FIELDS}
+        words = details.get('words')
+        entry['words'] = words.to_dict() if words is not None else None
+        self.cache.set(cache_key, entry)
+
+    def _cache_key(self, context: ImageAnalysisContext, preprocess: bool) -> str:
+        """Build the OCR cache key from the image content and everything that affects the result."""
+        return '|'.join([
+            context.content_hash,
+            self.engine.name,
+            str(getattr(self.engine, 'lang', '')),
+            self.search_mode,
+            str(self.early_exit_score),
+            str(self.target_text_height),
+            str(self.layout_analysis),
+            str(self.auto_rotate),
+            ','.join(self.variant_names),
+            str(getattr(self.engine, 'tessdata_dir', '')),
+            f"{getattr(self.fast_engine, 'tessdata_dir', '')}<{self.escalation_score}" if self.fast_engine else '',
+            str(preprocess)
+        ])
+
+    def _search_full_page(self, context: ImageAnalysisContext, preprocess: bool, bucket: Optional[str],
+                          engine: OCREngine, first: Optional[tuple[int, str]] = None,
+                          aggressive: bool = False) -> dict[str, Any]:
+        """
+        Search the preprocessing variant and PSM candidates of the whole page.
+
+        Args:
+            context (ImageAnalysisContext): Working-resolution image
+            preprocess (bool): Whether to try the preprocessing variants
+            bucket (str): Telemetry quality bucket of the image
+            engine (OCREngine): Engine (model tier) to recognize with
+            first (tuple): (variant index, config) candidate to try first
+            aggressive (bool): Whether to try the binarizing variants first
+
+        Returns:
+            dict: Same structure as _search_candidates, with the attempted
+                candidates named by variant instead of indexed
+        """
+        functions = self.variant_functions if preprocess else [preprocessing.grayscale]
+        candidates = self._candidate_order(len(functions), bucket if preprocess else None)
+        if aggressive and preprocess:
+            def aggressive_rank(candidate: tuple[int, str]) -> int:
+                name = self.variant_names[candidate[0]]
+                priority = self.AGGRESSIVE_VARIANT_PRIORITY
+                return priority.index(name) if name in priority else len(priority)
+            candidates.sort(key=aggressive_rank)
+        if first in candidates:
+            candidates.remove(first)
+            candidates.insert(0, first)
+
+        # Variants are generated when first tried and dropped after their last attempt
+        variants = LazyVariants(context.gray, functions, [index for index, _ in candidates])
+        if self.threads > 1:
+            result = self._search_candidates_parallel(variants, candidates, engine)
+        else:
+            result = self._search_candidates(variants, candidates, engine)
+        # Telemetry learns the candidate order from the scores of every attempt
+        result['candidates'] = [(self._variant_name(index, preprocess), config, score)
+                                for index, config, score in result['candidates']]
+        return result
+
+    @staticmethod
+    def _better_result(best: Optional[dict[str, Any]], challenger: dict[str, Any]) -> dict[str, Any]:
+        """Keep the higher scoring of two search results, adding up their attempts and candidate scores."""
+        if best is None:
+            return challenger
+        winner, loser = (challenger, best) if challenger['score'] > best['score'] else (best, challenger)
+        winner['attempts'] += loser['attempts']
+        winner['candidates'] = winner.get('candidates', []) + loser.get('candidates', [])
+        return winner
+
+    def _search_regions(self, context: ImageAnalysisContext, preprocess: bool = True,
+                        engine: Optional[OCREngine] = None) -> Optional[dict[str, Any]]:
+        """
+        OCR each detected text block separately and stitch the results in reading order.
+
+        Regions are cropped from the working image and recognized with a PSM
+        suited to their shape, which skips blank margins and keeps multi-column
+        pages from being read across the columns. Crops sharing a PSM are sent
+        to the engine in batches, one per thread. With tiered models, regions
+        the fast tier reads below escalation_score are read again with the
+        accurate tier.
+
+        Args:
+            context (ImageAnalysisContext): Working-resolution image
+            preprocess (bool): Whether to also try an adaptive-threshold crop
+            engine (OCREngine): Engine (model tier) of the first pass; defaults
+                to the processor's engine
+
+        Returns:
+            dict: Same structure as _search_candidates with 'variant' set to
+                'regions' and the number of regions, or None when the page is
+                a single block and the layout pass does not apply
+        """
+        try:
+            regions = self.layout_analyzer.detect_regions(context.gray, context.text_height)
+        except Exception as e:
+            self.logger.debug(f"Layout analysis failed: {e}")
+            return None
+
+        if len(regions) < 2:
+            return None
+
+        crops = [context.gray[region['top']:region['top'] + region['height'],
+                              region['left']:region['left'] + region['width']] for region in regions]
+        functions = [preprocessing.grayscale]
+        if preprocess:
+            functions.append(preprocessing.adaptive_threshold)
+
+        engine = engine or self.engine
+        first_tier = 'fast' if engine is self.fast_engine else 'default'
+        region_results = [{'text': '', 'score': 0, 'confidence': 0, 'attempts': 0, 'words': WordBoxes.empty(),
+                           'model_tier': first_tier} for _ in regions]
+
+        def run_pass(pass_engine: OCREngine, tier: str, below: float) -> list[int]:
+            """Try the variants on regions scoring below a bar; returns the regions tried."""
+            tried = [index for index, result in enumerate(region_results) if result['score'] < below]
+            for function in functions:
+                # Only regions that have not cleared the bar yet get the next variant
+                pending = [index for index in tried if region_results[index]['score'] < self.early_exit_score]
+                by_psm: dict[str, list[int]] = {}
+                for index in pending:
+                    by_psm.setdefault(regions[index]['psm'], []).append(index)
+
+                # Regions sharing a PSM are recognized together in batched engine calls
+                for psm, indices in by_psm.items():
+                    images = [Image.fromarray(function(crops[index])) for index in indices]
+                    attempts = self._run_attempts_batch(images, psm, pass_engine)
+                    for index, attempt in zip(indices, attempts):
+                        region_best = region_results[index]
+                        region_best['attempts'] += 1
+                        if attempt is None:
+                            continue
+                        text, score, confidence, data = attempt
+                        if score > region_best['score'] and text.strip():
+                            region = regions[index]
+                            region_best.update({
+                                'text': text, 'score': score, 'confidence': confidence, 'model_tier': tier,
+                                'words': WordBoxes.from_tesseract(data, offset=(region['left'], region['top']))
+                            })
+            return tried
+
+        run_pass(engine, first_tier, float('inf'))
+        escalated_regions = 0
+        if self.fast_engine is not None and engine is self.fast_engine:
+            escalated_regions = len(run_pass(self.engine, 'best', self.escalation_score))
+
+        found = [result for result in region_results if result['text']]
+        tiers = {result['model_tier'] for result in found}
+        best = {
+            'text': '', 'score': 0, 'confidence': 0, 'variant': 'regions', 'variant_index': None,
+            'psm': 'per-region', 'attempts': sum(result['attempts'] for result in region_results),
+            'regions': len(regions), 'words': WordBoxes.concatenate([result['words'] for result in region_results]),
+            'model_tier': tiers.pop() if len(tiers) == 1 else ('mixed' if tiers else first_tier),
+            'escalated_regions': escalated_regions
+        }
+        if not found:
+            return best
+
+        text = self._clean_text(' '.join(result['text'] for result in found))
+        # Weight region confidences by the amount of text they contributed
+        confidence = sum(result['confidence'] * len(result['text']) for result in found) / sum(len(result['text']) for result in found)
+        best.update({
+            'text': text,
+            'confidence': confidence,
+            'score': (confidence + self._score_text_quality(text)) / 2
+        })
+        return best
+
+    def _search_candidates(self, variants: LazyVariants, candidates: list[tuple[int, str]],
+                           engine: Optional[OCREngine] = None) -> dict[str, Any]:
+        """
+        Try OCR candidates one after another and keep the best scoring one.
+
+        Args:
+            variants (LazyVariants): Preprocessed images, indexed by variant
+            candidates (list): Ordered (variant index, config) pairs
+            engine (OCREngine): Engine to recognize with; defaults to the processor's engine
+
+        Returns:
+            dict: Best text, score, confidence, variant index, PSM config and
+                word boxes, plus the number of attempts made and the
+                (variant index, config, score) of every attempted candidate
+        """
+        best = {'text': '', 'score': 0, 'confidence': 0, 'variant_index': None, 'psm': None, 'attempts': 0,
+                'candidates': []}
+        best_data: dict[str, list[Any]] = {}
+
+        for variant_index, config in candidates:
+            best['attempts'] += 1
+            try:
+                cleaned_text, combined_score, avg_confidence, data = self._attempt_variant(variants, variant_index, config, engine)
+            except Exception as e:
+                self.logger.debug(f"OCR attempt failed with config {config}: {e}")
+                continue
+            best['candidates'].append((variant_index, config, combined_score if cleaned_text.strip() else 0.0))
+
+            if combined_score > best['score'] and len(cleaned_text.strip()) > 0:
+                best_data = data
+                best.update({
+                    'text': cleaned_text,
+                    'score': combined_score,
+                    'confidence': avg_confidence,
+                    'variant_index': variant_index,
+                    'psm': config
+                })
+
+                # Adaptive search stops at the first candidate that clears the bar
+                if self.search_mode == 'adaptive' and combined_score >= self.early_exit_score:
+                    break
+
+        # Only the winner's word data is converted to arrays
+        best['words'] = WordBoxes.from_tesseract(best_data)
+        return best
+
+    def _search_candidates_parallel(self, variants: LazyVariants, candidates: list[tuple[int, str]],
+                                    engine: Optional[OCREngine] = None) -> dict[str, Any]:
+        """
+        Try OCR candidates concurrently on a thread pool.
+
+        Tesseract runs outside the GIL, so candidates overlap. At most `threads`
+        candidates are in flight, in candidate order, so only the variants they
+        use are held in memory; in adaptive mode no further candidates are
+        started once one clears the early-exit bar, and the ones already
+        running are waited for (and still counted) so no tesseract call
+        outlives the search. Ties are broken by
+        candidate order, so exhaustive mode picks the same winner as the
+        sequential search.
+
+        Args:
+            variants (LazyVariants): Preprocessed images, indexed by variant
+            candidates (list): Ordered (variant index, config) pairs
+            engine (OCREngine): Engine to recognize with; defaults to the processor's engine
+
+        Returns:
+            dict: Same structure as _search_candidates
+        """
+        best = {'text': '', 'score': 0, 'confidence': 0, 'variant_index': None, 'psm': None, 'attempts': 0,
+                'candidates': []}
+        best_order = len(candidates)
+        best_data: dict[str, list[Any]] = {}
+
+        queued = iter(enumerate(candidates))
+        in_flight: dict[Any, tuple[int, int, str]] = {}
+        executor = ThreadPoolExecutor(max_workers=self.threads)
+
+        def submit_next() -> None:
+            for order, (variant_index, config) in queued:
+                future = executor.submit(self._attempt_variant, variants, variant_index, config, engine)
+                in_flight[future] = (order, variant_index, config)
+                return
+
+        try:
+            for _ in range(self.threads):
+                submit_next()
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    order, variant_index, config = in_flight.pop(future)
+                    best['attempts'] += 1
+                    try:
+                        cleaned_text, combined_score, avg_confidence, data = future.result()
+                    except Exception as e:
+                        self.logger.debug(f"OCR attempt failed with config {config}: {e}")
+                        continue
+
+                    if not cleaned_text.strip():
+                        best['candidates'].append((variant_index, config, 0.0))
+                        continue
+                    best['candidates'].append((variant_index, config, combined_score))
+
+                    if combined_score > best['score'] or (combined_score == best['score'] and order < best_order):
+                        best_order = order
+                        best_data = data
+                        best.update({
+                            'text': cleaned_text,
+                            'score': combined_score,
+                            'confidence': avg_confidence,
+                            'variant_index': variant_index,
+                            'psm': config
+                        })
+
+                if self.search_mode == 'adaptive' and best['score'] >= self.early_exit_score:
+                    # Drain the attempts already running instead of starting new ones
+                    continue
+                for _ in done:
+                    submit_next()
+        finally:
+            # Queued attempts are dropped; running ones are waited for so tesseract is idle on return
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        best['words'] = WordBoxes.from_tesseract(best_data)
+        return best
+
+    def _attempt_variant(self, variants: LazyVariants, variant_index: int, config: str,
+                         engine: Optional[OCREngine] = None) -> tuple[str, float, float, dict[str, list[Any]]]:
+        """Run one OCR attempt on a lazily generated variant and release the variant afterwards."""
+        try:
+            return self._run_attempt(variants.acquire(variant_index), config, engine)
+        finally:
+            variants.release(variant_index)
+
+    def correct_orientation(self, image_path: Union[str, ImageAnalysisContext],
+                            orientation: Optional[dict[str, Any]] = None) -> tuple[ImageAnalysisContext, int, float]:
+        """
+        Rotate a page upright and straighten its text lines.
+
+        Multiples of 90° are applied losslessly by reordering pixels; only the
+        remaining skew, when it is large enough to matter, is resampled.
+
+        Args:
+            image_path (str | ImageAnalysisContext): Path to the image file or a
+                shared analysis context of it
+            orientation (dict): Earlier detect_orientation result of the same
+                image; detected now when not given
+
+        Returns:
+            tuple: (context of the corrected image, clockwise rotation in
+                multiples of 90° applied, clockwise skew correction applied)
+        """
+        context = self._get_context(image_path)
+        if not self.auto_rotate:
+            return context, 0, 0.0
+
+        try:
+            if orientation is None:
+                orientation = self.detect_orientation(context)
+            rotation = int(orientation.get('recommended_rotation', 0)) % 360
+            skew = float(orientation.get('skew', 0.0))
+            if not self.MIN_DESKEW_ANGLE <= abs(skew) <= self.MAX_DESKEW_ANGLE:
+                skew = 0.0
+            if not rotation and not skew:
+                return context, 0, 0.0
+
+            gray = context.gray
+            if rotation:
+                # np.rot90 turns counter-clockwise for positive k
+                gray = np.ascontiguousarray(np.rot90(gray, k=-rotation // 90))
+
+            if skew:
+                height, width = gray.shape
+                matrix, new_width, new_height = self._deskew_matrix(width, height, skew)
+                gray = cv2.warpAffine(gray, matrix[:2], (new_width, new_height),
+                                      flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+
+            self.logger.debug(f"Rotated {context} by {rotation}° and deskewed by {skew:.1f}° ({orientation.get('method')})")
+            return ImageAnalysisContext(image=Image.fromarray(gray)), rotation, skew
+
+        except Exception as e:
+            self.logger.debug(f"Orientation correction failed: {e}")
+            return context, 0, 0.0
+
+    @staticmethod
+    def _deskew_matrix(width: int, height: int, skew: float) -> tuple[np.ndarray, int, int]:
+        """
+        Build the transform that straightens a page by a clockwise skew.
+
+        The canvas grows so no text is cut off at the corners.
+
+        Args:
+            width (int): Page width in pixels
+            height (int): Page height in pixels
+            skew (float): Clockwise correction in degrees
+
+        Returns:
+            tuple: (3x3 affine matrix, new width, new height)
+        """
+        matrix = cv2.getRotationMatrix2D((width / 2, height / 2), -skew, 1.0)
+        cos, sin = abs(matrix[0, 0]), abs(matrix[0, 1])
+        new_width, new_height = int(height * sin + width * cos), int(height * cos + width * sin)
+        matrix[0, 2] += (new_width - width) / 2
+        matrix[1, 2] += (new_height - height) / 2
+        return np.vstack([matrix, [0.0, 0.0, 1.0]]), new_width, new_height
+
+    def _working_transform(self, width: int, height: int, rotation: int, skew: float, scale: float) -> np.ndarray:
+        """
+        Build the transform from original image pixels to working image pixels.
+
+        Args:
+            width (int): Original image width
+            height (int): Original image height
+            rotation (int): Clockwise rotation applied, a multiple of 90°
+            skew (float): Clockwise skew correction applied
+            scale (float): Resolution scale factor applied
+
+        Returns:
+            np.ndarray: 3x3 affine matrix; invert it to map working coordinates back
+        """
+        rotation %= 360
+        if rotation == 90:
+            transform = np.array([[0, -1, height], [1, 0, 0], [0, 0, 1]], dtype=np.float64)
+        elif rotation == 180:
+            transform = np.array([[-1, 0, width], [0, -1, height], [0, 0, 1]], dtype=np.float64)
+        elif rotation == 270:
+            transform = np.array([[0, 1, 0], [-1, 0, width], [0, 0, 1]], dtype=np.float64)
+        else:
+            transform = np.eye(3)
+
+        if skew:
+            upright_width, upright_height = (height, width) if rotation in (90, 270) else (width, height)
+            transform = self._deskew_matrix(upright_width, upright_height, skew)[0] @ transform
+
+        return np.diag([scale, scale, 1.0]) @ transform
+
+    def normalize_resolution(self, image_path: Union[str, ImageAnalysisContext]) -> tuple[ImageAnalysisContext, float]:
+        """
+        Rescale an image so its text is at the optimal working height for tesseract.
+
+        Oversized camera photos are shrunk, which cuts tesseract and OpenCV time
+        without losing accuracy; tiny text is enlarged. Images whose estimated
+        text height is already within about 25% of the target are left alone.
+
+        Args:
+            image_path (str | ImageAnalysisContext): Path to the image file or a
+                shared analysis context of it
+
+        Returns:
+            tuple: (context of the working image, scale factor applied). Divide
+                coordinates in the working image by the scale factor to map
+                them back to the original image.
+        """
+        context = self._get_context(image_path)
+        if self.target_text_height is None:
+            return context, 1.0
+
+        try:
+            text_height = context.text_height
+            if not text_height:
+                return context, 1.0
+
+            scale = self.target_text_height / text_height
+            if 0.8 <= scale <= 1.25:
+                return context, 1.0
+            scale = min(self.MAX_SCALE_FACTOR, max(self.MIN_SCALE_FACTOR, scale))
+
+            interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_CUBIC
+            resized = cv2.resize(context.gray, None, fx=scale, fy=scale, interpolation=interpolation)
+            self.logger.debug(f"Rescaled {context} by {scale:.2f} (text height {text_height:.1f}px)")
+            return ImageAnalysisContext(image=Image.fromarray(resized)), scale
+
+        except Exception as e:
+            self.logger.debug(f"Resolution normalization failed: {e}")
+            return context, 1.0
+
+    def _candidate_order(self, variant_count: int, bucket: Optional[str] = None) -> list[tuple[int, str]]:
+        """
+        Get the (variant index, PSM config) pairs to try, in order.
+
+        Exhaustive mode keeps the original grid order. Adaptive mode puts the
+        combinations that usually win on worksheet scans first so that the
+        early exit triggers after as few tesseract calls as possible; with
+        telemetry, that order is learned from the candidate scores of similar images.
+
+        Args:
+            variant_count (int): Number of preprocessed variants available
+            bucket (str): Telemetry quality bucket of the image
+
+        Returns:
+            list: Ordered (variant index, config) pairs
+        """
+        if self.search_mode == 'exhaustive':
+            return [(index, config) for index in range(variant_count) for config in self.PSM_CONFIGS]
+
+        names = self.variant_names[:variant_count]
+        variant_priority = [names.index(name) for name in self.ADAPTIVE_VARIANT_PRIORITY if name in names]
+        variant_priority += [index for index in range(variant_count) if index not in variant_priority]
+
+        if self.telemetry is not None and bucket is not None and variant_count == len(self.variant_names):
+            predicted = self.telemetry.predict_order(
+                bucket, [names[index] for index in variant_priority], list(self.PSM_CONFIGS)
+            )
+            if predicted:
+                return [(names.index(variant), config) for variant, config in predicted]
+
+        return [(index, config) for index in variant_priority for config in self.PSM_CONFIGS]
+
+    def _variant_name(self, variant_index: int, preprocess: bool = True) -> str:
+        """Get a readable name for a preprocessed variant index."""
+        if not preprocess:
+            return 'original'
+        if variant_index < len(self.variant_names):
+            return self.variant_names[variant_index]
+        return f"variant_{variant_index}"
+
+    def _run_attempt(self, img: Image.Image, config: str,
+                     engine: Optional[OCREngine] = None) -> tuple[str, float, float, dict[str, list[Any]]]:
+        """
+        Run a single OCR attempt and score the result.
+
+        Args:
+            img (Image.Image): Image to run tesseract on
+            config (str): Tesseract configuration string
+            engine (OCREngine): Engine to recognize with; defaults to the processor's engine
+
+        Returns:
+            tuple: (cleaned text, combined score, average confidence, word-level
+                image_to_data dictionary, empty when only plain text was available)
+        """
+        engine = engine or self.engine
+
+        # Try to get confidence data
+        try:
+            data = engine.image_to_data(img, config=config)
+            return self._score_data(data) + (data,)
+        except Exception:
+            # Fallback to simple OCR if no confidence data
+            text = engine.image_to_string(img, config=config)
+            avg_confidence = 50  # Default confidence
+
+        # Clean up extracted text
+        cleaned_text = self._clean_text(text)
+
+        # Score this attempt
+        text_score = self._score_text_quality(cleaned_text)
+        combined_score = (avg_confidence + text_score) / 2
+
+        return cleaned_text, combined_score, avg_confidence, {}
+
+    def _score_data(self, data: dict[str, list[Any]]) -> tuple[str, float, float]:
+        """
+        Score the word-level data of an OCR attempt.
+
+        Args:
+            data (dict): image_to_data dictionary
+
+        Returns:
+            tuple: (cleaned text, combined score, average confidence)
+        """
+        if not (isinstance(data, dict) and 'conf' in data and 'text' in data):
+            raise ValueError(f"Invalid data format from {self.engine.name}")
+
+        confidences = [int(conf) for conf in data['conf'] if int(conf) > 0]
+        avg_confidence = sum(confidences) / len(confidences) if confidences else 0
+        text = ' '.join([data['text'][i] for i, conf in enumerate(data['conf']) if int(conf) > 30])
+
+        cleaned_text = self._clean_text(text)
+        combined_score = (avg_confidence + self._score_text_quality(cleaned_text)) / 2
+        return cleaned_text, combined_score, avg_confidence
+
+    def _run_attempts_batch(self, images: list[Image.Image], config: str,
+                            engine: Optional[OCREngine] = None) -> list[Optional[tuple[str, float, float, dict[str, list[Any]]]]]:
+        """
+        Run one OCR attempt on each of many images with batched engine calls.
+
+        The images are split into one chunk per thread and each chunk is sent
+        to the engine in a single call, so the per-call startup cost is paid
+        once per chunk instead of once per image.
+
+        Args:
+            images (list): Images to run tesseract on
+            config (str): Tesseract configuration string shared by all images
+            engine (OCREngine): Engine to recognize with; defaults to the processor's engine
+
+        Returns:
+            list: _run_attempt results in input order, None where an attempt failed
+        """
+        engine = engine or self.engine
+        chunk_count = min(self.threads, len(images))
+        chunks = [images[start::chunk_count] for start in range(chunk_count)]
+
+        def run_chunk(chunk: list[Image.Image]) -> list[Optional[tuple[str, float, float, dict[str, list[Any]]]]]:
+            try:
+                return [self._score_data(data) + (data,) for data in engine.image_to_data_batch(chunk, config=config)]
+            except Exception as e:
+                # Retry one by one so a single bad image does not fail the whole chunk
+                self.logger.debug(f"Batched OCR failed with config {config}: {e}")
+
+            attempts: list[Optional[tuple[str, float, float, dict[str, list[Any]]]]] = []
+            for image in chunk:
+                try:
+                    attempts.append(self._run_attempt(image, config, engine))
+                except Exception as e:
+                    self.logger.debug(f"OCR attempt failed with config {config}: {e}")
+                    attempts.append(None)
+            return attempts
+
+        if chunk_count > 1:
+            with ThreadPoolExecutor(max_workers=chunk_count) as executor:
+                chunk_results = list(executor.map(run_chunk, chunks))
+        else:
+            chunk_results = [run_chunk(chunk) for chunk in chunks]
+
+        # Chunks hold every chunk_count-th image; interleave them back into input order
+        results: list[Optional[tuple[str, float, float, dict[str, list[Any]]]]] = [None] * len(images)
+        for start, chunk_result in enumerate(chunk_results):
+            results[start::chunk_count] = chunk_result
+        return results
 
     def _score_text_quality(self, text: str) -> int:
         """
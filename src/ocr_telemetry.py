@@ -0,0 +1,273 @@
+import bisect
+import json
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+
+class OCRTelemetry:
+    """
+    Record of how each preprocessing variant and PSM config scored in OCR searches.
+    Searches are grouped by a coarse bucket of the image's quality metrics, and
+    the candidate scores of similar images predict the candidate order for new
+    ones. Stored in SQLite so every worker process learns from the whole corpus.
+    """
+
+    # Quality metric thresholds that split images into buckets (same cut points as the quality grade)
+    SHARPNESS_LEVELS: tuple[float, ...] = (10, 50, 100)
+    CONTRAST_LEVELS: tuple[float, ...] = (10, 30, 50)
+    NOISE_LEVELS: tuple[float, ...] = (50, 100, 200)
+    BRIGHTNESS_LEVELS: tuple[float, ...] = (50, 200)
+
+    # Quality metrics stored with each search for the OCR-yield predictor
+    METRIC_FIELDS: tuple[str, ...] = ('sharpness', 'contrast', 'brightness', 'noise_level', 'text_regions')
+
+    # Search mode recorded for images the OCR-yield predictor skipped without a search
+    SKIPPED_MODE: str = 'skipped'
+
+    # Weight, in attempts, of the average candidate score that each candidate's mean is shrunk towards
+    PRIOR_ATTEMPTS: int = 5
+
+    def __init__(self, path: str, min_samples: int = 20, max_rows: int = 50000):
+        """
+        Initialize the telemetry store.
+
+        Args:
+            path (str): Path of the SQLite database file
+            min_samples (int): Recorded searches needed before a bucket (or,
+                failing that, the whole history) is trusted to reorder candidates
+            max_rows (int): Number of most recent searches kept; older ones are
+                pruned as new ones are recorded
+        """
+        self.logger: logging.Logger = logging.getLogger(__name__)
+        self.path: str = path
+        self.min_samples: int = min_samples
+        self.max_rows: int = max_rows
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS searches ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, created REAL NOT NULL, bucket TEXT NOT NULL, "
+                "variant TEXT, psm TEXT, score REAL NOT NULL, attempts INTEGER NOT NULL, search_mode TEXT NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS searches_bucket ON searches (bucket)")
+            # Score of every candidate a search attempted, not just the winner
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS candidates ("
+                "search_id INTEGER NOT NULL, variant TEXT NOT NULL, psm TEXT NOT NULL, score REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS candidates_search ON candidates (search_id)")
+            # Stores created before metrics were recorded get the column added
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(searches)")}
+            if 'metrics' not in columns:
+                conn.execute("ALTER TABLE searches ADD COLUMN metrics TEXT")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a transaction; one connection per operation keeps the store thread- and fork-safe."""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @classmethod
+    def quality_bucket(cls, metrics: dict[str, Any]) -> str:
+        """
+        Get the bucket of an image from its quality metrics.
+
+        Args:
+            metrics (dict): Metrics from OCRProcessor.assess_image_quality
+
+        Returns:
+            str: Bucket name such as 's3c2n0b1', or 'unknown' without metrics
+        """
+        if not metrics:
+            return 'unknown'
+
+        return (
+            f"s{bisect.bisect_left(cls.SHARPNESS_LEVELS, metrics.get('sharpness', 0))}"
+            f"c{bisect.bisect_left(cls.CONTRAST_LEVELS, metrics.get('contrast', 0))}"
+            f"n{bisect.bisect_left(cls.NOISE_LEVELS, metrics.get('noise_level', 0))}"
+            f"b{bisect.bisect_right(cls.BRIGHTNESS_LEVELS, metrics.get('brightness', 0))}"
+        )
+
+    def record(self, bucket: str, variant: Optional[str], psm: Optional[str], score: float,
+               attempts: int, search_mode: str, metrics: Optional[dict[str, Any]] = None,
+               candidates: Optional[list[tuple[str, str, float]]] = None) -> None:
+        """
+        Record the outcome of one OCR search and prune the oldest searches beyond max_rows.
+
+        Args:
+            bucket (str): Quality bucket of the image
+            variant (str): Winning variant name, or None when no text was found
+            psm (str): Winning PSM config, or None when no text was found
+            score (float): Score of the winning candidate
+            attempts (int): Number of tesseract calls made
+            search_mode (str): Search mode used, or SKIPPED_MODE for an image
+                that was skipped without a search
+            metrics (dict): Quality metrics of the image, kept for the OCR-yield predictor
+            candidates (list): (variant, psm, score) of every candidate the
+                search attempted, used to predict the candidate order
+        """
+        stored_metrics = None
+        if metrics:
+            stored_metrics = json.dumps({field: float(metrics.get(field, 0)) for field in self.METRIC_FIELDS})
+        try:
+            with self._connect() as conn:
+                search_id = conn.execute(
+                    "INSERT INTO searches (created, bucket, variant, psm, score, attempts, search_mode, metrics) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (time.time(), bucket, variant, psm, float(score), int(attempts), search_mode, stored_metrics)
+                ).lastrowid
+                if candidates:
+                    conn.executemany(
+                        "INSERT INTO candidates (search_id, variant, psm, score) VALUES (?, ?, ?, ?)",
+                        [(search_id, name, config, float(value)) for name, config, value in candidates]
+                    )
+                # Ids only grow, so everything at or below the cutoff is older than the newest max_rows searches
+                cutoff = search_id - self.max_rows
+                if cutoff > 0:
+                    conn.execute("DELETE FROM searches WHERE id <= ?", (cutoff,))
+                    conn.execute("DELETE FROM candidates WHERE search_id <= ?", (cutoff,))
+        except sqlite3.Error as e:
+            self.logger.warning(f"Telemetry write failed: {e}")
+
+    def predict_order(self, bucket: str, variants: list[str], configs: list[str]) -> Optional[list[tuple[str, str]]]:
+        """
+        Predict the best candidate order for an image from past candidate scores.
+
+        Every attempted candidate is scored, not just the winner, so a candidate
+        that an adaptive search tried first and that kept scoring low falls
+        behind one tried later that scored higher. Each candidate's mean score
+        is shrunk towards the average of all candidates by PRIOR_ATTEMPTS, so
+        a few attempts do not outweigh many and candidates that were never
+        tried stay in between. Variants are ranked by their best candidate,
+        and each variant's PSM configs by their own score, so a variant's
+        preprocessing stays in use for all its configs. Ties keep the given order.
+
+        Args:
+            bucket (str): Quality bucket of the image
+            variants (list): Variant names in default priority order
+            configs (list): PSM configs in default priority order
+
+        Returns:
+            list: Ordered (variant, config) pairs, or None when too few searches
+                have been recorded to beat the default order
+        """
+        query = (
+            "SELECT c.variant, c.psm, COUNT(*), SUM(c.score) "
+            "FROM candidates c JOIN searches s ON s.id = c.search_id {where} GROUP BY c.variant, c.psm"
+        )
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(query.format(where="WHERE s.bucket = ?"), (bucket,)).fetchall()
+                searches = conn.execute(
+                    "SELECT COUNT(DISTINCT c.search_id) FROM candidates c JOIN searches s ON s.id = c.search_id "
+                    "WHERE s.bucket = ?", (bucket,)
+                ).fetchone()[0]
+                if searches < self.min_samples:
+                    # Too little history for this kind of image; learn from all images
+                    rows = conn.execute(query.format(where="")).fetchall()
+                    searches = conn.execute("SELECT COUNT(DISTINCT search_id) FROM candidates").fetchone()[0]
+        except sqlite3.Error as e:
+            self.logger.warning(f"Telemetry lookup failed: {e}")
+            return None
+
+        pairs = {(variant, psm): (count, total) for variant, psm, count, total in rows
+                 if variant in variants and psm in configs}
+        if searches < self.min_samples or not pairs:
+            return None
+
+        prior = sum(total for _, total in pairs.values()) / sum(count for count, _ in pairs.values())
+
+        def expected_score(variant: str, config: str) -> float:
+            count, total = pairs.get((variant, config), (0, 0.0))
+            return (total + prior * self.PRIOR_ATTEMPTS) / (count + self.PRIOR_ATTEMPTS)
+
+        variant_scores = {variant: max(expected_score(variant, config) for config in configs) for variant in variants}
+        ordered_variants = sorted(variants, key=lambda v: (-variant_scores[v], variants.index(v)))
+        return [
+            (variant, config)
+            for variant in ordered_variants
+            for config in sorted(configs, key=lambda c: (-expected_score(variant, c), configs.index(c)))
+        ]
+
+    def history(self, success_score: float, limit: int = 5000) -> list[tuple[dict[str, float], bool]]:
+        """
+        Get the quality metrics and outcome of recent searches.
+
+        Skipped images are left out: no search ran, so their outcome is unknown,
+        and counting them as failures would only confirm the skip.
+
+        Args:
+            success_score (float): Score a search must reach to count as a success
+            limit (int): Maximum number of searches, newest first
+
+        Returns:
+            list: (metrics, whether the score reached success_score) pairs of
+                searches recorded with metrics
+        """
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT metrics, variant IS NOT NULL AND score >= ? FROM searches "
+                    "WHERE metrics IS NOT NULL AND search_mode != ? ORDER BY id DESC LIMIT ?",
+                    (float(success_score), self.SKIPPED_MODE, int(limit))
+                ).fetchall()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Telemetry lookup failed: {e}")
+            return []
+        return [(json.loads(metrics), bool(success)) for metrics, success in rows]
+
+    def clear(self) -> None:
+        """Remove all recorded searches."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM searches")
+            conn.execute("DELETE FROM candidates")
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get win statistics of the recorded searches.
+
+        Returns:
+            dict: Number of searches, failures and skipped images, average
+                tesseract calls per search, and the wins of each (variant, psm)
+                pair with their share of successful searches, most frequent first
+        """
+        with self._connect() as conn:
+            searches, failures, avg_attempts = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(variant IS NULL), 0), COALESCE(AVG(attempts), 0) FROM searches "
+                "WHERE search_mode != ?", (self.SKIPPED_MODE,)
+            ).fetchone()
+            skipped = conn.execute("SELECT COUNT(*) FROM searches WHERE search_mode = ?",
+                                   (self.SKIPPED_MODE,)).fetchone()[0]
+            rows = conn.execute(
+                "SELECT variant, psm, COUNT(*), AVG(score) FROM searches WHERE variant IS NOT NULL "
+                "GROUP BY variant, psm ORDER BY COUNT(*) DESC"
+            ).fetchall()
+            buckets = dict(conn.execute("SELECT bucket, COUNT(*) FROM searches GROUP BY bucket").fetchall())
+
+        successes = searches - failures
+        return {
+            'searches': searches,
+            'failures': failures,
+            'skipped': skipped,
+            'avg_attempts': avg_attempts,
+            'wins': [
+                {
+                    'variant': variant,
+                    'psm': psm,
+                    'wins': count,
+                    'share': count / successes if successes else 0.0,
+                    'avg_score': avg_score
+                }
+                for variant, psm, count, avg_score in rows
+            ],
+            'buckets': buckets
+        }
@@ -0,0 +1,118 @@
+import importlib
+import threading
+from typing import Callable
+
+import cv2
+import numpy as np
+from PIL import Image
+
+# A preprocessing variant turns a uint8 grayscale page into a uint8 image for tesseract
+VariantFunction = Callable[[np.ndarray], np.ndarray]
+
+
+def grayscale(gray: np.ndarray) -> np.ndarray:
+    """Original grayscale (baseline)."""
+    return gray
+
+
+def blurred(gray: np.ndarray) -> np.ndarray:
+    """Gaussian blur to reduce noise."""
+    return cv2.GaussianBlur(gray, (3, 3), 0)
+
+
+def adaptive_threshold(gray: np.ndarray) -> np.ndarray:
+    """Adaptive threshold (good for uneven lighting)."""
+    return cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2)
+
+
+def morph_close(gray: np.ndarray) -> np.ndarray:
+    """Adaptive threshold followed by a morphological close to clean up text."""
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
+    return cv2.morphologyEx(adaptive_threshold(gray), cv2.MORPH_CLOSE, kernel)
+
+
+# Built-in variants by configuration name
+VARIANTS: dict[str, VariantFunction] = {
+    'grayscale': grayscale,
+    'blurred': blurred,
+    'adaptive_threshold': adaptive_threshold,
+    'morph_close': morph_close,
+}
+
+
+def register_variant(name: str, function: VariantFunction) -> None:
+    """
+    Register a preprocessing variant so it can be selected by name.
+
+    Args:
+        name (str): Variant name used in the 'variants' OCR setting
+        function (callable): Function from a uint8 grayscale array to a uint8 image array
+    """
+    VARIANTS[name] = function
+
+
+def resolve_variant(spec: str) -> VariantFunction:
+    """
+    Look up a preprocessing variant.
+
+    Args:
+        spec (str): Registered variant name, or 'package.module:function' of a
+            variant defined outside this module
+
+    Returns:
+        callable: Variant function
+    """
+    if spec in VARIANTS:
+        return VARIANTS[spec]
+
+    module_name, _, function_name = spec.partition(':')
+    if not function_name:
+        raise ValueError(f"Unknown preprocessing variant: {spec}")
+    function = getattr(importlib.import_module(module_name), function_name)
+    if not callable(function):
+        raise ValueError(f"Preprocessing variant is not callable: {spec}")
+    return function
+
+
+class LazyVariants:
+    """
+    Preprocessed images of one page, generated on first use and released after
+    their last planned use. Only the variants of the OCR attempts in flight are
+    held in memory instead of every variant for the whole search.
+    """
+
+    def __init__(self, gray: np.ndarray, functions: list[VariantFunction], uses: list[int]):
+        """
+        Initialize the lazy variants.
+
+        Args:
+            gray (np.ndarray): Grayscale page the variants are generated from
+            functions (list): Variant functions, indexed by variant
+            uses (list): Variant index of every planned OCR attempt
+        """
+        self.gray: np.ndarray = gray
+        self.functions: list[VariantFunction] = functions
+        self._remaining: dict[int, int] = {}
+        for index in uses:
+            self._remaining[index] = self._remaining.get(index, 0) + 1
+        self._images: dict[int, Image.Image] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def acquire(self, index: int) -> Image.Image:
+        """Get a variant image, generating it if it is not held yet."""
+        with self._lock:
+            if index not in self._images:
+                self._images[index] = Image.fromarray(self.functions[index](self.gray))
+            return self._images[index]
+
+    def release(self, index: int) -> None:
+        """Mark one use of a variant as finished, dropping it after its last use."""
+        with self._lock:
+            self._remaining[index] = self._remaining.get(index, 1) - 1
+            if self._remaining[index] <= 0:
+                self._images.pop(index, None)
+
+    def held(self) -> int:
+        """Number of variant images currently held in memory."""
+        with self._lock:
+            return len(self._images)
@@ -0,0 +1,234 @@
+import os
+from typing import Any, Optional
+
+import numpy as np
+
+# Extension of the word-level sidecar file saved next to an image
+SIDECAR_EXTENSION: str = '.words.npz'
+
+
+def sidecar_path(image_path: str) -> str:
+    """
+    Get the path of the word-level sidecar file of an image.
+
+    Args:
+        image_path (str): Path to the image file
+
+    Returns:
+        str: Path such as 'page.words.npz' for 'page.png'
+    """
+    return os.path.splitext(image_path)[0] + SIDECAR_EXTENSION
+
+
+class WordBoxes:
+    """
+    Word-level OCR results stored column by column in numpy arrays: the word
+    text, tesseract confidence, pixel box and block/paragraph/line/word
+    numbering. Compact enough to persist next to every image and reload for
+    review, confidence filtering and highlighting without re-running OCR.
+    """
+
+    def __init__(self, text: np.ndarray, confidence: np.ndarray, boxes: np.ndarray, numbering: np.ndarray):
+        """
+        Initialize the word boxes.
+
+        Args:
+            text (np.ndarray): Word strings, shape (n,)
+            confidence (np.ndarray): Tesseract confidences 0-100, float32, shape (n,)
+            boxes (np.ndarray): left, top, width, height in pixels, int32, shape (n, 4)
+            numbering (np.ndarray): block, paragraph, line and word numbers, int32, shape (n, 4)
+        """
+        self.text: np.ndarray = text
+        self.confidence: np.ndarray = confidence
+        self.boxes: np.ndarray = boxes
+        self.numbering: np.ndarray = numbering
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __repr__(self) -> str:
+        return f"WordBoxes({len(self)} words)"
+
+    @classmethod
+    def empty(cls) -> 'WordBoxes':
+        """Create word boxes holding no words."""
+        return cls(np.array([], dtype=str), np.zeros(0, dtype=np.float32),
+                   np.zeros((0, 4), dtype=np.int32), np.zeros((0, 4), dtype=np.int32))
+
+    @classmethod
+    def from_tesseract(cls, data: dict[str, list[Any]], offset: tuple[int, int] = (0, 0)) -> 'WordBoxes':
+        """
+        Build word boxes from tesseract's image_to_data dictionary.
+
+        Args:
+            data (dict): Columns in pytesseract's Output.DICT layout
+            offset (tuple): (x, y) added to every box, e.g. the position of a
+                cropped region in the page
+
+        Returns:
+            WordBoxes: The recognized words, without empty and non-word entries
+        """
+        keep = [i for i, word in enumerate(data.get('text', []))
+                if str(word).strip() and float(data['conf'][i]) >= 0]
+        if not keep:
+            return cls.empty()
+
+        def column(name: str) -> np.ndarray:
+            return np.array([data[name][i] for i in keep], dtype=np.int32)
+
+        boxes = np.stack([column('left'), column('top'), column('width'), column('height')], axis=1)
+        boxes[:, 0] += offset[0]
+        boxes[:, 1] += offset[1]
+        return cls(
+            np.array([str(data['text'][i]).strip() for i in keep]),
+            np.array([float(data['conf'][i]) for i in keep], dtype=np.float32),
+            boxes,
+            np.stack([column('block_num'), column('par_num'), column('line_num'), column('word_num')], axis=1)
+        )
+
+    @classmethod
+    def concatenate(cls, parts: list['WordBoxes']) -> 'WordBoxes':
+        """Join word boxes, keeping their order."""
+        parts = [part for part in parts if len(part)]
+        if not parts:
+            return cls.empty()
+        return cls(
+            np.concatenate([part.text for part in parts]),
+            np.concatenate([part.confidence for part in parts]),
+            np.concatenate([part.boxes for part in parts]),
+            np.concatenate([part.numbering for part in parts])
+        )
+
+    def transformed(self, matrix: np.ndarray) -> 'WordBoxes':
+        """
+        Map the boxes through an affine transform.
+
+        Each box is replaced by the axis-aligned bounding box of its
+        transformed corners, so rotations other than multiples of 90° grow the
+        boxes slightly.
+
+        Args:
+            matrix (np.ndarray): 2x3 or 3x3 affine matrix from the current to the
+                target pixel coordinates
+
+        Returns:
+            WordBoxes: Words with boxes in the target coordinates
+        """
+        if not len(self):
+            return self
+
+        left, top = self.boxes[:, 0].astype(np.float64), self.boxes[:, 1].astype(np.float64)
+        right, bottom = left + self.boxes[:, 2], top + self.boxes[:, 3]
+        xs = np.stack([left, right, right, left], axis=1)
+        ys = np.stack([top, top, bottom, bottom], axis=1)
+
+        new_xs = matrix[0, 0] * xs + matrix[0, 1] * ys + matrix[0, 2]
+        new_ys = matrix[1, 0] * xs + matrix[1, 1] * ys + matrix[1, 2]
+        x1, y1 = np.floor(new_xs.min(axis=1)), np.floor(new_ys.min(axis=1))
+        x2, y2 = np.ceil(new_xs.max(axis=1)), np.ceil(new_ys.max(axis=1))
+        boxes = np.stack([x1, y1, x2 - x1, y2 - y1], axis=1).astype(np.int32)
+        return WordBoxes(self.text, self.confidence, boxes, self.numbering)
+
+    def filter(self, min_confidence: Optional[float] = None, max_confidence: Optional[float] = None) -> 'WordBoxes':
+        """
+        Select words by confidence.
+
+        Args:
+            min_confidence (float): Keep words with at least this confidence
+            max_confidence (float): Keep words below this confidence
+
+        Returns:
+            WordBoxes: The selected words
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if min_confidence is not None:
+            mask &= self.confidence >= min_confidence
+        if max_confidence is not None:
+            mask &= self.confidence < max_confidence
+        return WordBoxes(self.text[mask], self.confidence[mask], self.boxes[mask], self.numbering[mask])
+
+    def mean_confidence(self) -> float:
+        """Average confidence of the words, 0 when there are none."""
+        return float(self.confidence.mean()) if len(self) else 0.0
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """
+        Convert to one dictionary per word.
+
+        Returns:
+            list: Dictionaries with 'text', 'confidence', 'left', 'top', 'width' and 'height'
+        """
+        return [
+            {
+                'text': str(text),
+                'confidence': float(confidence),
+                'left': int(box[0]),
+                'top': int(box[1]),
+                'width': int(box[2]),
+                'height': int(box[3])
+            }
+            for text, confidence, box in zip(self.text, self.confidence, self.boxes)
+        ]
+
+    def to_dict(self) -> dict[str, list[Any]]:
+        """
+        Convert to JSON-serializable columns, e.g. for the OCR result cache.
+
+        Returns:
+            dict: 'text', 'confidence', 'boxes' and 'numbering' as lists
+        """
+        return {
+            'text': [str(text) for text in self.text],
+            'confidence': self.confidence.tolist(),
+            'boxes': self.boxes.tolist(),
+            'numbering': self.numbering.tolist()
+        }
+
+    @classmethod
+    def from_dict(cls, columns: dict[str, list[Any]]) -> 'WordBoxes':
+        """
+        Create word boxes from the columns of to_dict().
+
+        Args:
+            columns (dict): Columns as returned by to_dict()
+
+        Returns:
+            WordBoxes: The words
+        """
+        if not columns.get('text'):
+            return cls.empty()
+        return cls(
+            np.array(columns['text'], dtype=str),
+            np.array(columns['confidence'], dtype=np.float32),
+            np.array(columns['boxes'], dtype=np.int32).reshape(-1, 4),
+            np.array(columns['numbering'], dtype=np.int32).reshape(-1, 4)
+        )
+
+    def save(self, path: str) -> str:
+        """
+        Save the words as a compressed .npz file.
+
+        Args:
+            path (str): Destination path, usually from sidecar_path()
+
+        Returns:
+            str: The path written
+        """
+        with open(path, 'wb') as f:
+            np.savez_compressed(f, text=self.text, confidence=self.confidence,
+                                boxes=self.boxes, numbering=self.numbering)
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> 'WordBoxes':
+        """
+        Load words saved with save().
+
+        Args:
+            path (str): Path of the .npz file
+
+        Returns:
+            WordBoxes: The saved words
+        """
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data['text'], data['confidence'], data['boxes'], data['numbering'])
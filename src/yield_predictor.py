@@ -0,0 +1,167 @@
+import logging
+import math
+import time
+from typing import Any, Optional
+
+import numpy as np
+
+from src.ocr_telemetry import OCRTelemetry
+
+
+class YieldPredictor:
+    """
+    Predicts from the cheap quality metrics of an image whether OCR will read
+    usable text from it, i.e. reach the usable score, before any tesseract call is made.
+    A logistic regression is fitted on the outcomes recorded in the OCR
+    telemetry; until enough history exists, a prior derived from the quality
+    score is used. The prediction
+    decides whether an image is OCR'd normally, with the aggressive path, or
+    skipped so the user can retake it.
+    """
+
+    # Seconds between checks for new history to refit on
+    REFIT_INTERVAL: float = 300.0
+
+    # Gradient descent settings of the logistic regression
+    LEARNING_RATE: float = 0.5
+    ITERATIONS: int = 500
+    L2_PENALTY: float = 1e-3
+
+    def __init__(self, telemetry: Optional[OCRTelemetry] = None, skip_below: float = 0.05,
+                 aggressive_below: float = 0.3, min_samples: int = 50, usable_score: float = 50.0):
+        """
+        Initialize the predictor.
+
+        Args:
+            telemetry (OCRTelemetry): Search history to fit on; without it only
+                the quality-score prior is used
+            skip_below (float): Success probability below which an image is skipped
+            aggressive_below (float): Success probability below which the
+                aggressive OCR path is used
+            min_samples (int): Recorded searches, with both successes and
+                failures, needed before the fitted model replaces the prior
+            usable_score (float): OCR score a search must reach with non-empty
+                text to count as a success; lower than the early-exit score, so
+                images that read well enough without clearing the bar are not
+                taught to the model as failures
+        """
+        self.logger: logging.Logger = logging.getLogger(__name__)
+        self.telemetry: Optional[OCRTelemetry] = telemetry
+        self.skip_below: float = skip_below
+        self.aggressive_below: float = aggressive_below
+        self.min_samples: int = min_samples
+        self.usable_score: float = usable_score
+
+        self._weights: Optional[np.ndarray] = None
+        self._mean: Optional[np.ndarray] = None
+        self._std: Optional[np.ndarray] = None
+        self._samples: int = 0
+        self._checked: float = 0.0
+
+    @staticmethod
+    def features(metrics: dict[str, Any]) -> np.ndarray:
+        """
+        Turn quality metrics into model features.
+
+        Heavy-tailed metrics are log-scaled and brightness is measured as the
+        distance from mid-gray, so both too dark and too bright count against it.
+
+        Args:
+            metrics (dict): Metrics from OCRProcessor.assess_image_quality
+
+        Returns:
+            np.ndarray: Feature vector
+        """
+        return np.array([
+            math.log1p(max(0.0, float(metrics.get('sharpness', 0)))),
+            math.log1p(max(0.0, float(metrics.get('contrast', 0)))),
+            abs(float(metrics.get('brightness', 128)) - 128) / 128,
+            math.log1p(max(0.0, float(metrics.get('noise_level', 0)))),
+            math.log1p(max(0.0, float(metrics.get('text_regions', 0))))
+        ], dtype=np.float64)
+
+    @staticmethod
+    def prior_probability(quality: dict[str, Any]) -> float:
+        """
+        Estimate the success probability from the quality score alone.
+
+        Args:
+            quality (dict): Quality assessment with 'overall_score' and 'metrics'
+
+        Returns:
+            float: Probability that OCR finds text (about 0.5 at a score of 30)
+        """
+        probability = 1 / (1 + math.exp(-(float(quality.get('overall_score', 0)) - 30) / 6))
+        if quality.get('metrics', {}).get('text_regions', 1) == 0:
+            # Nothing text-like was found at all
+            probability *= 0.5
+        return probability
+
+    def fit(self) -> bool:
+        """
+        Fit the logistic regression on the recorded search history.
+
+        Returns:
+            bool: True if a model was fitted, False if the history is too small
+                or has only one outcome
+        """
+        history = self.telemetry.history(self.usable_score) if self.telemetry is not None else []
+        self._samples = len(history)
+        labels = np.array([found for _, found in history], dtype=np.float64)
+        if len(history) < self.min_samples or labels.min(initial=1) == labels.max(initial=0):
+            self._weights = None
+            return False
+
+        features = np.stack([self.features(metrics) for metrics, _ in history])
+        self._mean = features.mean(axis=0)
+        self._std = features.std(axis=0) + 1e-6
+        x = np.hstack([np.ones((len(features), 1)), (features - self._mean) / self._std])
+
+        weights = np.zeros(x.shape[1])
+        for _ in range(self.ITERATIONS):
+            predictions = 1 / (1 + np.exp(-x @ weights))
+            gradient = x.T @ (predictions - labels) / len(labels) + self.L2_PENALTY * np.r_[0, weights[1:]]
+            weights -= self.LEARNING_RATE * gradient
+        self._weights = weights
+
+        self.logger.debug(f"Fitted OCR-yield model on {len(labels)} searches ({labels.mean():.0%} successful)")
+        return True
+
+    def _refresh(self) -> None:
+        """Refit when the history has grown by a tenth since the last fit, checked at most every REFIT_INTERVAL."""
+        if self.telemetry is None or time.time() - self._checked < self.REFIT_INTERVAL:
+            return
+        self._checked = time.time()
+        try:
+            if self._weights is None or len(self.telemetry.history(self.usable_score)) >= self._samples * 1.1:
+                self.fit()
+        except Exception as e:
+            self.logger.warning(f"Could not fit the OCR-yield model: {e}")
+
+    def predict(self, quality: dict[str, Any]) -> dict[str, Any]:
+        """
+        Predict whether OCR will find text in an image and choose how to OCR it.
+
+        Args:
+            quality (dict): Quality assessment with 'overall_score' and 'metrics'
+
+        Returns:
+            dict: 'probability' of reaching the usable score, 'action' ('proceed', 'aggressive'
+                or 'skip') and 'source' ('model' or 'prior')
+        """
+        self._refresh()
+
+        metrics = quality.get('metrics') or {}
+        if self._weights is not None and metrics:
+            x = np.r_[1.0, (self.features(metrics) - self._mean) / self._std]
+            probability, source = float(1 / (1 + np.exp(-x @ self._weights))), 'model'
+        else:
+            probability, source = self.prior_probability(quality), 'prior'
+
+        if probability < self.skip_below:
+            action = 'skip'
+        elif probability < self.aggressive_below:
+            action = 'aggressive'
+        else:
+            action = 'proceed'
+        return {'probability': probability, 'action': action, 'source': source}
@@ -0,0 +1,60 @@
+import os
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+from src.ocr_processor import OCRProcessor
+
+FONT_PATH = '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'
+
+
+def _render_scan(path, size=(4000, 3000), font_size=56, noise=0.0, fmt='PNG'):
+    """Render a synthetic page of text lines, as a phone or flatbed scan would."""
+    image = Image.new('L', size, 235)
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.truetype(FONT_PATH, font_size) if os.path.exists(FONT_PATH) else ImageFont.load_default()
+    line = 'The quick brown fox jumps over the lazy dog 0123456789'
+    for y in range(150, size[1] - 150, int(font_size * 1.8)):
+        draw.text((150, y), line, fill=25, font=font)
+
+    pixels = np.asarray(image, dtype=np.float32)
+    if noise:
+        pixels = pixels + np.random.default_rng(0).normal(0, noise, pixels.shape)
+    Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8)).save(path, fmt, quality=90)
+    return str(path)
+
+
+@pytest.fixture
+def processor():
+    return OCRProcessor(cache=None)
+
+
+@pytest.mark.parametrize('noise', [0.0, 12.0])
+def test_single_and_batch_assessment_agree(tmp_path, processor, noise):
+    path = _render_scan(tmp_path / 'scan.png', noise=noise)
+
+    single = processor.assess_image_quality(path)
+    batch, = processor.assess_image_quality_batch([path])
+
+    assert single['grade'] == batch['grade']
+    assert single['overall_score'] == batch['overall_score']
+
+
+def test_reduced_jpeg_decode_grades_like_full_decode(tmp_path, processor):
+    path = _render_scan(tmp_path / 'scan.jpg', fmt='JPEG')
+
+    single = processor.assess_image_quality(path)
+    batch, = processor.assess_image_quality_batch([path])
+
+    assert single['grade'] == batch['grade']
+    assert abs(single['overall_score'] - batch['overall_score']) <= 5
+
+
+def test_small_image_keeps_full_resolution_metrics(tmp_path, processor):
+    path = _render_scan(tmp_path / 'small.png', size=(1200, 900), font_size=28)
+
+    single = processor.assess_image_quality(path)
+    batch, = processor.assess_image_quality_batch([path])
+
+    assert single == batch
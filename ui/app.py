@@ -2,7 +2,7 @@ import streamlit as st
 import os
 import sys
 import time
-from PIL import Image
+from PIL import Image, ImageDraw
 
 # Add the parent directory to the path to allow imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -20,6 +20,8 @@ try:
     from services.ai_service import AIService
     from src.utils import get_resource_path, get_folder_size
     from data.models.note import ImageInfo
+    from src.image_context import ImageAnalysisContext, hash_file
+    from src.word_data import WordBoxes
 
     # Initialize services
     ocr_service = OCRService()
@@ -35,6 +37,9 @@ except Exception as e:
     st.error("There was a problem initializing the application services.")
     st.stop()
 
+# Words below this tesseract confidence are outlined in the debug view
+LOW_CONFIDENCE_THRESHOLD = 60
+
 # Set page configuration with mobile-friendly settings
 st.set_page_config(
     page_title="SAT/ACT Notes Organizer",
@@ -92,6 +97,9 @@ def initialize_session_state():
         st.session_state.ocr_results = {}
     if 'debug_confirmed' not in st.session_state:
         st.session_state.debug_confirmed = set()
+    if 'image_analysis' not in st.session_state:
+        # Upload-time quality and orientation analysis by image content hash
+        st.session_state.image_analysis = {}
 
 def upload_section():
     """Handle file upload section."""
@@ -107,6 +115,7 @@ def upload_section():
             if st.button("🗑️ Clear Collection", help="Remove all images and start fresh"):
                 st.session_state.uploaded_images = []
                 st.session_state.selected_images = []
+                st.session_state.image_analysis = {}
                 # Clear temp directory using storage service
                 storage_service.clear_temp_directory()
                 st.success("Collection cleared!")
@@ -115,8 +124,8 @@ def upload_section():
     uploaded_files = st.file_uploader(
         "Choose image files",
         accept_multiple_files=True,
-        type=['png', 'jpg', 'jpeg', 'bmp', 'tiff'],
-        help="Select multiple images to upload. They will be added to your collection."
+        type=['png', 'jpg', 'jpeg', 'bmp', 'tiff', 'tif', 'pdf'],
+        help="Select multiple images or multi-page PDF/TIFF scans to upload. They will be added to your collection, one image per page."
     )
 
     # Show newly selected files for upload (if any)
@@ -124,13 +133,38 @@ def upload_section():
         st.subheader(f"📋 New Images Ready to Upload ({len(uploaded_files)})")
         cols = st.columns(min(len(uploaded_files), 3))
 
+        # Grade new files at once, in parallel on reduced copies (PDFs are graded per page after upload).
+        # Results are kept by content hash, so reruns and re-selected files are not analysed again.
+        # Multi-page documents (PDF, TIFF) may be larger than single images
+        max_upload_size = 10 * 1024 * 1024
+        max_document_size = 100 * 1024 * 1024
+        size_limits = {idx: max_document_size if storage_service.is_document_file(f.name) else max_upload_size
+                       for idx, f in enumerate(uploaded_files)}
+        analysis_cache = st.session_state.image_analysis
+        content_hashes = {idx: hash_file(f) for idx, f in enumerate(uploaded_files)
+                          if f.size <= size_limits[idx] and not f.name.lower().endswith('.pdf')}
+        pending_indices = [idx for idx, content_hash in content_hashes.items() if content_hash not in analysis_cache]
+        pending_quality = ocr_service.assess_image_quality_batch([uploaded_files[idx] for idx in pending_indices])
+        for idx, quality_info in zip(pending_indices, pending_quality):
+            analysis_cache[content_hashes[idx]] = {'quality_info': quality_info, 'orientation_info': None}
+
         valid_files = []
         for idx, uploaded_file in enumerate(uploaded_files):
             with cols[idx % 3]:
                 try:
-                    # Validate file size (max 10MB)
-                    if uploaded_file.size > 10 * 1024 * 1024:
-                        st.error(f"File {uploaded_file.name} is too large (>10MB)")
+                    if uploaded_file.name.lower().endswith('.pdf'):
+                        # Multi-page documents are split into page images on upload
+                        if uploaded_file.size > max_document_size:
+                            st.error(f"File {uploaded_file.name} is too large (>100MB)")
+                            continue
+                        st.markdown(f"📑 **{uploaded_file.name}**")
+                        st.caption(f"PDF document - each page is added as a separate image | Size: {uploaded_file.size / 1024:.1f} KB")
+                        valid_files.append(uploaded_file)
+                        continue
+
+                    # Validate file size (max 10MB, 100MB for multi-page TIFFs)
+                    if uploaded_file.size > size_limits[idx]:
+                        st.error(f"File {uploaded_file.name} is too large (>{size_limits[idx] // (1024 * 1024)}MB)")
                         continue
 
                     # Display image preview directly from uploaded file
@@ -145,22 +179,14 @@ def upload_section():
 
                     # Display image quality assessment
                     try:
-                        # Save temporary file to assess quality
-                        temp_assessment_path = os.path.join(get_resource_path('data/temp'), f"temp_assess_{uploaded_file.name}")
-                        os.makedirs(os.path.dirname(temp_assessment_path), exist_ok=True)
-                        uploaded_file.seek(0)
-                        with open(temp_assessment_path, 'wb') as f:
-                            f.write(uploaded_file.read())
-
-                        # Assess image quality
-                        quality_info = ocr_service.assess_image_quality(temp_assessment_path)
-
-                        # Check orientation
-                        orientation_info = ocr_service.detect_orientation(temp_assessment_path)
+                        analysis = analysis_cache[content_hashes[idx]]
+                        quality_info = analysis['quality_info']
 
-                        # Clean up temporary file
-                        if os.path.exists(temp_assessment_path):
-                            os.remove(temp_assessment_path)
+                        # Check orientation on the decoded preview image instead of writing a temporary file
+                        if analysis['orientation_info'] is None:
+                            analysis_context = ImageAnalysisContext(image=image)
+                            analysis['orientation_info'] = ocr_service.detect_orientation(analysis_context)
+                        orientation_info = analysis['orientation_info']
 
                         # Display quality grade with color coding
                         grade_color = {
@@ -180,6 +206,13 @@ def upload_section():
                         st.caption(f"{grade_color} Quality: {quality_info.quality_description} (Grade {quality_info.grade}){orientation_text} | " +
                                  f"Size: {uploaded_file.size / 1024:.1f} KB | Format: {image.format}")
 
+                        # Warn before processing when OCR is predicted to find nothing
+                        prediction = ocr_service.predict_yield(quality_info)
+                        if prediction and prediction['action'] == 'skip':
+                            st.warning(f"📷 This image is unlikely to be readable ({prediction['probability']:.0%} "
+                                       f"predicted OCR success) and will be skipped. Please retake it with better "
+                                       f"lighting and focus.")
+
                         # Show detailed metrics on hover/expander
                         with st.expander("📊 Quality Details", expanded=False):
                             st.write(f"**Overall Score:** {quality_info.overall_score}/100")
@@ -191,6 +224,8 @@ def upload_section():
                                 st.write(f"**Text Regions:** {quality_info.metrics['text_regions']}")
                                 if 'horizontal_lines' in quality_info.metrics:
                                     st.write(f"**Horizontal Lines:** {quality_info.metrics['horizontal_lines']}")
+                            if prediction:
+                                st.write(f"**Predicted OCR Success:** {prediction['probability']:.0%} ({prediction['source']})")
 
                             # Show orientation info
                             st.write("**Orientation:**")
@@ -225,20 +260,37 @@ def upload_section():
                             try:
                                 # Check if file already exists in collection (avoid true duplicates)
                                 existing_names = [img['name'] for img in st.session_state.uploaded_images]
+                                existing_names += [img['source_document'] for img in st.session_state.uploaded_images
+                                                   if img.get('source_document')]
                                 if uploaded_file.name in existing_names:
                                     st.warning(f"⚠️ {uploaded_file.name} already exists in collection, skipping...")
                                     continue
 
-                                # Save to temporary directory using storage service
-                                image_info_obj = storage_service.save_temp_image(uploaded_file, uploaded_file.name)
+                                # Save to temporary directory using storage service; multi-page documents become one image per page
+                                if storage_service.is_multi_page_document(uploaded_file):
+                                    image_info_objs = storage_service.save_document(uploaded_file, uploaded_file.name)
+                                else:
+                                    image_info_obj = storage_service.save_temp_image(uploaded_file, uploaded_file.name)
+                                    # Attach the preview analysis so processing does not repeat it
+                                    image_info_obj.content_hash = hash_file(uploaded_file)
+                                    analysis = analysis_cache.get(image_info_obj.content_hash, {})
+                                    image_info_obj.quality_info = analysis.get('quality_info')
+                                    image_info_obj.orientation_info = analysis.get('orientation_info')
+                                    image_info_objs = [image_info_obj]
 
                                 # Convert to dictionary for session state compatibility
-                                image_info = {
-                                    'name': image_info_obj.name,
-                                    'original_name': image_info_obj.original_name,
-                                    'path': image_info_obj.path
-                                }
-                                new_images.append(image_info)
+                                for image_info_obj in image_info_objs:
+                                    image_info = {
+                                        'name': image_info_obj.name,
+                                        'original_name': image_info_obj.original_name,
+                                        'path': image_info_obj.path,
+                                        'page_number': image_info_obj.page_number,
+                                        'source_document': image_info_obj.source_document,
+                                        'content_hash': image_info_obj.content_hash,
+                                        'quality_info': image_info_obj.quality_info,
+                                        'orientation_info': image_info_obj.orientation_info
+                                    }
+                                    new_images.append(image_info)
                             except Exception as save_error:
                                 st.error(f"Error saving {uploaded_file.name}: {str(save_error)}")
 
@@ -286,6 +338,7 @@ def upload_section():
                 # Clear session state
                 st.session_state.uploaded_images = []
                 st.session_state.selected_images = []
+                st.session_state.image_analysis = {}
                 # Delete temp files using storage service
                 storage_service.clear_temp_directory()
                 st.success("All images cleared!")
@@ -328,10 +381,19 @@ def upload_section():
 
                     # Display image quality assessment for uploaded images
                     try:
-                        quality_info = ocr_service.assess_image_quality(image_info['path'])
-
-                        # Check orientation
-                        orientation_info = ocr_service.detect_orientation(image_info['path'])
+                        # Reuse the upload-time analysis; document pages are analysed the first
+                        # time they are shown and the result is kept on the collection entry
+                        quality_info = image_info.get('quality_info')
+                        orientation_info = image_info.get('orientation_info')
+                        if quality_info is None or orientation_info is None:
+                            # Decode once for both quality and orientation checks
+                            analysis_context = ImageAnalysisContext(image_info['path'])
+                            if quality_info is None:
+                                quality_info = ocr_service.assess_image_quality(analysis_context)
+                                image_info['quality_info'] = quality_info
+                            if orientation_info is None:
+                                orientation_info = ocr_service.detect_orientation(analysis_context)
+                                image_info['orientation_info'] = orientation_info
 
                         # Display quality grade with color coding
                         grade_color = {
@@ -419,22 +481,69 @@ def debug_section():
     st.header("🔍 Debug Mode - OCR Results")
     st.info("Review the OCR results below. Click 'Continue to AI Processing' for each image you want to process.")
 
+    cache_stats = ocr_service.cache_stats()
+    if cache_stats:
+        st.caption(f"OCR cache: {cache_stats['total_hits']} hits / {cache_stats['total_misses']} misses "
+                   f"({cache_stats['hit_rate']:.0%} hit rate, {cache_stats['entries']} cached results)")
+
+    ai_cache_stats = ai_service.cache_stats()
+    if ai_cache_stats:
+        st.caption(f"AI response cache: {ai_cache_stats['total_hits']} hits / {ai_cache_stats['total_misses']} misses "
+                   f"({ai_cache_stats['hit_rate']:.0%} hit rate, {ai_cache_stats['entries']} cached responses)")
+
+    cpu_allocation = processing_service.cpu_allocation
+    worker_allocation = processing_service.worker_allocation
+    st.caption(f"CPU budget: {cpu_allocation['cores']} cores; in-process OCR {cpu_allocation['ocr_threads']} threads, "
+               f"OpenCV {cpu_allocation['opencv_threads']}, tesseract {cpu_allocation['omp_thread_limit']}, "
+               f"torch {cpu_allocation['torch_threads'] or '-'} threads; batches use {worker_allocation['workers']} "
+               f"OCR workers x {worker_allocation['ocr_threads']} threads, OpenCV {worker_allocation['opencv_threads']} "
+               f"and tesseract {worker_allocation['omp_thread_limit']} threads per worker")
+
+    telemetry_stats = ocr_service.telemetry_stats()
+    if telemetry_stats.get('wins'):
+        top_win = telemetry_stats['wins'][0]
+        skipped_text = f", {telemetry_stats['skipped']} skipped" if telemetry_stats.get('skipped') else ""
+        st.caption(f"OCR telemetry: {telemetry_stats['searches']} searches{skipped_text}, "
+                   f"{telemetry_stats['avg_attempts']:.1f} tesseract calls on average; most frequent winner "
+                   f"{top_win['variant']} {top_win['psm']} ({top_win['share']:.0%})")
+
     for image_name, ocr_data in st.session_state.ocr_results.items():
         display_name = ocr_data.get('original_name', image_name)
         with st.expander(f"📄 {display_name}", expanded=True):
             col1, col2 = st.columns([1, 2])
 
             with col1:
-                # Show image
+                # Show image with low-confidence words outlined
                 try:
                     image = Image.open(ocr_data['image_path'])
+                    low_confidence = None
+                    if ocr_data.get('word_data_path') and os.path.exists(ocr_data['word_data_path']):
+                        low_confidence = WordBoxes.load(ocr_data['word_data_path']).filter(
+                            max_confidence=LOW_CONFIDENCE_THRESHOLD)
+                        if len(low_confidence):
+                            image = image.convert('RGB')
+                            draw = ImageDraw.Draw(image)
+                            line_width = max(2, image.width // 400)
+                            for left, top, width, height in low_confidence.boxes:
+                                draw.rectangle([left, top, left + width, top + height], outline='red', width=line_width)
                     st.image(image, caption=display_name, use_container_width=True)
+                    if low_confidence is not None:
+                        if len(low_confidence):
+                            sample = ', '.join(str(word) for word in low_confidence.text[:10])
+                            st.caption(f"🟥 {len(low_confidence)} words below {LOW_CONFIDENCE_THRESHOLD}% confidence: {sample}")
+                        else:
+                            st.caption(f"All words at least {LOW_CONFIDENCE_THRESHOLD}% confidence")
                 except:
                     st.error("Could not display image")
 
             with col2:
                 # Show OCR result
                 st.subheader("OCR Extracted Text")
+                if ocr_data.get('confidence'):
+                    tier_text = f" | Models: {ocr_data['model_tier']}" if ocr_data.get('model_tier') else ""
+                    if ocr_data.get('escalated'):
+                        tier_text += " (escalated)"
+                    st.caption(f"Average word confidence: {ocr_data['confidence']:.0f}%{tier_text}")
                 extracted_text = ocr_data.get('extracted_text', '')
                 if extracted_text:
                     st.text_area("", extracted_text, height=200, key=f"ocr_text_{image_name}", disabled=False)
@@ -457,6 +566,49 @@ def debug_section():
                         st.session_state.debug_confirmed.add(image_name)
                         st.rerun()
 
+def create_stream_preview(display_name_of):
+    """
+    Create a stream_callback that shows one live preview per image, filled in as its AI response streams in.
+
+    Args:
+        display_name_of: Callable returning the display name of the image at an index
+
+    Returns:
+        Callable receiving (index, progress) from a streamed AI response
+    """
+    previews = {}
+    preview_lengths = {}
+
+    def on_ai_stream(idx, progress):
+        if progress['result'] is not None:
+            if idx in previews:
+                previews.pop(idx).empty()
+            return
+
+        fields = progress['fields']
+        partial = progress['partial']
+        notes = fields.get('notes') or partial.get('notes') or ''
+        summary = fields.get('summary') or partial.get('summary') or ''
+
+        # Redraw only when a field completed or the text grew noticeably
+        length = (len(fields), len(summary) // 80, len(notes) // 80)
+        if preview_lengths.get(idx) == length:
+            return
+        preview_lengths[idx] = length
+
+        if idx not in previews:
+            previews[idx] = st.empty()
+        lines = [f"**✍️ {display_name_of(idx)}**"]
+        if 'subject' in fields:
+            lines.append(f"*{str(fields['subject']).title()} · {str(fields.get('content_type', '')).replace('_', ' ')}*")
+        if summary:
+            lines.append(f"**Summary:** {summary}")
+        if notes:
+            lines.append(notes)
+        previews[idx].markdown("\n\n".join(lines))
+
+    return on_ai_stream
+
 def process_images():
     """Process selected images with OCR and AI."""
     if not st.session_state.uploaded_images:
@@ -494,17 +646,28 @@ def process_images():
                 for image_info in selected_images:
                     try:
                         # Extract text using OCR service
-                        extracted_text = ocr_service.extract_text(image_info['path'])
+                        analysis_context = ImageAnalysisContext(image_info['path'])
+                        ocr_details = ocr_service.extract_text_details(
+                            analysis_context,
+                            quality_info=image_info.get('quality_info'),
+                            orientation_info=image_info.get('orientation_info')
+                        )
 
-                        # Assess image quality
-                        quality_info = ocr_service.assess_image_quality(image_info['path'])
+                        # Assess image quality unless it was already graded on upload
+                        quality_info = image_info.get('quality_info')
+                        if quality_info is None or not quality_info.metrics:
+                            quality_info = ocr_service.assess_image_quality(analysis_context)
 
                         # Store OCR result for debug review
                         st.session_state.ocr_results[image_info['name']] = {
                             'image_path': image_info['path'],
                             'original_name': image_info.get('original_name', image_info['name']),
-                            'extracted_text': extracted_text,
-                            'quality_info': quality_info
+                            'extracted_text': ocr_details['text'],
+                            'quality_info': quality_info,
+                            'confidence': ocr_details['confidence'],
+                            'word_data_path': ocr_details['word_data_path'],
+                            'model_tier': ocr_details['model_tier'],
+                            'escalated': ocr_details['escalated']
                         }
                     except Exception as e:
                         st.error(f"Error extracting text from {image_info.get('original_name', image_info['name'])}: {str(e)}")
@@ -535,46 +698,54 @@ def process_images():
                               if img['name'] in st.session_state.selected_images]
             total_images = len(selected_images)
 
-            for idx, image_info in enumerate(selected_images):
-                # Use original name for display if available, otherwise use the unique name
-                display_name = image_info.get('original_name', image_info['name'])
-                progress = (idx + 1) / total_images
-                progress_bar.progress(progress)
-                status_text.text(f"Processing {display_name} ({idx + 1}/{total_images})")
+            # Create ImageInfo objects, using original names for display when available
+            image_objs = [
+                ImageInfo(
+                    name=image_info['name'],
+                    original_name=image_info.get('original_name', image_info['name']),
+                    path=image_info['path'],
+                    page_number=image_info.get('page_number'),
+                    source_document=image_info.get('source_document'),
+                    content_hash=image_info.get('content_hash'),
+                    quality_info=image_info.get('quality_info'),
+                    orientation_info=image_info.get('orientation_info')
+                )
+                for image_info in selected_images
+            ]
 
-                try:
-                    # Create ImageInfo object
-                    image_obj = ImageInfo(
-                        name=image_info['name'],
-                        original_name=display_name,
-                        path=image_info['path']
-                    )
-
-                    # Process image using the processing service
-                    result_obj = processing_service.process_single_image(image_obj)
-
-                    # Convert result to dictionary for display
-                    result = {
-                        'image_name': image_obj.name,
-                        'original_name': display_name,
-                        'image_path': image_obj.path,
-                        'extracted_text': result_obj.ocr_result.text if result_obj.ocr_result else '',
-                        'classification': {
-                            'subject': result_obj.classification_result.subject if result_obj.classification_result else 'general',
-                            'content_type': result_obj.classification_result.content_type if result_obj.classification_result else 'notes',
-                            'confidence': result_obj.classification_result.confidence if result_obj.classification_result else 0,
-                            'key_concepts': result_obj.classification_result.key_concepts if result_obj.classification_result else [],
-                            'notes': result_obj.classification_result.notes if result_obj.classification_result else '',
-                            'summary': result_obj.classification_result.summary if result_obj.classification_result else '',
-                        },
-                        'merged': False  # TODO: Implement merge detection
-                    }
-                    st.session_state.results.append(result)
+            def on_image_processed(idx, total, result_obj):
+                display_name = result_obj.image_info.original_name
+                progress_bar.progress((idx + 1) / total)
+                status_text.text(f"Processed {display_name} ({idx + 1}/{total})")
 
-                except Exception as e:
-                    st.error(f"❌ Error processing {display_name}: {str(e)}")
+                if not result_obj.success:
+                    st.error(f"❌ Error processing {display_name}: {result_obj.error_message}")
                     # Continue processing other images even if one fails
-                    continue
+                    return
+
+                # Convert result to dictionary for display
+                result = {
+                    'image_name': result_obj.image_info.name,
+                    'original_name': display_name,
+                    'image_path': result_obj.image_info.path,
+                    'extracted_text': result_obj.ocr_result.text if result_obj.ocr_result else '',
+                    'classification': {
+                        'subject': result_obj.classification_result.subject if result_obj.classification_result else 'general',
+                        'content_type': result_obj.classification_result.content_type if result_obj.classification_result else 'notes',
+                        'confidence': result_obj.classification_result.confidence if result_obj.classification_result else 0,
+                        'key_concepts': result_obj.classification_result.key_concepts if result_obj.classification_result else [],
+                        'notes': result_obj.classification_result.notes if result_obj.classification_result else '',
+                        'summary': result_obj.classification_result.summary if result_obj.classification_result else '',
+                    },
+                    'merged': False  # TODO: Implement merge detection
+                }
+                st.session_state.results.append(result)
+
+            # Process images using the processing service (OCR runs in parallel workers)
+            status_text.text(f"Processing {total_images} image(s)...")
+            on_ai_stream = create_stream_preview(lambda idx: image_objs[idx].original_name)
+            processing_service.process_batch(image_objs, progress_callback=on_image_processed,
+                                             stream_callback=on_ai_stream)
 
             progress_bar.progress(1.0)
             success_count = len(st.session_state.results)
@@ -598,6 +769,9 @@ def process_debug_confirmed():
     if not st.session_state.debug_mode or not st.session_state.debug_confirmed:
         return
 
+    bypass_ai_cache = st.checkbox("Ignore cached AI responses", value=False,
+                                  help="Request fresh notes even for text that was processed before; they replace the cached ones")
+
     if st.button("🚀 Process Confirmed Images with AI", type="primary"):
         st.session_state.processing = True
 
@@ -616,27 +790,48 @@ def process_debug_confirmed():
         status_text = st.empty()
         total_images = len(confirmed_images)
 
-        for idx, image_name in enumerate(confirmed_images):
+        # Send all AI requests at once; results come back in the order of confirmed_images
+        pending_images = []
+        for image_name in confirmed_images:
+            ocr_data = st.session_state.ocr_results[image_name]
+            display_name = ocr_data.get('original_name', image_name)
+            if not ocr_data.get('extracted_text', '').strip():
+                st.warning(f"No text found in {display_name}")
+                continue
+            pending_images.append(image_name)
+
+        completed = []
+
+        on_ai_stream = create_stream_preview(
+            lambda idx: st.session_state.ocr_results[pending_images[idx]].get('original_name', pending_images[idx]))
+
+        def on_ai_result(idx, classification_result):
+            completed.append(idx)
+            progress_bar.progress(len(completed) / len(pending_images))
+            display_name = st.session_state.ocr_results[pending_images[idx]].get('original_name', pending_images[idx])
+            status_text.text(f"Processed {display_name} with AI ({len(completed)}/{len(pending_images)})")
+
+        status_text.text(f"Processing {len(pending_images)} image(s) with AI...")
+        try:
+            classification_results = ai_service.process_texts(
+                [(st.session_state.ocr_results[image_name]['extracted_text'],
+                  st.session_state.ocr_results[image_name].get('original_name', image_name))
+                 for image_name in pending_images],
+                progress_callback=on_ai_result,
+                use_cache=not bypass_ai_cache,
+                stream_callback=on_ai_stream
+            )
+        except Exception as e:
+            st.error(f"❌ Error processing images with AI: {str(e)}")
+            classification_results = []
+
+        for image_name, classification_result in zip(pending_images, classification_results):
             ocr_data = st.session_state.ocr_results[image_name]
             display_name = ocr_data.get('original_name', image_name)
-
-            progress = (idx + 1) / total_images
-            progress_bar.progress(progress)
-            status_text.text(f"Processing {display_name} with AI ({idx + 1}/{total_images})")
 
             try:
                 extracted_text = ocr_data.get('extracted_text', '')
 
-                if not extracted_text.strip():
-                    st.warning(f"No text found in {display_name}")
-                    continue
-
-                # Generate notes using AI service
-                classification_result = ai_service.process_text(
-                    extracted_text,
-                    display_name
-                )
-
                 # Create ImageInfo object for saving
                 image_obj = ImageInfo(
                     name=image_name,